@@ -1,7 +1,9 @@
 from __future__ import absolute_import, unicode_literals, print_function
 
 import os.path
+import struct
 import requests
+from requests.adapters import HTTPAdapter
 
 import thriftrw
 
@@ -9,13 +11,38 @@ ping = thriftrw.load(
     os.path.join(os.path.dirname(__file__), 'ping.thrift'),
 )
 
+# Reuse keep-alive connections across calls so that each request doesn't pay
+# for a new TCP handshake.
+session = requests.Session()
+session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=16))
 
-def main():
-    req = ping.Ping.ping.request('world')
+# Only the seqid and the name argument vary between ping requests, so the
+# rest of the envelope is sliced out of a template encoded once up front:
+#
+#     name_len:4 name:4 type:1 | seqid:4 | ttype:1 id:2 | len:4 str | stop:1
+_TEMPLATE = ping.dumps.message(ping.Ping.ping.request(''), seqid=0)
+_ENVELOPE = _TEMPLATE[:9]
+_NAME_FIELD = _TEMPLATE[13:16]
+_STOP = _TEMPLATE[-1:]
+
+_I32 = struct.Struct('>i')
+
+
+def encode_ping(name, seqid):
+    """Encodes a ping request exactly like ``ping.dumps.message`` would."""
+    name = name.encode('utf-8')
+    return b''.join([
+        _ENVELOPE, _I32.pack(seqid),
+        _NAME_FIELD, _I32.pack(len(name)), name,
+        _STOP,
+    ])
 
-    response = requests.post(
+
+def main():
+    response = session.post(
         'http://127.0.0.1:8888/thrift',
-        data=ping.dumps.message(req, seqid=42),
+        data=encode_ping('world', seqid=42),
+        headers={'Content-Type': 'application/x-thrift'},
     )
     reply = ping.loads.message(ping.Ping, response.content)
     assert reply.name == 'ping'
@@ -24,5 +51,6 @@ def main():
     resp = reply.body
     print(resp)
 
+
 if __name__ == "__main__":
     main()
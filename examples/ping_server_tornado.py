@@ -20,10 +20,10 @@ class ThriftRequestHandler(web.RequestHandler):
         assert self.request.body
 
         message = ping.loads.message(ping.Ping, self.request.body)
-        method, handler = self._METHODS[message.name]
+        response_cls, handler = self._DISPATCH[message.name]
 
         args = message.body
-        resp = method.response(success=handler(self, args))
+        resp = response_cls(success=handler(self, args))
 
         reply = ping.dumps.message(resp, seqid=message.seqid)
         self.write(reply)
@@ -32,13 +32,19 @@ class ThriftRequestHandler(web.RequestHandler):
         print('Hello, %s' % args.name)
         return ping.Pong(time.time())
 
-    _METHODS = {'ping': (ping.Ping.ping, handle_ping)}
+    # Message names are bytes. Map them straight to the response class and
+    # handler so that dispatching a request is a single lookup.
+    _DISPATCH = {b'ping': (ping.Ping.ping.response, handle_ping)}
 
 
 if __name__ == "__main__":
     app = web.Application([
         (r'/thrift', ThriftRequestHandler),
     ])
-    HTTPServer(app).listen(8888)
+    server = HTTPServer(app)
+    # Bind once in the parent and fork one process per CPU. Each child runs
+    # its own IOLoop and the kernel spreads connections across them.
+    server.bind(8888, reuse_port=True)
     print('Listening on http://127.0.0.1:8888/thrift')
+    server.start(0)
     IOLoop.current().start()
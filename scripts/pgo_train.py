@@ -0,0 +1,101 @@
+# Copyright (c) 2016 Uber Technologies, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Training workload for profile-guided builds.
+
+This exercises the serialization hot paths so that the profile collected by
+``THRIFTRW_PGO=generate`` builds reflects real usage. See ``make pgo``.
+"""
+from __future__ import absolute_import, unicode_literals, print_function
+
+import os.path
+
+import thriftrw
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ping = thriftrw.load(os.path.join(ROOT, 'examples', 'ping.thrift'))
+
+module = thriftrw.loader.Loader().loads('pgo_train', '''
+    struct PrimitiveContainers {
+        1: required list<string> strings;
+        2: required set<i32> ints;
+        3: required map<i32, string> mapped;
+        4: optional list<binary> blobs;
+    }
+
+    struct Point {
+        1: required double x;
+        2: required double y;
+        3: optional i64 timestamp;
+        4: optional i16 flags;
+        5: optional byte kind;
+        6: optional bool visible;
+    }
+
+    struct Edge {
+        1: required Point start;
+        2: required Point end;
+    }
+
+    struct Graph { 1: required list<Edge> edges }
+''')
+
+
+def train_messages(iterations):
+    for seqid in range(iterations):
+        req = ping.Ping.ping.request('world')
+        payload = ping.dumps.message(req, seqid=seqid)
+        message = ping.loads.message(ping.Ping, payload)
+
+        resp = ping.Ping.ping.response(success=ping.Pong(1.5))
+        payload = ping.dumps.message(resp, seqid=message.seqid)
+        ping.loads.message(ping.Ping, payload)
+
+
+def train_values(iterations):
+    values = [
+        module.PrimitiveContainers(
+            strings=['foo'] * 1000,
+            ints=set(range(1000)),
+            mapped={n: 'bar' for n in range(1000)},
+            blobs=[b'\x00\x01\x02'] * 100,
+        ),
+        module.Graph(edges=[
+            module.Edge(
+                start=module.Point(1.23, 4.56, 42, 1, 2, True),
+                end=module.Point(1.23, 4.56),
+            ) for _ in range(1000)
+        ]),
+    ]
+    for _ in range(iterations):
+        for value in values:
+            payload = module.dumps(value)
+            module.loads(value.__class__, payload)
+            value.type_spec.from_primitive(value.to_primitive())
+
+
+def main():
+    train_messages(100000)
+    train_values(100)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,213 @@
+# Copyright (c) 2016 Uber Technologies, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from __future__ import absolute_import, unicode_literals, print_function
+
+import sys
+import json
+import threading
+
+import pytest
+
+from thriftrw.compile import Compiler
+from thriftrw.compile import compiler as compiler_module
+from thriftrw.compile.cache import MemoryCache
+from thriftrw.compile.cache import ProgramCache
+from thriftrw.compile.cache import default_cache_dir
+from thriftrw.idl import Parser
+from thriftrw.protocol import BinaryProtocol
+
+
+DOCUMENT = '''
+    struct Foo {
+        1: required string bar
+    }
+'''
+
+
+def test_cache_miss(tmpdir):
+    cache = ProgramCache(str(tmpdir.join('cache')))
+    assert cache.get(DOCUMENT) is None
+
+
+def test_cache_round_trip(tmpdir):
+    cache = ProgramCache(str(tmpdir.join('cache')))
+    program = Parser().parse(DOCUMENT)
+
+    cache.put(DOCUMENT, program)
+    assert cache.get(DOCUMENT) == program
+    assert cache.get(DOCUMENT + '\n') is None
+
+
+def test_cache_entries_are_json(tmpdir):
+    program = Parser().parse('''
+        const map<string, list<i32>> values = {"a": [1, 2], "b": []}
+        service Service { oneway void ping(1: binary data) (foo = "bar") }
+    ''')
+    cache = ProgramCache(str(tmpdir))
+    cache.put(DOCUMENT, program)
+
+    entry, = tmpdir.listdir()
+    assert entry.ext == '.json'
+    json.loads(entry.read())
+
+    assert ProgramCache(str(tmpdir)).get(DOCUMENT) == program
+
+
+@pytest.mark.parametrize('contents', [
+    b'garbage',
+    b'{"node": ["os.system", ["true"]]}',
+    b'{"unknown": []}',
+])
+def test_corrupt_entry_is_a_miss(tmpdir, contents):
+    cache = ProgramCache(str(tmpdir))
+    cache.put(DOCUMENT, Parser().parse(DOCUMENT))
+
+    for entry in tmpdir.listdir():
+        entry.write(contents, mode='wb')
+
+    assert cache.get(DOCUMENT) is None
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(2)
+    documents = [DOCUMENT + '\n' * i for i in range(3)]
+    programs = [Parser().parse(document) for document in documents]
+
+    cache.put(documents[0], programs[0])
+    cache.put(documents[1], programs[1])
+    assert cache.get(documents[0]) is programs[0]
+
+    cache.put(documents[2], programs[2])
+    assert len(cache) == 2
+    assert cache.get(documents[0]) is programs[0]
+    assert cache.get(documents[1]) is None
+    assert cache.get(documents[2]) is programs[2]
+
+
+def test_memory_cache_is_thread_safe():
+    cache = MemoryCache(1)
+    documents = [DOCUMENT + '\n' * i for i in range(2)]
+    program = Parser().parse(DOCUMENT)
+    errors = []
+
+    def worker(document):
+        try:
+            for _ in range(10000):
+                cache.put(document, program)
+                cache.get(documents[0])
+                cache.get(documents[1])
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [
+        threading.Thread(target=worker, args=(document,))
+        for document in documents * 2
+    ]
+
+    # Switch threads as often as possible to provoke races.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert errors == []
+    assert len(cache) == 1
+
+
+def test_unwritable_cache_is_ignored(tmpdir):
+    tmpdir.join('cache').write('not a directory')
+    cache = ProgramCache(str(tmpdir.join('cache')))
+
+    cache.put(DOCUMENT, Parser().parse(DOCUMENT))
+    assert cache.get(DOCUMENT) is None
+
+
+@pytest.mark.parametrize('env, expected', [
+    ({}, None),
+    ({'THRIFTRW_CACHE_DIR': ''}, None),
+    ({'THRIFTRW_CACHE_DIR': '/cache'}, '/cache'),
+])
+def test_default_cache_dir(monkeypatch, env, expected):
+    monkeypatch.delenv('THRIFTRW_CACHE_DIR', raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    assert default_cache_dir() == expected
+
+
+def test_compiler_uses_cache(tmpdir, monkeypatch):
+    monkeypatch.setattr(compiler_module, '_PROGRAMS', MemoryCache(16))
+    path = str(tmpdir.join('foo.thrift'))
+    cache_dir = str(tmpdir.join('cache'))
+
+    compiler = Compiler(BinaryProtocol(), cache_dir=cache_dir)
+    module = compiler.compile('foo', DOCUMENT, path).link().surface
+    assert module.Foo('x').bar == 'x'
+    assert len(tmpdir.join('cache').listdir()) == 1
+
+    # A different compiler with the same cache must not need to parse, even
+    # in a different process.
+    compiler_module._PROGRAMS.clear()
+    compiler = Compiler(BinaryProtocol(), cache_dir=cache_dir)
+    compiler.parser = None
+    module = compiler.compile('foo', DOCUMENT, path).link().surface
+    assert module.Foo('x').bar == 'x'
+
+
+def test_compiler_caches_in_memory(tmpdir, monkeypatch):
+    monkeypatch.setattr(compiler_module, '_PROGRAMS', MemoryCache(16))
+    path = str(tmpdir.join('foo.thrift'))
+
+    Compiler(BinaryProtocol(), cache=True).compile('foo', DOCUMENT, path)
+
+    compiler = Compiler(BinaryProtocol(), cache=True)
+    compiler.parser = None
+    module = compiler.compile('foo', DOCUMENT, path).link().surface
+    assert module.Foo('x').bar == 'x'
+
+    # Inline documents and compilers with caching disabled always parse.
+    for compiler, path in [
+        (Compiler(BinaryProtocol(), cache=True), None),
+        (Compiler(BinaryProtocol(), cache=False), path),
+        (Compiler(BinaryProtocol()), path),
+    ]:
+        compiler.parser = None
+        with pytest.raises(AttributeError):
+            compiler.compile('foo', DOCUMENT, path)
+
+
+@pytest.mark.parametrize('kwargs, env, expected', [
+    ({}, {}, False),
+    ({'include_as': True}, {}, True),
+    ({'include_as': True, 'cache': False}, {}, False),
+    ({'cache_dir': '/cache'}, {}, True),
+    ({}, {'THRIFTRW_CACHE_DIR': '/cache'}, True),
+])
+def test_compiler_cache_default(monkeypatch, kwargs, env, expected):
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    assert Compiler(BinaryProtocol(), **kwargs).cache is expected
@@ -33,7 +33,7 @@ def test_unknown_type(loads):
             struct Bar { 1: optional Baz baz }
         ''')
 
-    assert 'Unknown type "Baz"' in str(exc_info)
+    assert 'Unknown type "Baz"' in str(exc_info.value)
 
 
 def test_duplicate_type_names(loads):
@@ -44,8 +44,8 @@ def test_duplicate_type_names(loads):
             struct foo { 1: required string bar }
         ''')
 
-    assert 'Cannot define type "foo"' in str(exc_info)
-    assert 'type with that name already exists' in str(exc_info)
+    assert 'Cannot define type "foo"' in str(exc_info.value)
+    assert 'type with that name already exists' in str(exc_info.value)
 
 
 def test_constant_type_conflict(loads):
@@ -56,8 +56,8 @@ def test_constant_type_conflict(loads):
             struct foo { 1: required string bar }
         ''')
 
-    assert 'Cannot define "foo"' in str(exc_info)
-    assert 'name has already been used' in str(exc_info)
+    assert 'Cannot define "foo"' in str(exc_info.value)
+    assert 'name has already been used' in str(exc_info.value)
 
 
 def test_service_type_conflict(loads):
@@ -67,8 +67,8 @@ def test_service_type_conflict(loads):
             service foo {}
         ''')
 
-    assert 'Cannot define "foo"' in str(exc_info)
-    assert 'name has already been used' in str(exc_info)
+    assert 'Cannot define "foo"' in str(exc_info.value)
+    assert 'name has already been used' in str(exc_info.value)
 
 
 def test_services_and_types(loads):
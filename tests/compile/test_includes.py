@@ -28,19 +28,79 @@ from thriftrw.protocol import BinaryProtocol
 from thriftrw.errors import ThriftCompilerError
 
 
-@pytest.fixture
-def loader():
+ITEM_BYTES = (
+    # 1: 'foo'
+    b'\x0b'
+    b'\x00\x01'
+    b'\x00\x00\x00\x03'
+    b'foo'
+
+    # 2: 'bar'
+    b'\x0b'
+    b'\x00\x02'
+    b'\x00\x00\x00\x03'
+    b'bar'
+
+    b'\x00'
+)
+
+BATCH_GET_RESPONSE_BYTES = (
+    # 1: [item]
+    b'\x0f'
+    b'\x00\x01'
+
+    # item
+    b'\x0c'
+    b'\x00\x00\x00\x01'
+) + ITEM_BYTES + b'\x00'
+
+NODE_BYTES = (
+    # 1: 'hello'
+    b'\x0b'
+    b'\x00\x01'
+    b'\x00\x00\x00\x05'
+    b'hello'
+
+    # 2: {1: []}
+    b'\x0c'
+    b'\x00\x02'
+
+    # 1: []
+    b'\x0f'
+    b'\x00\x01'
+
+    # []
+    b'\x0c'
+    b'\x00\x00\x00\x00'
+
+    b'\x00'
+
+    b'\x00'
+)
+
+# 0: True
+HEALTHY_RESPONSE_BYTES = b'\x02\x00\x00\x01\x00'
+
+
+@pytest.fixture(scope='module')
+def shared_loader():
     return Loader(BinaryProtocol(), include_as=True)
 
 
-def test_simple_include(tmpdir, loader):
+@pytest.fixture
+def loader(shared_loader):
+    yield shared_loader
+    # Forget modules compiled by this test; parsed programs stay cached.
+    shared_loader.compiler._module_specs.clear()
+
+
+def test_simple_include(tmpdir, loader, thrift_files):
     types_source = '''
         struct Item {
             1: required string key
             2: required string value
         }
     '''
-    tmpdir.join('types.thrift').write(types_source)
 
     svc_source = '''
         include "./types.thrift"
@@ -53,7 +113,11 @@ def test_simple_include(tmpdir, loader):
             BatchGetResponse batchGetItems(1: list<string> keys)
         }
     '''
-    tmpdir.join('svc.thrift').write(svc_source)
+
+    thrift_files({
+        'types.thrift': types_source,
+        'svc.thrift': svc_source,
+    })
 
     svc = loader.load(str(tmpdir.join('svc.thrift')))
 
@@ -67,64 +131,28 @@ def test_simple_include(tmpdir, loader):
     item = svc.types.Item(key='foo', value='bar')
     response = svc.BatchGetResponse([item])
 
-    assert svc.types.dumps(item) == bytes(bytearray([
-        # 1: 'foo'
-        0x0B,
-        0x00, 0x01,
-        0x00, 0x00, 0x00, 0x03,
-        0x66, 0x6f, 0x6f,
-
-        # 2: 'bar'
-        0x0B,
-        0x00, 0x02,
-        0x00, 0x00, 0x00, 0x03,
-        0x62, 0x61, 0x72,
-
-        0x00,
-    ]))
-
-    svc.dumps(response) == bytes(bytearray([
-        # 1: [item]
-        0x0F,
-        0x00, 0x01,
-
-        # item
-        0x0C,
-        0x00, 0x00, 0x00, 0x01,
-
-        # 1: 'foo'
-        0x0B,
-        0x00, 0x01,
-        0x00, 0x00, 0x00, 0x03,
-        0x66, 0x6f, 0x6f,
-
-        # 2: 'bar'
-        0x0B,
-        0x00, 0x01,
-        0x00, 0x00, 0x00, 0x03,
-        0x62, 0x61, 0x72,
-
-        0x00,
-    ]))
-
-
-def test_include_relative(tmpdir, loader):
-    tmpdir.join('types/shared.thrift').ensure().write('''
-        typedef i64 Timestamp
-
-        exception InternalError {
-            1: required string message
-        }
-    ''')
+    assert svc.types.dumps(item) == ITEM_BYTES
+    assert svc.dumps(response) == BATCH_GET_RESPONSE_BYTES
 
-    tmpdir.join('team/myservice/myservice.thrift').ensure().write('''
-        include t "../../types/shared.thrift"
 
-        service Service {
-            t.Timestamp getCurrentTime()
-                throws (1: t.InternalError internalError)
-        }
-    ''')
+def test_include_relative(tmpdir, loader, thrift_files):
+    thrift_files({
+        'types/shared.thrift': '''
+            typedef i64 Timestamp
+
+            exception InternalError {
+                1: required string message
+            }
+        ''',
+        'team/myservice/myservice.thrift': '''
+            include t "../../types/shared.thrift"
+
+            service Service {
+                t.Timestamp getCurrentTime()
+                    throws (1: t.InternalError internalError)
+            }
+        ''',
+    })
 
     myservice = loader.load(
         str(tmpdir.join('team/myservice/myservice.thrift'))
@@ -144,33 +172,34 @@ def test_include_relative(tmpdir, loader):
         myservice.Service.getCurrentTime.response(
             success='2015-10-29T15:00:00Z'
         )
-    assert 'Cannot serialize' in str(exc_info)
+    assert 'Cannot serialize' in str(exc_info.value)
 
     with pytest.raises(TypeError) as exc_info:
         myservice.Service.getCurrentTime.response(
             internalError=ZeroDivisionError()
         )
 
-    assert 'Cannot serialize' in str(exc_info)
+    assert 'Cannot serialize' in str(exc_info.value)
 
 
-def test_cyclic_includes(tmpdir, loader):
-    tmpdir.join('node.thrift').write('''
-        include "./value.thrift"
+def test_cyclic_includes(tmpdir, loader, thrift_files):
+    thrift_files({
+        'node.thrift': '''
+            include "./value.thrift"
 
-        struct Node {
-            1: required string name
-            2: required value.Value value
-        }
-    ''')
-
-    tmpdir.join('value.thrift').write('''
-        include "./node.thrift"
+            struct Node {
+                1: required string name
+                2: required value.Value value
+            }
+        ''',
+        'value.thrift': '''
+            include "./node.thrift"
 
-        struct Value {
-            1: required list<node.Node> nodes
-        }
-    ''')
+            struct Value {
+                1: required list<node.Node> nodes
+            }
+        ''',
+    })
 
     node = loader.load(str(tmpdir.join('node.thrift')))
 
@@ -178,50 +207,27 @@ def test_cyclic_includes(tmpdir, loader):
     assert node.value.__includes__ == (node,)
 
     assert (
-        node.dumps(node.Node('hello', node.value.Value([]))) ==
-        bytes(bytearray([
-
-            # 1: 'hello'
-            0x0B,
-            0x00, 0x01,
-            0x00, 0x00, 0x00, 0x05,
-            0x68, 0x65, 0x6c, 0x6c, 0x6f,   # 'hello'
-
-            # 2: {1: []}
-            0x0C,
-            0x00, 0x02,
-
-            # 1: []
-            0x0F,
-            0x00, 0x01,
-
-            # []
-            0x0C,
-            0x00, 0x00, 0x00, 0x00,
-
-            0x00,
-
-            0x00,
-        ]))
+        node.dumps(node.Node('hello', node.value.Value([]))) == NODE_BYTES
     )
 
 
-def test_inherit_included_service(tmpdir, loader):
-    tmpdir.join('common.thrift').write('''
-        service BaseService {
-            string serviceName()
-            bool healthy()
-        }
-    ''')
-
-    tmpdir.join('keyvalue.thrift').write('''
-        include "./common.thrift"
-
-        service KeyValue extends common.BaseService {
-            binary get(1: binary key)
-            void put(1: binary key, 2: binary value)
-        }
-    ''')
+def test_inherit_included_service(tmpdir, loader, thrift_files):
+    thrift_files({
+        'common.thrift': '''
+            service BaseService {
+                string serviceName()
+                bool healthy()
+            }
+        ''',
+        'keyvalue.thrift': '''
+            include "./common.thrift"
+
+            service KeyValue extends common.BaseService {
+                binary get(1: binary key)
+                void put(1: binary key, 2: binary value)
+            }
+        ''',
+    })
 
     keyvalue = loader.load(str(tmpdir.join('keyvalue.thrift')))
 
@@ -231,44 +237,46 @@ def test_inherit_included_service(tmpdir, loader):
 
     assert (
         keyvalue.dumps(keyvalue.KeyValue.healthy.response(success=True)) ==
-        bytes(bytearray([0x02, 0x00, 0x00, 0x01, 0x00]))
+        HEALTHY_RESPONSE_BYTES
     )
 
 
-def test_include_constants(tmpdir, loader):
-    tmpdir.join('bar.thrift').write('const i32 some_num = 42')
-
-    tmpdir.join('foo.thrift').write('''
-        include "./bar.thrift"
+def test_include_constants(tmpdir, loader, thrift_files):
+    thrift_files({
+        'bar.thrift': 'const i32 some_num = 42',
+        'foo.thrift': '''
+            include "./bar.thrift"
 
-        const list<i32> nums = [1, bar.some_num, 2];
-    ''')
+            const list<i32> nums = [1, bar.some_num, 2];
+        ''',
+    })
 
     foo = loader.load(str(tmpdir.join('foo.thrift')))
     assert foo.nums == [1, 42, 2] == [1, foo.bar.some_num, 2]
 
 
-def test_include_enums(tmpdir, loader):
-    tmpdir.join('foo.thrift').write('''
-        enum Role {
-            DISABLED = 0,
-            USER = 1,
-            MOD = 2,
-            ADMIN = 3,
-        }
-    ''')
-
-    tmpdir.join('bar.thrift').write('''
-        include "./foo.thrift"
+def test_include_enums(tmpdir, loader, thrift_files):
+    thrift_files({
+        'foo.thrift': '''
+            enum Role {
+                DISABLED = 0,
+                USER = 1,
+                MOD = 2,
+                ADMIN = 3,
+            }
+        ''',
+        'bar.thrift': '''
+            include "./foo.thrift"
 
-        const foo.Role DEFAULT_ROLE = foo.Role.USER
-    ''')
+            const foo.Role DEFAULT_ROLE = foo.Role.USER
+        ''',
+    })
 
     bar = loader.load(str(tmpdir.join('bar.thrift')))
     assert bar.DEFAULT_ROLE == bar.foo.Role.USER == 1
 
 
-def test_multi_level_cyclic_import(tmpdir, loader):
+def test_multi_level_cyclic_import(tmpdir, loader, thrift_files):
 
     # |- a.thrift
     # |- one/
@@ -277,22 +285,15 @@ def test_multi_level_cyclic_import(tmpdir, loader):
     #     |- two/
     #         |- d.thrift
 
-    tmpdir.join('a.thrift').write('''
-        include "./one/b.thrift"
-        include "./one/c.thrift"
-    ''')
-
-    tmpdir.join('one/b.thrift').ensure().write('''
-        include "./two/d.thrift"
-    ''')
-
-    tmpdir.join('one/c.thrift').ensure().write('''
-        include "./two/d.thrift"
-    ''')
-
-    tmpdir.join('one/two/d.thrift').ensure().write('''
-        include "../../a.thrift"
-    ''')
+    thrift_files({
+        'a.thrift': '''
+            include "./one/b.thrift"
+            include "./one/c.thrift"
+        ''',
+        'one/b.thrift': 'include "./two/d.thrift"',
+        'one/c.thrift': 'include "./two/d.thrift"',
+        'one/two/d.thrift': 'include "../../a.thrift"',
+    })
 
     a = loader.load(str(tmpdir.join('a.thrift')))
     assert (
@@ -311,11 +312,13 @@ def test_multi_level_cyclic_import(tmpdir, loader):
     assert a.c.d.__includes__ == (a,)
 
 
-def test_include_as_nested_cyclic_same_name(tmpdir, loader):
-    tmpdir.join('a.thrift').write('include t "./b.thrift"')
-    tmpdir.join('b.thrift').write('include t "./c.thrift"')
-    tmpdir.join('c.thrift').write('include t "./d.thrift"')
-    tmpdir.join('d.thrift').write('include t "./a.thrift"')
+def test_include_as_nested_cyclic_same_name(tmpdir, loader, thrift_files):
+    thrift_files({
+        'a.thrift': 'include t "./b.thrift"',
+        'b.thrift': 'include t "./c.thrift"',
+        'c.thrift': 'include t "./d.thrift"',
+        'd.thrift': 'include t "./a.thrift"',
+    })
 
     a = loader.load(str(tmpdir.join('a.thrift')))
     assert a.t is loader.load(str(tmpdir.join('b.thrift')))
@@ -329,16 +332,49 @@ def test_include_as_nested_cyclic_same_name(tmpdir, loader):
     assert a.t.t.t.__thrift_source__ == 'include t "./a.thrift"'
 
 
-def test_include_as_disabled(tmpdir):
+def test_include_through_symlink_shares_module(tmpdir, loader, thrift_files):
+    thrift_files({
+        'types.thrift': 'typedef string UUID',
+        'a.thrift': 'include "./types.thrift"',
+        'b.thrift': 'include types "./linked"',
+    })
+    tmpdir.join('linked').mksymlinkto(tmpdir.join('types.thrift'))
+
+    a = loader.load(str(tmpdir.join('a.thrift')))
+    b = loader.load(str(tmpdir.join('b.thrift')))
+    assert a.types is b.types
+
+
+def test_symlinked_file_includes_relative_to_link(
+    tmpdir, loader, thrift_files
+):
+    thrift_files({
+        'shared/svc.thrift': (
+            'include "./types.thrift"\n'
+            'struct Request { 1: required types.UUID id }'
+        ),
+        'app/types.thrift': 'typedef string UUID',
+    })
+    tmpdir.join('app', 'svc.thrift').mksymlinkto(
+        tmpdir.join('shared', 'svc.thrift')
+    )
+
+    svc = loader.load(str(tmpdir.join('app', 'svc.thrift')))
+    assert svc.Request('x').id == 'x'
+
+
+def test_include_as_disabled(tmpdir, thrift_files):
     loader = Loader()
-    tmpdir.join('a.thrift').write('include t "./b.thrift"')
-    tmpdir.join('b.thrift').write('typedef string UUID')
+    thrift_files({
+        'a.thrift': 'include t "./b.thrift"',
+        'b.thrift': 'typedef string UUID',
+    })
 
     with pytest.raises(ThriftCompilerError) as exc_info:
         loader.load(str(tmpdir.join('a.thrift')))
 
-    assert 'Cannot include "b" as "t"' in str(exc_info)
-    assert '"include-as" syntax is currently disabled' in str(exc_info)
+    assert 'Cannot include "b" as "t"' in str(exc_info.value)
+    assert '"include-as" syntax is currently disabled' in str(exc_info.value)
 
 
 @pytest.mark.parametrize('root, data, msgs', [
@@ -454,15 +490,15 @@ def test_include_as_disabled(tmpdir):
         ]
     ),
 ])
-def test_bad_includes(tmpdir, loader, root, data, msgs):
-    for path, contents in data:
-        tmpdir.join(path).ensure().write(contents)
+def test_bad_includes(tmpdir, loader, thrift_files, root, data, msgs):
+    thrift_files(dict(data))
 
     with pytest.raises(ThriftCompilerError) as exc_info:
         loader.load(str(tmpdir.join(root)))
 
+    message = str(exc_info.value)
     for msg in msgs:
-        assert msg in str(exc_info)
+        assert msg in message
 
 
 def test_include_disallowed_with_loads(loads):
@@ -475,5 +511,6 @@ def test_include_disallowed_with_loads(loads):
         ''')
 
     assert (
-        'Includes are not supported when using the "loads()"' in str(exc_info)
+        'Includes are not supported when using the "loads()"' in
+        str(exc_info.value)
     )
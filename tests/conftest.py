@@ -21,6 +21,7 @@
 from __future__ import absolute_import, unicode_literals, print_function
 
 from functools import partial
+import os
 import sys
 
 import pytest
@@ -30,6 +31,9 @@ from thriftrw.protocol import BinaryProtocol
 
 
 def pytest_configure(config):
+    # Don't litter the user's cache directory with test IDLs.
+    os.environ.pop('THRIFTRW_CACHE_DIR', None)
+
     config.addinivalue_line(
         "markers", "unimport: unimport module for test"
     )
@@ -50,15 +54,10 @@ def unimport(*names):
         List of modules to be removed. The given modules and all their parents
         will be removed.
     """
-    modules = set()
     for name in names:
-        parts = name.split('.')
-        while parts:
-            modules.add('.'.join(parts))
-            parts = parts[:-1]
-
-    for module in modules:
-        sys.modules.pop(module, None)
+        while name:
+            sys.modules.pop(name, None)
+            name = name.rpartition('.')[0]
 
 
 def pytest_runtest_teardown(item, nextitem):
@@ -81,3 +80,34 @@ def pytest_runtest_teardown(item, nextitem):
 @pytest.fixture
 def loads(request):
     return partial(Loader(BinaryProtocol()).loads, request.node.name)
+
+
+@pytest.fixture
+def thrift_files(tmpdir):
+    """Returns a function that writes files into ``tmpdir``.
+
+    The function accepts a dictionary mapping paths relative to ``tmpdir`` to
+    their contents. Parent directories are created as needed.
+
+    .. code-block:: python
+
+        def test_something(thrift_files):
+            thrift_files({
+                'a.thrift': 'include "./b/b.thrift"',
+                'b/b.thrift': 'typedef string UUID',
+            })
+    """
+    root = str(tmpdir)
+    dirs = set()
+
+    def write(files):
+        for relpath, contents in files.items():
+            path = os.path.join(root, relpath)
+            parent = os.path.dirname(path)
+            if parent not in dirs:
+                os.makedirs(parent, exist_ok=True)
+                dirs.add(parent)
+            with open(path, 'w') as f:
+                f.write(contents)
+
+    return write
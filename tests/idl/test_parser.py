@@ -21,8 +21,10 @@
 from __future__ import absolute_import, unicode_literals, print_function
 
 import pytest
+from ply import yacc
 
 from thriftrw.idl import ast
+from thriftrw.idl import parsetab
 from thriftrw.idl.parser import Parser
 from thriftrw.errors import ThriftParserError
 
@@ -39,6 +41,27 @@ def test_parse_errors(s):
         Parser().parse(s)
 
 
+def test_parsetab_is_up_to_date():
+    # If this fails, the grammar changed. Run ``make parsetab``.
+    parser = Parser()
+    pdict = dict((k, getattr(parser, k)) for k in dir(parser))
+    reflect = yacc.ParserReflect(pdict)
+    reflect.get_all()
+    assert parsetab._lr_signature == reflect.signature()
+
+
+def test_parsers_share_tables():
+    first = Parser(start='struct', silent=True)
+    second = Parser(start='struct', silent=True)
+    assert first._parser is second._parser
+    assert first._lexer is not second._lexer
+
+    assert Parser(start='union', silent=True)._parser is not first._parser
+    assert Parser(start='struct', debug=False)._parser is not first._parser
+
+    assert first.parse('struct Foo {}') == second.parse('struct Foo {}')
+
+
 @pytest.mark.parametrize('start, expected, s', [
     # type annotations
     ('annotations', [], ''),
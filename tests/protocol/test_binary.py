@@ -53,170 +53,173 @@ from ..util.spec import (
 
 
 def reader_writer_ids(x):
-    if isinstance(x, (list, value.Value)):
-        return None
-    if isinstance(x, TypeSpec):
+    if isinstance(x, (bytes, value.Value, TypeSpec)):
         return None
     return ttype.name_of(x)
 
 
+@pytest.fixture(scope='module')
+def protocol():
+    return BinaryProtocol()
+
+
 @pytest.mark.parametrize('typ, bs, spec, value', [
     # bool
-    (ttype.BOOL, [0x01], sbool, vbool(True)),
-    (ttype.BOOL, [0x00], sbool, vbool(False)),
+    (ttype.BOOL, b'\x01', sbool, vbool(True)),
+    (ttype.BOOL, b'\x00', sbool, vbool(False)),
 
     # byte
-    (ttype.BYTE, [0x00], sbyte, vbyte(0)),
-    (ttype.BYTE, [0x01], sbyte, vbyte(1)),
-    (ttype.BYTE, [0xff], sbyte, vbyte(-1)),
-    (ttype.BYTE, [0x7f], sbyte, vbyte(127)),
-    (ttype.BYTE, [0x80], sbyte, vbyte(-128)),
+    (ttype.BYTE, b'\x00', sbyte, vbyte(0)),
+    (ttype.BYTE, b'\x01', sbyte, vbyte(1)),
+    (ttype.BYTE, b'\xff', sbyte, vbyte(-1)),
+    (ttype.BYTE, b'\x7f', sbyte, vbyte(127)),
+    (ttype.BYTE, b'\x80', sbyte, vbyte(-128)),
 
     # i16
-    (ttype.I16, [0x00, 0x01], si16, vi16(1)),
-    (ttype.I16, [0x00, 0xff], si16, vi16(255)),
-    (ttype.I16, [0x01, 0x00], si16, vi16(256)),
-    (ttype.I16, [0x01, 0x01], si16, vi16(257)),
-    (ttype.I16, [0x7f, 0xff], si16, vi16(32767)),
-    (ttype.I16, [0xff, 0xff], si16, vi16(-1)),
-    (ttype.I16, [0xff, 0xfe], si16, vi16(-2)),
-    (ttype.I16, [0xff, 0x00], si16, vi16(-256)),
-    (ttype.I16, [0xff, 0x01], si16, vi16(-255)),
-    (ttype.I16, [0x80, 0x00], si16, vi16(-32768)),
+    (ttype.I16, b'\x00\x01', si16, vi16(1)),
+    (ttype.I16, b'\x00\xff', si16, vi16(255)),
+    (ttype.I16, b'\x01\x00', si16, vi16(256)),
+    (ttype.I16, b'\x01\x01', si16, vi16(257)),
+    (ttype.I16, b'\x7f\xff', si16, vi16(32767)),
+    (ttype.I16, b'\xff\xff', si16, vi16(-1)),
+    (ttype.I16, b'\xff\xfe', si16, vi16(-2)),
+    (ttype.I16, b'\xff\x00', si16, vi16(-256)),
+    (ttype.I16, b'\xff\x01', si16, vi16(-255)),
+    (ttype.I16, b'\x80\x00', si16, vi16(-32768)),
 
     # i32
-    (ttype.I32, [0x00, 0x00, 0x00, 0x01], si32, vi32(1)),
-    (ttype.I32, [0x00, 0x00, 0x00, 0xff], si32, vi32(255)),
-    (ttype.I32, [0x00, 0x00, 0xff, 0xff], si32, vi32(65535)),
-    (ttype.I32, [0x00, 0xff, 0xff, 0xff], si32, vi32(16777215)),
-    (ttype.I32, [0x7f, 0xff, 0xff, 0xff], si32, vi32(2147483647)),
-    (ttype.I32, [0xff, 0xff, 0xff, 0xff], si32, vi32(-1)),
-    (ttype.I32, [0xff, 0xff, 0xff, 0x00], si32, vi32(-256)),
-    (ttype.I32, [0xff, 0xff, 0x00, 0x00], si32, vi32(-65536)),
-    (ttype.I32, [0xff, 0x00, 0x00, 0x00], si32, vi32(-16777216)),
-    (ttype.I32, [0x80, 0x00, 0x00, 0x00], si32, vi32(-2147483648)),
+    (ttype.I32, b'\x00\x00\x00\x01', si32, vi32(1)),
+    (ttype.I32, b'\x00\x00\x00\xff', si32, vi32(255)),
+    (ttype.I32, b'\x00\x00\xff\xff', si32, vi32(65535)),
+    (ttype.I32, b'\x00\xff\xff\xff', si32, vi32(16777215)),
+    (ttype.I32, b'\x7f\xff\xff\xff', si32, vi32(2147483647)),
+    (ttype.I32, b'\xff\xff\xff\xff', si32, vi32(-1)),
+    (ttype.I32, b'\xff\xff\xff\x00', si32, vi32(-256)),
+    (ttype.I32, b'\xff\xff\x00\x00', si32, vi32(-65536)),
+    (ttype.I32, b'\xff\x00\x00\x00', si32, vi32(-16777216)),
+    (ttype.I32, b'\x80\x00\x00\x00', si32, vi32(-2147483648)),
 
     # i64
     (ttype.I64,
-     [0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01],
+     b'\x00\x00\x00\x00\x00\x00\x00\x01',
      si64,
      vi64(1)),
     (ttype.I64,
-     [0x00, 0x00, 0x00, 0x00, 0xff, 0xff, 0xff, 0xff],
+     b'\x00\x00\x00\x00\xff\xff\xff\xff',
      si64,
      vi64(4294967295)),
     (ttype.I64,
-     [0x00, 0x00, 0x00, 0xff, 0xff, 0xff, 0xff, 0xff],
+     b'\x00\x00\x00\xff\xff\xff\xff\xff',
      si64,
      vi64(1099511627775)),
     (ttype.I64,
-     [0x00, 0x00, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff],
+     b'\x00\x00\xff\xff\xff\xff\xff\xff',
      si64,
      vi64(281474976710655)),
     (ttype.I64,
-     [0x00, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff],
+     b'\x00\xff\xff\xff\xff\xff\xff\xff',
      si64,
      vi64(72057594037927935)),
     (ttype.I64,
-     [0x7f, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff],
+     b'\x7f\xff\xff\xff\xff\xff\xff\xff',
      si64,
      vi64(9223372036854775807)),
     (ttype.I64,
-     [0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff],
+     b'\xff\xff\xff\xff\xff\xff\xff\xff',
      si64,
      vi64(-1)),
     (ttype.I64,
-     [0xff, 0xff, 0xff, 0xff, 0x00, 0x00, 0x00, 0x00],
+     b'\xff\xff\xff\xff\x00\x00\x00\x00',
      si64,
      vi64(-4294967296)),
     (ttype.I64,
-     [0xff, 0xff, 0xff, 0x00, 0x00, 0x00, 0x00, 0x00],
+     b'\xff\xff\xff\x00\x00\x00\x00\x00',
      si64,
      vi64(-1099511627776)),
     (ttype.I64,
-     [0xff, 0xff, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00],
+     b'\xff\xff\x00\x00\x00\x00\x00\x00',
      si64,
      vi64(-281474976710656)),
     (ttype.I64,
-     [0xff, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00],
+     b'\xff\x00\x00\x00\x00\x00\x00\x00',
      si64,
      vi64(-72057594037927936)),
     (ttype.I64,
-     [0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00],
+     b'\x80\x00\x00\x00\x00\x00\x00\x00',
      si64,
      vi64(-9223372036854775808)),
 
     # double
     (ttype.DOUBLE,
-     [0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00],
+     b'\x00\x00\x00\x00\x00\x00\x00\x00',
      sdouble,
      vdouble(0.0)),
     (ttype.DOUBLE,
-     [0x3f, 0xf0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00],
+     b'\x3f\xf0\x00\x00\x00\x00\x00\x00',
      sdouble,
      vdouble(1.0)),
     (ttype.DOUBLE,
-     [0x3f, 0xf0, 0x0, 0x0, 0x0, 0x6, 0xdf, 0x38],
+     b'\x3f\xf0\x00\x00\x00\x06\xdf\x38',
      sdouble,
      vdouble(1.0000000001)),
     (ttype.DOUBLE,
-     [0x3f, 0xf1, 0x99, 0x99, 0x99, 0x99, 0x99, 0x9a],
+     b'\x3f\xf1\x99\x99\x99\x99\x99\x9a',
      sdouble,
      vdouble(1.1)),
     (ttype.DOUBLE,
-     [0xbf, 0xf1, 0x99, 0x99, 0x99, 0x99, 0x99, 0x9a],
+     b'\xbf\xf1\x99\x99\x99\x99\x99\x9a',
      sdouble,
      vdouble(-1.1)),
     (ttype.DOUBLE,
-     [0x40, 0x9, 0x21, 0xfb, 0x54, 0x44, 0x2d, 0x18],
+     b'\x40\x09\x21\xfb\x54\x44\x2d\x18',
      sdouble,
      vdouble(3.141592653589793)),
     (ttype.DOUBLE,
-     [0xbf, 0xf0, 0x0, 0x0, 0x0, 0x6, 0xdf, 0x38],
+     b'\xbf\xf0\x00\x00\x00\x06\xdf\x38',
      sdouble,
      vdouble(-1.0000000001)),
 
     # binary = len:4 (.){len}
-    (ttype.BINARY, [0x00, 0x00, 0x00, 0x00], sbin, vbinary(b'')),
-    (ttype.BINARY, [
-        0x00, 0x00, 0x00, 0x05,         # len:4 = 5
-        0x68, 0x65, 0x6c, 0x6c, 0x6f,   # 'h', 'e', 'l', 'l', 'o'
-    ], sbin, vbinary(b'hello')),
+    (ttype.BINARY, b'\x00\x00\x00\x00', sbin, vbinary(b'')),
+    (ttype.BINARY, (
+        b'\x00\x00\x00\x05'             # len:4 = 5
+        b'\x68\x65\x6c\x6c\x6f'         # 'h', 'e', 'l', 'l', 'o'
+    ), sbin, vbinary(b'hello')),
 
     # struct = (ttype:1 id:2 value)* stop
     # stop = 0
-    (ttype.STRUCT, [0x00], sstruct(''), vstruct()),
-    (ttype.STRUCT, [
-        0x02,        # ttype:1 = bool
-        0x00, 0x01,  # id:2 = 1
-        0x01,        # value = true
-        0x00,        # stop
-     ],
+    (ttype.STRUCT, b'\x00', sstruct(''), vstruct()),
+    (ttype.STRUCT, (
+        b'\x02'      # ttype:1 = bool
+        b'\x00\x01'  # id:2 = 1
+        b'\x01'      # value = true
+        b'\x00'      # stop
+     ),
      sstruct("1: optional bool param"),
      vstruct((1, ttype.BOOL, vbool(True)))),
-    (ttype.STRUCT, [
-        0x06,           # ttype:1 = i16
-        0x00, 0x01,     # id:2 = 1
-        0x00, 0x2a,     # value = 42
+    (ttype.STRUCT, (
+        b'\x06'         # ttype:1 = i16
+        b'\x00\x01'     # id:2 = 1
+        b'\x00\x2a'     # value = 42
 
-        0x0F,           # ttype:1 = list
-        0x00, 0x02,     # id:2 = 2
+        b'\x0f'         # ttype:1 = list
+        b'\x00\x02'     # id:2 = 2
 
         # <list>
-        0x0B,                       # ttype:1 = binary
-        0x00, 0x00, 0x00, 0x02,     # size:4 = 2
+        b'\x0b'                     # ttype:1 = binary
+        b'\x00\x00\x00\x02'         # size:4 = 2
         # <binary>
-        0x00, 0x00, 0x00, 0x03,     # len:4 = 3
-        0x66, 0x6f, 0x6f,           # 'f', 'o', 'o'
+        b'\x00\x00\x00\x03'         # len:4 = 3
+        b'\x66\x6f\x6f'             # 'f', 'o', 'o'
         # </binary>
         # <binary>
-        0x00, 0x00, 0x00, 0x03,     # len:4 = 3
-        0x62, 0x61, 0x72,           # 'b', 'a', 'r'
+        b'\x00\x00\x00\x03'         # len:4 = 3
+        b'\x62\x61\x72'             # 'b', 'a', 'r'
         # </binary>
         # </list>
 
-        0x00,           # stop
-    ], sstruct("1: optional i16 p1; 2: optional list<binary> p2;"), vstruct(
+        b'\x00'         # stop
+    ), sstruct("1: optional i16 p1; 2: optional list<binary> p2;"), vstruct(
         (1, ttype.I16, vi16(42)),
         (2, ttype.LIST, vlist(
             ttype.BINARY, vbinary(b'foo'), vbinary(b'bar'))),
@@ -225,49 +228,45 @@ def reader_writer_ids(x):
     # list = vtype:1 count:4 (value){count}
     (
             ttype.LIST,
-            [0x0C, 0x00, 0x00, 0x00, 0x00],
+            b'\x0c\x00\x00\x00\x00',
             slist(sstruct('')),
             vlist(ttype.STRUCT)
     ),
-    (ttype.LIST, [
-        0x0C,                       # vtype:1 = struct
-        0x00, 0x00, 0x00, 0x02,     # count:4 = 2
+    (ttype.LIST, (
+        b'\x0c'                     # vtype:1 = struct
+        b'\x00\x00\x00\x02'         # count:4 = 2
 
         # <struct>
-        0x06,        # ttype:1 = i16
-        0x00, 0x01,  # id:2 = 1
-        0x00, 0x01,  # value = 1
+        b'\x06'      # ttype:1 = i16
+        b'\x00\x01'  # id:2 = 1
+        b'\x00\x01'  # value = 1
 
-        0x08,                    # ttype:1 = i32
-        0x00, 0x02,              # id:2 = 2
-        0x00, 0x00, 0x00, 0x02,  # value = 2
+        b'\x08'                  # ttype:1 = i32
+        b'\x00\x02'              # id:2 = 2
+        b'\x00\x00\x00\x02'      # value = 2
 
-        0x00,        # stop
+        b'\x00'      # stop
         # </struct>
 
         # <struct>
-        0x06,        # ttype:1 = i16
-        0x00, 0x01,  # id:2 = 1
-        0x00, 0x03,  # value = 3
+        b'\x06'      # ttype:1 = i16
+        b'\x00\x01'  # id:2 = 1
+        b'\x00\x03'  # value = 3
 
-        0x08,                    # ttype:1 = i32
-        0x00, 0x02,              # id:2 = 2
-        0x00, 0x00, 0x00, 0x04,  # value = 4
+        b'\x08'                  # ttype:1 = i32
+        b'\x00\x02'              # id:2 = 2
+        b'\x00\x00\x00\x04'      # value = 4
 
-        0x00,        # stop
+        b'\x00'      # stop
         # </struct>
-    ], slist(sstruct("1: optional i16 p1; 2: optional i32 p2")), vlist(
+    ), slist(sstruct("1: optional i16 p1; 2: optional i32 p2")), vlist(
         ttype.STRUCT,
         vstruct((1, ttype.I16, vi16(1)), (2, ttype.I32, vi32(2))),
         vstruct((1, ttype.I16, vi16(3)), (2, ttype.I32, vi32(4))),
     )),
 ], ids=reader_writer_ids)
-def test_reader_and_writer(typ, bs, spec, value):
+def test_reader_and_writer(protocol, typ, bs, spec, value):
     """Test serialization and deserialization of all samples."""
-    bs = bytes(bytearray(bs))
-
-    protocol = BinaryProtocol()
-
     result = protocol.deserialize_value(typ, bs)
     assert value == result
 
@@ -294,11 +293,9 @@ def test_reader_and_writer(typ, bs, spec, value):
     (sset(sbool), set()),
     (sset(sbool), {True})
 ], ids=["map1", "map2", "set1", "set2"])
-def test_reader_and_writer_noorder(spec, value):
+def test_reader_and_writer_noorder(protocol, spec, value):
     """Test serialization and deserialization for types
     that have no guaranteed order."""
-    protocol = BinaryProtocol()
-
     buffer = WriteBuffer()
     spec.write_to(protocol.writer(buffer), value)
     result = spec.read_from(protocol.reader(ReadBuffer(buffer.value)))
@@ -307,183 +304,175 @@ def test_reader_and_writer_noorder(spec, value):
 
 
 @pytest.mark.parametrize('typ, spec, bs', [
-    (ttype.BOOL, sbool, []),
-    (ttype.BYTE, sbyte, []),
-    (ttype.DOUBLE, sdouble, [0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07]),
-    (ttype.I16, si16, [0x01]),
-    (ttype.I32, si32, [0x01, 0x02, 0x03]),
-    (ttype.I64, si64, [0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07]),
-
-    (ttype.BINARY, sbin, []),
-    (ttype.BINARY, sbin, [0x00, 0x00, 0x00, 0x01]),
-    (ttype.BINARY, sbin, [0x00, 0x00, 0x00, 0x05, 0x68, 0x65, 0x6c, 0x6c]),
-
-    (ttype.STRUCT, sstruct("1: optional bool p1"), []),
-    (ttype.STRUCT, sstruct("1: optional bool p1"), [0x02, 0x01]),
+    (ttype.BOOL, sbool, b''),
+    (ttype.BYTE, sbyte, b''),
+    (ttype.DOUBLE, sdouble, b'\x01\x02\x03\x04\x05\x06\x07'),
+    (ttype.I16, si16, b'\x01'),
+    (ttype.I32, si32, b'\x01\x02\x03'),
+    (ttype.I64, si64, b'\x01\x02\x03\x04\x05\x06\x07'),
+
+    (ttype.BINARY, sbin, b''),
+    (ttype.BINARY, sbin, b'\x00\x00\x00\x01'),
+    (ttype.BINARY, sbin, b'\x00\x00\x00\x05\x68\x65\x6c\x6c'),
+
+    (ttype.STRUCT, sstruct("1: optional bool p1"), b''),
+    (ttype.STRUCT, sstruct("1: optional bool p1"), b'\x02\x01'),
     (
         ttype.STRUCT,
         sstruct("1: optional i16 p1"),
-        [0x06, 0x00, 0x01, 0x00, 0x01]
+        b'\x06\x00\x01\x00\x01'
     ),
 
-    (ttype.MAP, smap(si32, sbyte), []),
-    (ttype.MAP, smap(si32, sbyte), [0x02, 0x03]),
-    (ttype.MAP, smap(si32, sbyte), [0x02, 0x03, 0x00, 0x00, 0x00, 0x01]),
-    (ttype.MAP, smap(si32, sbyte), [
-        0x02, 0x03,                 # ktype vtype
-        0x00, 0x00, 0x00, 0x02,     # len = 2
-        0x00, 0x01,                 # (False, 1)
-        0x01                        # (True, ?)
-    ]),
-
-    (ttype.SET, sset(sbool), []),
-    (ttype.SET, sset(sbool), [0x02]),
-    (ttype.SET, sset(sbool), [0x02, 0x00, 0x00, 0x00]),
-    (ttype.SET, sset(sbool), [0x02, 0x00, 0x00, 0x00, 0x01]),
-    (ttype.SET, sset(sbool), [
-        0x02,                    # typ
-        0x00, 0x00, 0x00, 0x02,  # len = 2
-        0x01,                    # True
-    ]),
-
-    (ttype.LIST, slist(sbool), []),
-    (ttype.LIST, slist(sbool), [0x02]),
-    (ttype.LIST, slist(sbool), [0x02, 0x00, 0x00, 0x00]),
-    (ttype.LIST, slist(sbool), [0x02, 0x00, 0x00, 0x00, 0x01]),
-    (ttype.LIST, slist(sbool), [
-        0x02,                    # typ
-        0x00, 0x00, 0x00, 0x02,  # len = 2
-
-        0x01,                    # True
-    ]),
+    (ttype.MAP, smap(si32, sbyte), b''),
+    (ttype.MAP, smap(si32, sbyte), b'\x02\x03'),
+    (ttype.MAP, smap(si32, sbyte), b'\x02\x03\x00\x00\x00\x01'),
+    (ttype.MAP, smap(si32, sbyte), (
+        b'\x02\x03'                 # ktype vtype
+        b'\x00\x00\x00\x02'         # len = 2
+        b'\x00\x01'                 # (False, 1)
+        b'\x01'                     # (True, ?)
+    )),
+
+    (ttype.SET, sset(sbool), b''),
+    (ttype.SET, sset(sbool), b'\x02'),
+    (ttype.SET, sset(sbool), b'\x02\x00\x00\x00'),
+    (ttype.SET, sset(sbool), b'\x02\x00\x00\x00\x01'),
+    (ttype.SET, sset(sbool), (
+        b'\x02'                  # typ
+        b'\x00\x00\x00\x02'      # len = 2
+        b'\x01'                  # True
+    )),
+
+    (ttype.LIST, slist(sbool), b''),
+    (ttype.LIST, slist(sbool), b'\x02'),
+    (ttype.LIST, slist(sbool), b'\x02\x00\x00\x00'),
+    (ttype.LIST, slist(sbool), b'\x02\x00\x00\x00\x01'),
+    (ttype.LIST, slist(sbool), (
+        b'\x02'                  # typ
+        b'\x00\x00\x00\x02'      # len = 2
+
+        b'\x01'                  # True
+    )),
 
     (
         ttype.STRUCT,
         sstruct("1: optional bool foo"),
-        [
-            0x02,  # ttype:1 = bool
+        (
+            b'\x02'  # ttype:1 = bool
             # missing field ID
-        ],
+        ),
     ),
     (
         ttype.STRUCT,
         sstruct("1: optional bool foo"),
-        [
-            0x02,  # ttype:1 = bool
-            0x00,  # field ID too short
-        ],
+        (
+            b'\x02'  # ttype:1 = bool
+            b'\x00'  # field ID too short
+        ),
     ),
     (
         ttype.STRUCT,
         sstruct("1: optional bool foo"),
-        [
-            0x02,        # ttype:1 = bool
-            0x00, 0x01,  # id:2 = 1
+        (
+            b'\x02'      # ttype:1 = bool
+            b'\x00\x01'  # id:2 = 1
             # Missing value
-        ],
+        ),
     ),
     (
         ttype.STRUCT,
         sstruct("1: optional i16 foo"),
-        [
-            0x06,        # ttype:1 = i16
-            0x00, 0x01,  # id:2 = 1
-            0x00, 0x00,  # missing part of the value
-        ],
+        (
+            b'\x06'      # ttype:1 = i16
+            b'\x00\x01'  # id:2 = 1
+            b'\x00\x00'  # missing part of the value
+        ),
     ),
     (
         ttype.STRUCT,
         sstruct("1: optional bool foo"),
-        [
-            0x02,        # ttype:1 = bool
-            0x00, 0x01,  # id:2 = 1
-            0x01,        # true
+        (
+            b'\x02'      # ttype:1 = bool
+            b'\x00\x01'  # id:2 = 1
+            b'\x01'      # true
             # Missing struct close
-        ],
+        ),
     ),
 ], ids=reader_writer_ids)
-def test_input_too_short(typ, spec, bs):
+def test_input_too_short(protocol, typ, spec, bs):
     """Test that EndOfInputError is raised when not enough bytes are
     available."""
 
-    protocol = BinaryProtocol()
-
     with pytest.raises(EndOfInputError) as exc_info:
-        s = bytes(bytearray(bs))
-        protocol.deserialize_value(typ, s)
+        protocol.deserialize_value(typ, bs)
 
-    assert 'bytes but got' in str(exc_info)
+    assert 'bytes but got' in str(exc_info.value)
 
     with pytest.raises(EndOfInputError) as exc_info:
-        reader = protocol.reader(ReadBuffer(s))
+        reader = protocol.reader(ReadBuffer(bs))
         spec.read_from(reader)
 
-    assert 'bytes but got' in str(exc_info)
+    assert 'bytes but got' in str(exc_info.value)
 
 
 @pytest.mark.parametrize('typ, bs', [
-    (0x00, []),
-    (ttype.STRUCT, [
-        0x01,
-        0x00, 0x01,
-    ]),
-    (ttype.MAP, [
-        0x05, 0x07,
-        0x00, 0x00, 0x00, 0x00,
-    ]),
-    (ttype.SET, [
-        0x09,
-        0x00, 0x00, 0x00, 0x00,
-    ]),
-    (ttype.LIST, [
-        0x16,
-        0x00, 0x00, 0x00, 0x00,
-    ]),
+    (0x00, b''),
+    (ttype.STRUCT, (
+        b'\x01'
+        b'\x00\x01'
+    )),
+    (ttype.MAP, (
+        b'\x05\x07'
+        b'\x00\x00\x00\x00'
+    )),
+    (ttype.SET, (
+        b'\x09'
+        b'\x00\x00\x00\x00'
+    )),
+    (ttype.LIST, (
+        b'\x16'
+        b'\x00\x00\x00\x00'
+    )),
 ], ids=reader_writer_ids)
-def test_unknown_type_id(typ, bs):
-    protocol = BinaryProtocol()
-
+def test_unknown_type_id(protocol, typ, bs):
     with pytest.raises(ThriftProtocolError) as exc_info:
-        protocol.deserialize_value(typ, bytes(bytearray(bs)))
+        protocol.deserialize_value(typ, bs)
 
-    assert 'Unknown TType' in str(exc_info)
+    assert 'Unknown TType' in str(exc_info.value)
 
 
 @pytest.mark.parametrize('bs, message', [
-    ([
-        0x00, 0x00, 0x00, 0x06,                 # length = 6
-        0x67, 0x65, 0x74, 0x46, 0x6f, 0x6f,     # 'getFoo'
+    ((
+        b'\x00\x00\x00\x06'                     # length = 6
+        b'\x67\x65\x74\x46\x6f\x6f'             # 'getFoo'
 
-        0x01,                       # ttype = CALL
-        0x00, 0x00, 0x00, 0x2a,     # seqId = 42
+        b'\x01'                     # ttype = CALL
+        b'\x00\x00\x00\x2a'         # seqId = 42
 
-        0x00,
-    ], Message(
+        b'\x00'
+    ), Message(
         name='getFoo',
         seqid=42,
         message_type=CALL,
         body=vstruct()
     )),
-    ([
-        0x00, 0x00, 0x00, 0x06,                 # length = 6
-        0x73, 0x65, 0x74, 0x42, 0x61, 0x72,     # 'setBar'
+    ((
+        b'\x00\x00\x00\x06'                     # length = 6
+        b'\x73\x65\x74\x42\x61\x72'             # 'setBar'
 
-        0x02,                       # ttype = REPLY
-        0x00, 0x00, 0x00, 0x01,     # seqId = 1
+        b'\x02'                     # ttype = REPLY
+        b'\x00\x00\x00\x01'         # seqId = 1
 
-        0x02, 0x00, 0x01, 0x01,     # {1: True}
-        0x00,
-    ], Message(
+        b'\x02\x00\x01\x01'         # {1: True}
+        b'\x00'
+    ), Message(
         name='setBar',
         seqid=1,
         message_type=REPLY,
         body=vstruct((1, ttype.BOOL, vbool(True))),
     )),
 ])
-def test_message_round_trip(bs, message):
-    bs = bytes(bytearray(bs))
-    protocol = BinaryProtocol()
-
+def test_message_round_trip(protocol, bs, message):
     result = protocol.deserialize_message(bs)
     assert message == result
 
@@ -492,62 +481,121 @@ def test_message_round_trip(bs, message):
 
 
 @pytest.mark.parametrize('bs, message', [
-    ([
-        0x80, 0x01,  # version = 1
-        0x00, 0x03,  # ttype = EXCEPTION
+    ((
+        b'\x80\x01'  # version = 1
+        b'\x00\x03'  # ttype = EXCEPTION
 
-        0x00, 0x00, 0x00, 0x06,                 # length = 6
-        0x67, 0x65, 0x74, 0x46, 0x6f, 0x6f,     # 'getFoo'
+        b'\x00\x00\x00\x06'                     # length = 6
+        b'\x67\x65\x74\x46\x6f\x6f'             # 'getFoo'
 
-        0x00, 0x00, 0x00, 0x2a,     # seqId = 42
+        b'\x00\x00\x00\x2a'         # seqId = 42
 
-        0x02, 0x00, 0x08, 0x00,     # {8: False}
-        0x00,
-    ], Message(
+        b'\x02\x00\x08\x00'         # {8: False}
+        b'\x00'
+    ), Message(
         name='getFoo',
         seqid=42,
         message_type=EXCEPTION,
         body=vstruct((8, ttype.BOOL, vbool(False))),
     )),
-    ([
-        0x80, 0x01,  # version = 1
-        0x00, 0x04,  # ttype = ONEWAY
+    ((
+        b'\x80\x01'  # version = 1
+        b'\x00\x04'  # ttype = ONEWAY
 
-        0x00, 0x00, 0x00, 0x06,                 # length = 6
-        0x73, 0x65, 0x74, 0x42, 0x61, 0x72,     # 'setBar'
+        b'\x00\x00\x00\x06'                     # length = 6
+        b'\x73\x65\x74\x42\x61\x72'             # 'setBar'
 
-        0x00, 0x00, 0x00, 0x01,     # seqId = 1
+        b'\x00\x00\x00\x01'         # seqId = 1
 
-        0x00,
-    ], Message(
+        b'\x00'
+    ), Message(
         name='setBar',
         seqid=1,
         message_type=ONEWAY,
         body=vstruct(),
     )),
 ])
-def test_message_parse_strict(bs, message):
-    bs = bytes(bytearray(bs))
-    protocol = BinaryProtocol()
-
+def test_message_parse_strict(protocol, bs, message):
     result = protocol.deserialize_message(bs)
     assert message == result
 
 
 @pytest.mark.parametrize('bs', [
-    [
-        0x80, 0x2a,  # version = 42
-        0x00, 0x01,  # ttype = CALL
-        0x00, 0x00, 0x00, 0x06,                 # length = 6
-        0x67, 0x65, 0x74, 0x46, 0x6f, 0x6f,     # 'getFoo'
-        0x00, 0x00, 0x00, 0x01,     # seqId = 1
-        0x00,   # STOP
-    ]
+    (
+        b'\x80\x2a'                      # version = 42
+        b'\x00\x01'                      # ttype = CALL
+        b'\x00\x00\x00\x06'              # length = 6
+        b'\x67\x65\x74\x46\x6f\x6f'      # 'getFoo'
+        b'\x00\x00\x00\x01'              # seqId = 1
+        b'\x00'                          # STOP
+    )
 ])
-def test_message_invalid_version(bs):
-    bs = bytes(bytearray(bs))
-
+def test_message_invalid_version(protocol, bs):
     with pytest.raises(ThriftProtocolError) as exc_info:
-        BinaryProtocol().deserialize_message(bs)
+        protocol.deserialize_message(bs)
+
+    assert 'Unsupported version "42"' in str(exc_info.value)
+
+
+@pytest.mark.parametrize('wrap', [
+    bytearray,
+    memoryview,
+    lambda bs: memoryview(b'xx' + bs + b'xx')[2:-2],
+], ids=['bytearray', 'memoryview', 'memoryview-slice'])
+def test_deserialize_from_buffer_protocol(protocol, wrap):
+    bs = (
+        b'\x08'                  # ttype:1 = i32
+        b'\x00\x01'              # id:2 = 1
+        b'\x00\x00\x00\x2a'      # value = 42
+        b'\x00'                  # stop
+    )
+    value = vstruct((1, ttype.I32, vi32(42)))
+    assert protocol.deserialize_value(ttype.STRUCT, wrap(bs)) == value
+
+    message = (
+        b'\x00\x00\x00\x03'      # length = 3
+        b'\x66\x6f\x6f'          # 'foo'
+        b'\x01'                  # ttype = CALL
+        b'\x00\x00\x00\x01'      # seqId = 1
+    ) + bs
+    assert protocol.deserialize_message(wrap(message)) == Message(
+        name='foo', seqid=1, message_type=CALL, body=value,
+    )
+
+
+def test_reader_shares_bool_and_byte_values(protocol):
+    bs = (
+        b'\x03'                  # type:1 = byte
+        b'\x00\x00\x00\x04'      # length:4 = 4
+        b'\x80\xff\x00\x7f'      # -128, -1, 0, 127
+    )
+
+    result = protocol.deserialize_value(ttype.LIST, bs)
+    assert result == vlist(ttype.BYTE, vbyte(-128), vbyte(-1), vbyte(0),
+                           vbyte(127))
+    assert result.values[1] is (
+        protocol.deserialize_value(ttype.LIST, bs).values[1]
+    )
+
+    bs = b'\x02\x00\x00\x00\x02\x01\x00'
+    result = protocol.deserialize_value(ttype.LIST, bs)
+    assert result == vlist(ttype.BOOL, vbool(True), vbool(False))
+
+
+@pytest.mark.parametrize('bs, value', [
+    (b'\x06\x00\x00\x00\x02\xff\x80\x01\x01',
+     vlist(ttype.I16, vi16(-128), vi16(257))),
+    (b'\x08\x00\x00\x00\x02\x00\x00\x00\x2a\x00\x01\x00\x00',
+     vlist(ttype.I32, vi32(42), vi32(65536))),
+    (b'\x0a\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff',
+     vlist(ttype.I64, vi64(-1))),
+])
+def test_reader_shares_small_int_values(protocol, bs, value):
+    result = protocol.deserialize_value(ttype.LIST, bs)
+    assert result == value
 
-    assert 'Unsupported version "42"' in str(exc_info)
+    again = protocol.deserialize_value(ttype.LIST, bs)
+    assert result.values[0] is again.values[0]
+    if len(value.values) > 1:
+        # Outside the shared range.
+        assert result.values[1] is not again.values[1]
@@ -40,10 +40,10 @@ def test_type_mismatch(expr, loads):
     with pytest.raises(ThriftCompilerError) as exc_info:
         loads(expr)
 
-    assert 'Value for constant' in str(exc_info)
+    assert 'Value for constant' in str(exc_info.value)
     assert (
-        'does not match its type' in str(exc_info) or
-        'is not valid' in str(exc_info)
+        'does not match its type' in str(exc_info.value) or
+        'is not valid' in str(exc_info.value)
     )
 
 
@@ -93,7 +93,7 @@ def test_link(loads):
     assert mod.true_from_num
     assert not mod.false_from_num
 
-    assert mod.aSet == set(["hello", "world"])
+    assert mod.aSet == {"hello", "world"}
     assert mod.aList == ['hello', 'hello', 'world']
     assert mod.aMap == {
         1: 'hello',
@@ -138,14 +138,14 @@ def test_inescapable(loads):
     with pytest.raises(ThriftParserError) as exc_info:
         loads(r'const string foo = "a\bc"')
 
-    assert 'Cannot escape' in str(exc_info)
+    assert 'Cannot escape' in str(exc_info.value)
 
 
 def test_undefined_constant(loads):
     with pytest.raises(ThriftCompilerError) as exc_info:
         loads('const string baz = bar')
 
-    assert 'Unknown constant "bar"' in str(exc_info)
+    assert 'Unknown constant "bar"' in str(exc_info.value)
 
 
 def test_duplicate_constant(loads):
@@ -155,8 +155,8 @@ def test_duplicate_constant(loads):
             const string foo = "bar"
         ''')
 
-    assert 'Cannot define constant "foo"' in str(exc_info)
-    assert 'name is already taken' in str(exc_info)
+    assert 'Cannot define constant "foo"' in str(exc_info.value)
+    assert 'name is already taken' in str(exc_info.value)
 
 
 def test_enum_from_future_is_allowed(loads):
@@ -176,7 +176,7 @@ def test_set_is_transformed(loads):
         const map<string, set<i32>> some_const = {
             "foo": [1, 1, 2, 3, 2, 3, 3]
         };
-    ''').some_const == {'foo': set([1, 2, 3])}
+    ''').some_const == {'foo': {1, 2, 3}}
 
 
 def test_structs_can_be_constants_and_defaults(loads):
@@ -260,7 +260,7 @@ def test_invalid_constant_structs_or_unions(loads, s):
         loads(s)
 
     assert (
-        'Value for constant' in str(exc_info) or
-        'Default value for field' in str(exc_info)
+        'Value for constant' in str(exc_info.value) or
+        'Default value for field' in str(exc_info.value)
     )
-    assert 'does not match' in str(exc_info)
+    assert 'does not match' in str(exc_info.value)
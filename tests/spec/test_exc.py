@@ -28,7 +28,7 @@ from thriftrw.spec.field import FieldSpec
 from thriftrw.spec import primitive as prim_spec
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def parse():
     return Parser(start='exception', silent=True).parse
 
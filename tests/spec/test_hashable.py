@@ -22,43 +22,6 @@ from __future__ import absolute_import, unicode_literals, print_function
 import pytest
 
 
-@pytest.mark.parametrize('name, src, kwargs', [
-    (
-        'Foo', '''
-            struct Foo {
-                1: required string a
-            }
-        ''',
-        {'a': 'zzz'}
-    ),
-    (
-        'Bar', '''
-            union Bar{
-                1: binary b
-                2: string s
-            }
-        ''',
-        {'s': 'bar'},
-    ),
-    (
-        'Baz', '''
-            enum Enum { A = 1, B = 2 }
-            struct Baz {
-                1: optional Enum e
-            }
-        ''',
-        {'e': 1},
-    ),
-])
-def test_hashable(loads, name, src, kwargs):
-    module = loads(src)
-    klass = getattr(module, name)
-    obj1 = klass(**kwargs)
-    obj2 = klass(**kwargs)
-    assert hash(obj1) == hash(obj2)
-    assert hash(obj1) == hash(obj1)
-
-
 @pytest.mark.parametrize('name, src, kwargs1, kwargs2', [
     (
         'Foo', '''
@@ -90,12 +53,15 @@ def test_hashable(loads, name, src, kwargs):
         {'e': 2},
     ),
 ])
-def test_hash_inequality(loads, name, src, kwargs1, kwargs2):
+def test_hashable(loads, name, src, kwargs1, kwargs2):
     module = loads(src)
     klass = getattr(module, name)
     obj1 = klass(**kwargs1)
-    obj2 = klass(**kwargs2)
-    assert hash(obj1) != hash(obj2)
+    obj2 = klass(**kwargs1)
+    assert hash(obj1) == hash(obj2)
+    assert hash(obj1) == hash(obj1)
+
+    assert hash(obj1) != hash(klass(**kwargs2))
 
 
 @pytest.mark.parametrize('name, src, kwargs', [
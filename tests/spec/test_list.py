@@ -22,6 +22,7 @@ from __future__ import absolute_import, unicode_literals, print_function
 
 import pytest
 
+from thriftrw.errors import EndOfInputError
 from thriftrw.idl import Parser
 from thriftrw.spec import primitive as prim_spec
 from thriftrw.spec.list import ListTypeSpec
@@ -32,7 +33,7 @@ from thriftrw.wire import ttype
 from ..util.value import vbinary, vlist
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def parse():
     return Parser(start='list_type', silent=True).parse
 
@@ -97,3 +98,39 @@ def test_validate():
 
     with pytest.raises(TypeError):
         spec.validate(42)
+
+
+@pytest.mark.parametrize('typ, value', [
+    ('bool', [True, False, True]),
+    ('byte', [-128, -1, 0, 127]),
+    ('i16', [-32768, 0, 32767]),
+    ('i32', [-2147483648, 0, 2147483647]),
+    ('i64', [-9223372036854775808, 0, 9223372036854775807]),
+    ('double', [-1.5, 0.0, 3.25]),
+    ('i32', []),
+])
+def test_fixed_width_round_trip(loads, typ, value):
+    m = loads('''
+        struct Foo {
+            1: optional list<%s> items;
+            2: optional set<%s> unique;
+        }
+    ''' % (typ, typ))
+    foo = m.Foo(items=value, unique=set(value))
+    serialized = m.dumps(foo)
+
+    assert m.loads(m.Foo, serialized) == foo
+
+    # Field header (3 bytes) and list header (5 bytes), then cut off inside
+    # the first element.
+    with pytest.raises(EndOfInputError):
+        m.loads(m.Foo, serialized[:9])
+
+
+def test_fixed_width_write_overflow(loads):
+    m = loads('struct Foo { 1: optional list<i16> items }')
+    foo = m.Foo(items=[])
+    foo.items = [1, 2, 1 << 20]
+
+    with pytest.raises(OverflowError):
+        m.dumps(foo)
@@ -32,7 +32,7 @@ from thriftrw.wire import ttype
 from ..util.value import vi32, vmap, vbinary
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def parse():
     return Parser(start='map_type', silent=True).parse
 
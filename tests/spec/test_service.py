@@ -35,7 +35,7 @@ from thriftrw.wire import ttype
 from ..util.value import vstruct, vbinary, vmap, vbool
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def parse():
     return Parser(start='service', silent=True).parse
 
@@ -58,8 +58,8 @@ def test_compile_oneway_with_return_type(parse):
             }
         '''))
 
-    assert 'Function "Foo.foo" is oneway' in str(exc_info)
-    assert 'It cannot return a value' in str(exc_info)
+    assert 'Function "Foo.foo" is oneway' in str(exc_info.value)
+    assert 'It cannot return a value' in str(exc_info.value)
 
 
 def test_compile_oneway_with_exceptions(parse):
@@ -70,8 +70,8 @@ def test_compile_oneway_with_exceptions(parse):
             }
         '''))
 
-    assert 'Function "Foo.foo" is oneway' in str(exc_info)
-    assert 'It cannot raise exceptions' in str(exc_info)
+    assert 'Function "Foo.foo" is oneway' in str(exc_info.value)
+    assert 'It cannot raise exceptions' in str(exc_info.value)
 
 
 def test_compile_dupe_func(parse):
@@ -83,8 +83,8 @@ def test_compile_dupe_func(parse):
             }
         '''))
 
-    assert 'Function "Foo.foo" cannot be defined' in str(exc_info)
-    assert 'name is already taken' in str(exc_info)
+    assert 'Function "Foo.foo" cannot be defined' in str(exc_info.value)
+    assert 'name is already taken' in str(exc_info.value)
 
 
 def test_dupe_service(loads):
@@ -94,8 +94,8 @@ def test_dupe_service(loads):
             service Foo { }
         ''')
 
-    assert 'Cannot define service "Foo"' in str(exc_info)
-    assert 'name is already taken' in str(exc_info)
+    assert 'Cannot define service "Foo"' in str(exc_info.value)
+    assert 'name is already taken' in str(exc_info.value)
 
 
 def test_compile(parse):
@@ -162,7 +162,7 @@ def test_link_unknown_parent(loads):
     with pytest.raises(ThriftCompilerError) as exc_info:
         loads('service A extends B {}')
 
-    assert 'Unknown service "B" referenced at line' in str(exc_info)
+    assert 'Unknown service "B" referenced at line' in str(exc_info.value)
 
 
 def test_load(loads):
@@ -289,26 +289,24 @@ def test_fails_on_absent_return_value(loads):
     with pytest.raises(TypeError) as exc_info:
         m.loads(m.Foo.foo.response, b'\x00')
 
-    assert 'did not receive any values' in str(exc_info)
+    assert 'did not receive any values' in str(exc_info.value)
 
 
 @pytest.mark.parametrize('method, raw, wire_value', [
-    ('something', [
-        0x0C,        # typeid:1 = struct
-        0x7e, 0xff,  # id:2 = 32511
-        0x00,        # value = empty struct
-        0x00,        # stop
-    ], vstruct((32511, ttype.STRUCT, vstruct()))),
-    ('nothing', [
-        0x0C,        # typeid:1 = struct
-        0x01, 0xff,  # id:2 = 511
-        0x00,        # value = empty struct
-        0x00,        # stop
-    ], vstruct((511, ttype.STRUCT, vstruct()))),
+    ('something', (
+        b'\x0c'      # typeid:1 = struct
+        b'\x7e\xff'  # id:2 = 32511
+        b'\x00'      # value = empty struct
+        b'\x00'      # stop
+    ), vstruct((32511, ttype.STRUCT, vstruct()))),
+    ('nothing', (
+        b'\x0c'      # typeid:1 = struct
+        b'\x01\xff'  # id:2 = 511
+        b'\x00'      # value = empty struct
+        b'\x00'      # stop
+    ), vstruct((511, ttype.STRUCT, vstruct()))),
 ], ids=['returns-i32', 'returns-void'])
 def test_unrecognized_exception(loads, method, raw, wire_value):
-    raw = bytes(bytearray(raw))
-
     m = loads('''
         exception GreatSadness {
             1: optional string reason
@@ -328,7 +326,7 @@ def test_unrecognized_exception(loads, method, raw, wire_value):
 
     assert (
         ('"S_%s_response" received an unrecognized exception' % method)
-        in str(exc_info)
+        in str(exc_info.value)
     )
 
 
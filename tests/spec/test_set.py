@@ -33,7 +33,7 @@ from thriftrw.wire import ttype
 from ..util.value import vbinary, vset
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def parse():
     return Parser(start='set_type', silent=True).parse
 
@@ -22,10 +22,12 @@ from __future__ import absolute_import, unicode_literals, print_function
 
 import pytest
 
+from thriftrw.errors import EndOfInputError
 from thriftrw.errors import ThriftCompilerError
 from thriftrw.spec.struct import StructTypeSpec
 from thriftrw.spec.field import FieldSpec
 from thriftrw.idl import Parser
+from thriftrw.protocol import BinaryProtocol
 from thriftrw.spec import primitive as prim_spec
 from thriftrw.spec.reference import TypeReference
 from thriftrw.wire import ttype
@@ -33,7 +35,7 @@ from thriftrw.wire import ttype
 from ..util.value import vstruct, vbinary, vi64, vi32
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def parse():
     return Parser(start='struct', silent=True).parse
 
@@ -44,7 +46,7 @@ def test_compile_missing_field_id(parse):
     with pytest.raises(ThriftCompilerError) as exc_info:
         StructTypeSpec.compile(struct_ast)
 
-    assert 'Please specify the numeric ID for the field' in str(exc_info)
+    assert 'Please specify the numeric ID for the field' in str(exc_info.value)
 
 
 def test_compile_missing_requiredness(parse):
@@ -55,7 +57,7 @@ def test_compile_missing_requiredness(parse):
 
     assert (
         'Please specify whether the field is optional or required'
-        in str(exc_info)
+        in str(exc_info.value)
     )
 
 
@@ -73,8 +75,8 @@ def test_compile_duplicate_fields(parse):
     with pytest.raises(ThriftCompilerError) as exc_info:
         StructTypeSpec.compile(struct_ast)
 
-    assert 'Field "x" of struct "Foo"' in str(exc_info)
-    assert 'has duplicates' in str(exc_info)
+    assert 'Field "x" of struct "Foo"' in str(exc_info.value)
+    assert 'has duplicates' in str(exc_info.value)
 
 
 def test_compile_duplicate_field_ids(parse):
@@ -85,8 +87,8 @@ def test_compile_duplicate_field_ids(parse):
     with pytest.raises(ThriftCompilerError) as exc_info:
         StructTypeSpec.compile(struct_ast)
 
-    assert 'Field ID "1" of struct "Foo"' in str(exc_info)
-    assert 'has already been used' in str(exc_info)
+    assert 'Field ID "1" of struct "Foo"' in str(exc_info.value)
+    assert 'has already been used' in str(exc_info.value)
 
 
 def test_compile_primitives(parse):
@@ -216,7 +218,7 @@ def test_required_field_missing(loads):
     with pytest.raises(TypeError) as exc_info:
         spec.validate(x)
 
-    assert 'Field "foo" of "X" is required' in str(exc_info)
+    assert 'Field "foo" of "X" is required' in str(exc_info.value)
 
 
 def test_int_field_too_large(loads):
@@ -229,7 +231,7 @@ def test_int_field_too_large(loads):
     with pytest.raises(ValueError) as exc_info:
         spec.validate(x)
 
-    assert 'Field 1 of X is invalid' in str(exc_info)
+    assert 'Field 1 of X is invalid' in str(exc_info.value)
 
 
 def test_empty(loads):
@@ -339,23 +341,25 @@ def test_constructor_behavior(loads):
 
     with pytest.raises(TypeError) as exc_info:
         Struct()
-    assert 'takes at least 2 arguments (1 given)' in str(exc_info)
+    assert 'takes at least 2 arguments (1 given)' in str(exc_info.value)
 
     with pytest.raises(TypeError) as exc_info:
         Struct(1, 2, 3, 4, 5)
-    assert 'at most 5 arguments (6 given)' in str(exc_info)
+    assert 'at most 5 arguments (6 given)' in str(exc_info.value)
 
     with pytest.raises(TypeError) as exc_info:
         Struct('hello', requiredField='world')
-    assert 'multiple values for argument "requiredField"' in str(exc_info)
+    assert (
+        'multiple values for argument "requiredField"' in str(exc_info.value)
+    )
 
     with pytest.raises(TypeError) as exc_info:
         Struct('hello', unknown='world')
-    assert 'unexpected keyword argument "unknown"' in str(exc_info)
+    assert 'unexpected keyword argument "unknown"' in str(exc_info.value)
 
     with pytest.raises(TypeError) as exc_info:
         Struct(optionalField=10)
-    assert 'is required' in str(exc_info)
+    assert 'is required' in str(exc_info.value)
 
 
 def test_constructor_behavior_with_nested_types(loads):
@@ -478,8 +482,8 @@ def test_default_value_type_mismatches(loads, expr):
         loads(expr)
 
     assert (
-        'Default value for field' in str(exc_info) and
-        'does not match its type' in str(exc_info)
+        'Default value for field' in str(exc_info.value) and
+        'does not match its type' in str(exc_info.value)
     )
 
 
@@ -490,3 +494,136 @@ def test_has_thrift_module(loads):
         }
     ''')
     assert module is module.Foo.__thrift_module__
+
+
+def test_lazy_struct(loads):
+    m = loads('''
+        struct Point {
+            1: required double x;
+            2: required double y;
+        }
+
+        struct Shape {
+            1: required string name;
+            2: optional list<Point> points;
+            3: optional i32 sides = 4;
+            4: optional binary data;
+        }
+    ''')
+    shape = m.Shape('square', [m.Point(0, 0), m.Point(1, 1)], data=b'foo')
+    serialized = m.dumps(shape)
+
+    lazy = m.loads.lazy(m.Shape, serialized)
+    assert lazy.name == 'square'
+    assert lazy.points == [m.Point(0, 0), m.Point(1, 1)]
+    assert lazy.points is lazy.points
+    assert lazy.data == b'foo'
+    assert lazy.sides == 4
+    assert lazy == shape
+    assert shape == lazy
+    assert not (lazy != shape)
+    assert not (shape != lazy)
+    assert lazy != m.Shape('circle')
+    assert m.Shape('circle') != lazy
+    assert lazy.to_struct() == shape
+
+    with pytest.raises(AttributeError):
+        lazy.foo
+
+    lazy = m.loads.lazy(m.Shape, memoryview(m.dumps(m.Shape('circle', []))))
+    assert lazy.name == 'circle'
+    assert lazy.points == []
+    assert lazy.data is None
+
+
+def test_lazy_struct_missing_required_field(loads):
+    m = loads('''
+        struct X { 1: optional string foo }
+        struct Y { 2: required string bar }
+    ''')
+    with pytest.raises(TypeError) as exc_info:
+        m.loads.lazy(m.Y, m.dumps(m.X('hello')))
+
+    assert 'Field "bar" of "Y" is required' in str(exc_info.value)
+
+
+def test_lazy_union_is_rejected(loads):
+    m = loads('union U { 1: string foo }')
+
+    with pytest.raises(TypeError) as exc_info:
+        m.loads.lazy(m.U, m.dumps(m.U(foo='hello')))
+
+    assert '"U" is not a struct or exception' in str(exc_info.value)
+
+
+def test_read_from_fills_defaults_and_checks_required(loads):
+    m = loads('''
+        struct X { 1: optional string foo }
+        struct Y {
+            1: optional string foo;
+            2: optional list<i32> bar = [1, 2];
+            3: required i32 baz = 3;
+        }
+        struct Z { 2: required string bar }
+        exception E { 1: optional string message }
+    ''')
+    serialized = m.dumps(m.X('hello'))
+
+    y = m.loads(m.Y, serialized)
+    assert y == m.Y(foo='hello', bar=[1, 2], baz=3)
+    assert y.bar is not m.loads(m.Y, serialized).bar
+
+    with pytest.raises(TypeError):
+        m.loads(m.Z, serialized)
+
+    e = m.loads(m.E, m.dumps(m.E('great sadness')))
+    assert isinstance(e, Exception)
+    assert e == m.E('great sadness')
+
+
+@pytest.mark.parametrize('typ, value', [
+    ('list<i64>', [1, 2, 3]),
+    ('set<bool>', {True}),
+    ('map<i16, double>', {1: 2.0}),
+    ('list<string>', ['foo', 'bar']),
+    ('map<i32, list<string>>', {1: ['foo']}),
+    ('list<i32>', []),
+])
+def test_read_from_skips_unknown_fields(loads, typ, value):
+    m = loads('''
+        struct X {
+            1: optional %s foo;
+            2: optional string bar;
+        }
+        struct Y { 2: optional string bar }
+    ''' % typ)
+    serialized = m.dumps(m.X(foo=value, bar='hello'))
+
+    assert m.loads(m.Y, serialized) == m.Y(bar='hello')
+
+    with pytest.raises(EndOfInputError):
+        m.loads(m.Y, serialized[:6])
+
+
+@pytest.mark.parametrize('fields', [
+    # declaration order
+    [(1, ttype.I32, vi32(1)), (2, ttype.BINARY, vbinary(b'b')),
+     (3, ttype.I64, vi64(3))],
+    # reversed
+    [(3, ttype.I64, vi64(3)), (2, ttype.BINARY, vbinary(b'b')),
+     (1, ttype.I32, vi32(1))],
+    # gaps, unknown fields, and a repeated field
+    [(3, ttype.I64, vi64(42)), (7, ttype.I32, vi32(7)),
+     (1, ttype.I32, vi32(1)), (2, ttype.I64, vi64(2)),
+     (2, ttype.BINARY, vbinary(b'b')), (3, ttype.I64, vi64(3))],
+])
+def test_read_from_field_order(loads, fields):
+    m = loads('''
+        struct X {
+            1: optional i32 a;
+            2: optional string b;
+            3: optional i64 c;
+        }
+    ''')
+    serialized = BinaryProtocol().serialize_value(vstruct(*fields))
+    assert m.loads(m.X, serialized) == m.X(a=1, b='b', c=3)
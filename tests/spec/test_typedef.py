@@ -28,7 +28,7 @@ from thriftrw.spec import primitive as prim_spec
 from thriftrw.idl import Parser
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def parse():
     """Parser for enum definitions."""
     return Parser(start='typedef', silent=True).parse
@@ -58,3 +58,12 @@ def test_link(loads):
     assert mod.Foo is mod.Bar
     assert mod.Bar is mod.Baz
     assert mod.Baz is mod.Qux
+
+
+def test_type_reference_equality():
+    ref = TypeReference('Custom', 1)
+    assert ref == ref
+    assert not (ref != ref)
+    assert ref == TypeReference('Custom', 1)
+    assert ref != TypeReference('Custom', 2)
+    assert ref != TypeReference('Other', 1)
@@ -34,7 +34,7 @@ from thriftrw.wire import ttype
 from ..util.value import vstruct, vbinary, vlist, vi32
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def parse():
     return Parser(start='union', silent=True).parse
 
@@ -43,7 +43,7 @@ def test_compile_without_field_id(parse):
     with pytest.raises(ThriftCompilerError) as exc_info:
         UnionTypeSpec.compile(parse('union Primitive { string foo }'))
 
-    assert 'Please specify the numeric ID for the field' in str(exc_info)
+    assert 'Please specify the numeric ID for the field' in str(exc_info.value)
 
 
 def test_compile_with_optional_or_required(parse):
@@ -55,16 +55,16 @@ def test_compile_with_optional_or_required(parse):
     with pytest.raises(ThriftCompilerError) as exc_info:
         UnionTypeSpec.compile(parse('union Foo { 1: required string bar }'))
 
-    assert 'Field "bar" of union "Foo"' in str(exc_info)
-    assert 'is "required".' in str(exc_info)
+    assert 'Field "bar" of union "Foo"' in str(exc_info.value)
+    assert 'is "required".' in str(exc_info.value)
 
 
 def test_compile_with_default_value(parse):
     with pytest.raises(ThriftCompilerError) as exc_info:
         UnionTypeSpec.compile(parse('union Foo { 1: string bar = "baz" }'))
 
-    assert 'Field "bar" of union "Foo"' in str(exc_info)
-    assert 'has a default value' in str(exc_info)
+    assert 'Field "bar" of union "Foo"' in str(exc_info.value)
+    assert 'has a default value' in str(exc_info.value)
 
 
 def test_compile_with_duplicate_field_ids(parse):
@@ -72,8 +72,8 @@ def test_compile_with_duplicate_field_ids(parse):
         UnionTypeSpec.compile(
             parse('union Foo { 1: string bar; 1: i32 baz }')
         )
-    assert 'Field ID "1" of union "Foo"' in str(exc_info)
-    assert 'has already been used' in str(exc_info)
+    assert 'Field ID "1" of union "Foo"' in str(exc_info.value)
+    assert 'has already been used' in str(exc_info.value)
 
 
 def test_compile_with_duplicate_names(parse):
@@ -82,8 +82,8 @@ def test_compile_with_duplicate_names(parse):
             parse('union Foo { 1: string bar; 2: i32 bar }')
         )
 
-    assert 'Field "bar" of union "Foo"' in str(exc_info)
-    assert 'has duplicates' in str(exc_info)
+    assert 'Field "bar" of union "Foo"' in str(exc_info.value)
+    assert 'has duplicates' in str(exc_info.value)
 
 
 def test_compile(parse):
@@ -183,19 +183,19 @@ def test_constructor(loads):
 
     with pytest.raises(TypeError) as exc_info:
         Foo()
-    assert 'Exactly one non-None value is required' in str(exc_info)
+    assert 'Exactly one non-None value is required' in str(exc_info.value)
 
     with pytest.raises(TypeError) as exc_info:
         Foo(unknown=42)
-    assert 'unexpected keyword argument "unknown"' in str(exc_info)
+    assert 'unexpected keyword argument "unknown"' in str(exc_info.value)
 
     with pytest.raises(TypeError) as exc_info:
         Foo(42)
-    assert 'does not accept any positional arguments' in str(exc_info)
+    assert 'does not accept any positional arguments' in str(exc_info.value)
 
     with pytest.raises(TypeError) as exc_info:
         Foo(s='foo', i=42)
-    assert 'received multiple values' in str(exc_info)
+    assert 'received multiple values' in str(exc_info.value)
 
 
 def test_validate(loads):
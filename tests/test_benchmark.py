@@ -43,12 +43,15 @@ def module(request):
         }
 
         struct Graph { 1: required list<Edge> edges }
+
+        struct Blobs { 1: required list<binary> blobs }
     ''')
 
 
 @pytest.fixture(params=[
     'primitive_containers',
     'nested_structs',
+    'large_binaries',
 ])
 def value(module, request):
     if request.param == 'primitive_containers':
@@ -64,6 +67,9 @@ def value(module, request):
                 end=module.Point(1.23, 4.56),
             ) for i in range(1000)
         ])
+    elif request.param == 'large_binaries':
+        # ~4MB payload; well past the size at which WriteBuffers are pooled.
+        return module.Blobs(blobs=[b'x' * 4096] * 1000)
     else:
         raise NotImplementedError
 
@@ -22,8 +22,11 @@ from __future__ import absolute_import, unicode_literals, print_function
 
 import pytest
 
+from thriftrw._buffer import BufferPool
 from thriftrw._buffer import ReadBuffer
 from thriftrw._buffer import WriteBuffer
+from thriftrw._buffer import acquire_write_buffer
+from thriftrw._buffer import release_write_buffer
 from thriftrw.errors import EndOfInputError
 
 
@@ -63,6 +66,26 @@ def test_simple_read():
     assert buff.take(1) == b'd'
 
 
+@pytest.mark.parametrize('data', [
+    bytearray(b'abcd'),
+    memoryview(b'abcd'),
+    memoryview(b'xxabcdxx')[2:6],
+])
+def test_read_from_buffer_protocol(data):
+    buff = ReadBuffer(data)
+
+    assert buff.take(3) == b'abc'
+    assert buff.take(1) == b'd'
+
+    with pytest.raises(EndOfInputError):
+        buff.take(1)
+
+
+def test_read_buffer_rejects_text():
+    with pytest.raises(TypeError):
+        ReadBuffer('abcd')
+
+
 def test_write_clear():
     buff = WriteBuffer(10)
     buff.write_bytes(b'foo')
@@ -71,3 +94,91 @@ def test_write_clear():
     assert buff.value == b''
     assert buff.capacity == 10
     assert buff.length == 0
+
+
+def test_released_write_buffer_is_reused():
+    buff = acquire_write_buffer()
+    buff.write_bytes(b'foo')
+    release_write_buffer(buff)
+
+    reused = acquire_write_buffer()
+    assert reused is buff
+    assert reused.value == b''
+    release_write_buffer(reused)
+
+
+def test_large_write_buffer_is_not_reused():
+    buff = acquire_write_buffer()
+    buff.write_bytes(b'x' * (2 * 1024 * 1024))
+    release_write_buffer(buff)
+
+    other = acquire_write_buffer()
+    assert other is not buff
+    release_write_buffer(other)
+
+
+@pytest.mark.parametrize('size_hint, min_capacity', [
+    (0, 4096),
+    (10, 4096),
+    (2 * 1024 * 1024, 2 * 1024 * 1024),
+])
+def test_acquire_write_buffer_size_hint(size_hint, min_capacity):
+    buff = acquire_write_buffer(size_hint)
+    assert buff.length == 0
+    assert buff.capacity >= min_capacity
+    release_write_buffer(buff)
+
+
+def test_write_buffer_memoryview():
+    buff = WriteBuffer(10)
+    buff.write_bytes(b'hello')
+
+    view = memoryview(buff)
+    assert view.readonly
+    assert view.tobytes() == b'hello'
+    view.release()
+
+
+def test_exported_write_buffer_does_not_move():
+    buff = WriteBuffer(8)
+    buff.write_bytes(b'hello')
+    view = memoryview(buff)
+
+    buff.write_bytes(b'!!')  # fits; no reallocation needed
+    with pytest.raises(BufferError):
+        buff.write_bytes(b'world')
+    with pytest.raises(BufferError):
+        buff.clear()
+    assert view.tobytes() == b'hello'
+
+    view.release()
+    buff.write_bytes(b'world')
+    assert buff.value == b'hello!!world'
+
+
+def test_buffer_pool():
+    pool = BufferPool(size=1)
+    first = pool.get()
+    second = pool.get()
+    first.write_bytes(b'foo')
+
+    pool.put(first)
+    pool.put(second)  # pool is full; dropped
+
+    buff = pool.get()
+    assert buff is first
+    assert buff.value == b''
+    assert pool.get() is not second
+
+
+def test_buffer_pool_rejects_exported_buffer():
+    pool = BufferPool()
+    buff = pool.get()
+    buff.write_bytes(b'foo')
+
+    view = memoryview(buff)
+    with pytest.raises(BufferError):
+        pool.put(buff)
+
+    view.release()
+    pool.put(buff)
@@ -53,7 +53,7 @@ def test_load_from_file_missing_requiredness(tmpdir):
 
     assert (
         '"b" of "Foo" on line 4 does not explicitly specify requiredness.'
-        in str(exc_info)
+        in str(exc_info.value)
     )
 
 
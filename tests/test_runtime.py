@@ -20,8 +20,11 @@
 
 from __future__ import absolute_import, unicode_literals, print_function
 
+import io
+
 import pytest
 
+from thriftrw import BufferPool
 from thriftrw.loader import Loader
 from thriftrw.protocol import BinaryProtocol
 from thriftrw.wire import mtype
@@ -47,60 +50,58 @@ Service = service.Service
 
 
 @pytest.mark.parametrize('name, seqid, typ, obj, bs', [
-    (b'write', 42, mtype.ONEWAY, Service.write.request(b'hello'), [
-        0x00, 0x00, 0x00, 0x05,         # length:4 = 5
-        0x77, 0x72, 0x69, 0x74, 0x65,   # 'write'
-        0x04,                           # mtype:1 = ONEWAY
-        0x00, 0x00, 0x00, 0x2a,         # seqid:4 = 42
-
-        0x0B,                           # ttype:1 = BINARY
-        0x00, 0x01,                     # id:2 = 1
-        0x00, 0x00, 0x00, 0x05,         # length:4 = 5
-        0x68, 0x65, 0x6c, 0x6c, 0x6f,   # 'hello'
-
-        0x00,                           # STOP
-    ]),
-    (b'read', 127, mtype.CALL, Service.read.request(), [
-        0x00, 0x00, 0x00, 0x04,         # length:4 = 5
-        0x72, 0x65, 0x61, 0x64,         # 'read'
-        0x01,                           # CALL
-        0x00, 0x00, 0x00, 0x7f,         # seqid:4 = 127
-        0x00,                           # STOP
-    ]),
-    (b'read', 127, mtype.REPLY, Service.read.response(success=42), [
-        0x00, 0x00, 0x00, 0x04,         # length:4 = 5
-        0x72, 0x65, 0x61, 0x64,         # 'read'
-        0x02,                           # REPLY
-        0x00, 0x00, 0x00, 0x7f,         # seqid:4 = 127
-
-        0x08,                           # ttype:1 = i32
-        0x00, 0x00,                     # id:2 = 0
-        0x00, 0x00, 0x00, 0x2a,         # value = 42
-
-        0x00,                           # STOP
-    ]),
+    (b'write', 42, mtype.ONEWAY, Service.write.request(b'hello'), (
+        b'\x00\x00\x00\x05'             # length:4 = 5
+        b'\x77\x72\x69\x74\x65'         # 'write'
+        b'\x04'                         # mtype:1 = ONEWAY
+        b'\x00\x00\x00\x2a'             # seqid:4 = 42
+
+        b'\x0b'                         # ttype:1 = BINARY
+        b'\x00\x01'                     # id:2 = 1
+        b'\x00\x00\x00\x05'             # length:4 = 5
+        b'\x68\x65\x6c\x6c\x6f'         # 'hello'
+
+        b'\x00'                         # STOP
+    )),
+    (b'read', 127, mtype.CALL, Service.read.request(), (
+        b'\x00\x00\x00\x04'             # length:4 = 5
+        b'\x72\x65\x61\x64'             # 'read'
+        b'\x01'                         # CALL
+        b'\x00\x00\x00\x7f'             # seqid:4 = 127
+        b'\x00'                         # STOP
+    )),
+    (b'read', 127, mtype.REPLY, Service.read.response(success=42), (
+        b'\x00\x00\x00\x04'             # length:4 = 5
+        b'\x72\x65\x61\x64'             # 'read'
+        b'\x02'                         # REPLY
+        b'\x00\x00\x00\x7f'             # seqid:4 = 127
+
+        b'\x08'                         # ttype:1 = i32
+        b'\x00\x00'                     # id:2 = 0
+        b'\x00\x00\x00\x2a'             # value = 42
+
+        b'\x00'                         # STOP
+    )),
     (
         b'read',
         42,
         mtype.REPLY,
         Service.read.response(sadness=service.GreatSadness()),
-        [
-            0x00, 0x00, 0x00, 0x04,         # length:4 = 5
-            0x72, 0x65, 0x61, 0x64,         # 'read'
-            0x02,                           # REPLY
-            0x00, 0x00, 0x00, 0x2a,         # seqid:4 = 42
-
-            0x0C,                           # ttype:1 = struct
-            0x00, 0x01,                     # id:2 = 1
-            0x00,                           # STOP
-
-            0x00,                           # STOP
-        ],
+        (
+            b'\x00\x00\x00\x04'             # length:4 = 5
+            b'\x72\x65\x61\x64'             # 'read'
+            b'\x02'                         # REPLY
+            b'\x00\x00\x00\x2a'             # seqid:4 = 42
+
+            b'\x0c'                         # ttype:1 = struct
+            b'\x00\x01'                     # id:2 = 1
+            b'\x00'                         # STOP
+
+            b'\x00'                         # STOP
+        ),
     ),
 ])
 def test_message_round_trips(name, seqid, typ, obj, bs):
-    bs = bytes(bytearray(bs))
-
     assert service.dumps.message(obj, seqid) == bs
 
     message = service.loads.message(Service, bs)
@@ -108,3 +109,52 @@ def test_message_round_trips(name, seqid, typ, obj, bs):
     assert message.message_type == typ
     assert message.name == name
     assert message.body == obj
+
+    message = service.loads.message(Service, memoryview(bs))
+    assert message.body == obj
+
+    out = bytearray(b'prefix')
+    assert service.dumps.message_into(out, obj, seqid) == len(bs)
+    assert out == b'prefix' + bs
+
+    out = io.BytesIO()
+    assert service.dumps.message_into(out, obj, seqid) == len(bs)
+    assert out.getvalue() == bs
+
+    pool = BufferPool()
+    out = pool.get()
+    assert service.dumps.message_into(out, obj, seqid) == len(bs)
+    assert bytes(memoryview(out)) == bs
+    pool.put(out)
+
+
+def test_message_into_exported_bytearray():
+    out = bytearray(b'prefix')
+    view = memoryview(out)
+    with pytest.raises(BufferError):
+        service.dumps.message_into(out, Service.read.request())
+    assert out == b'prefix'
+    view.release()
+
+
+def test_message_into_write_buffer_rolls_back_on_error():
+    pool = BufferPool()
+    out = pool.get()
+    out.write_bytes(b'prefix')
+    capacity = out.capacity
+
+    request = Service.write.request(b'hello')
+    request.data = 42
+    with pytest.raises(TypeError):
+        service.dumps.message_into(out, request)
+
+    assert out.value == b'prefix'
+    assert out.capacity == capacity
+    pool.put(out)
+
+
+def test_message_into_rejects_non_messages():
+    out = bytearray()
+    with pytest.raises(TypeError):
+        service.dumps.message_into(out, service.GreatSadness())
+    assert out == b''
@@ -35,6 +35,7 @@ from thriftrw.wire.value import _ValueVisitorArgs
     (value.I16Value(1234), 'visit_i16', (1234,)),
     (value.I32Value(39813), 'visit_i32', (39813,)),
     (value.I64Value(198735315), 'visit_i64', (198735315,)),
+    (value.I64Value(-(1 << 63)), 'visit_i64', (-(1 << 63),)),
     (value.BinaryValue(b'hello world'), 'visit_binary', (b'hello world',)),
 
     # Struct
@@ -106,3 +107,34 @@ def test_struct_get():
     ]) == struct.get(3, ttype.LIST).value
 
     assert not struct.get(1, ttype.BINARY)
+
+
+@pytest.mark.parametrize('num_fields', [3, 100])
+def test_struct_get_last_duplicate_wins(num_fields):
+    fields = [
+        value.FieldValue(i, ttype.I32, value.I32Value(i))
+        for i in range(num_fields)
+    ]
+    fields.append(value.FieldValue(1, ttype.I32, value.I32Value(-1)))
+    struct = value.StructValue(fields)
+
+    assert struct.get(1, ttype.I32).value == value.I32Value(-1)
+    assert struct.get(num_fields - 1, ttype.I32).value == (
+        value.I32Value(num_fields - 1)
+    )
+    assert struct.get(num_fields, ttype.I32) is None
+    assert struct.get(1, ttype.I64) is None
+    assert struct.get(2 ** 70, ttype.I32) is None
+    assert struct.get('1', ttype.I32) is None
+    assert struct.get(None, None) is None
+
+
+@pytest.mark.parametrize('fields', [
+    [object(), 'x'],
+    [1.0],
+    [value.FieldValue(1, ttype.I32, value.I32Value(1))] * 16 + [1.0],
+])
+def test_struct_get_rejects_non_fields(fields):
+    struct = value.StructValue(fields)
+    with pytest.raises(TypeError):
+        struct.get(0, 0)
@@ -22,12 +22,16 @@
 .. autofunction:: load
 
 .. autofunction:: install
+
+.. autoclass:: BufferPool
+    :members: get, put
 """
 from __future__ import absolute_import, unicode_literals, print_function
 
 from .loader import load
 from .loader import install
+from ._buffer import BufferPool
 
 __version__ = '1.9.0'
 
-__all__ = ['load', 'install']
+__all__ = ['load', 'install', 'BufferPool']
@@ -25,9 +25,9 @@ cdef class ReadBuffer(object):
     cdef char* data
     cdef int offset, length
 
-    cdef bytes _data
-    # a reference to the original PyObject is required to ensure that the
-    # underlying char* doesn't go away.
+    cdef Py_buffer _view
+    # the buffer view holds a reference to the original PyObject to ensure
+    # that the underlying char* doesn't go away.
 
     cpdef void read(self, char* dest, int count) except *
 
@@ -40,10 +40,27 @@ cdef class WriteBuffer(object):
     cdef char* data
     cdef readonly int length, capacity
 
-    cpdef void clear(self)
+    # Number of buffer protocol views currently exported.
+    cdef int _exports
 
-    cpdef void write_bytes(self, bytes data)
+    cpdef void clear(self) except *
 
-    cdef void write(self, char* data, int count)
+    cpdef void write_bytes(self, bytes data) except *
 
-    cdef void ensure_capacity(self, int min_bytes)
+    cdef int write(self, char* data, int count) except -1
+
+    cdef int ensure_capacity(self, int min_bytes) except -1
+
+
+cdef class BufferPool(object):
+    cdef readonly int size, max_capacity
+    cdef list _buffers
+
+    cpdef WriteBuffer get(self, int size_hint=*)
+
+    cpdef void put(self, WriteBuffer buff) except *
+
+
+cpdef WriteBuffer acquire_write_buffer(int size_hint=*)
+
+cpdef void release_write_buffer(WriteBuffer buff) except *
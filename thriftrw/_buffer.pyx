@@ -20,6 +20,12 @@
 
 from __future__ import absolute_import, unicode_literals, print_function
 
+from cpython.buffer cimport (
+    PyObject_GetBuffer,
+    PyBuffer_FillInfo,
+    PyBuffer_Release,
+    PyBUF_SIMPLE,
+)
 from cpython.mem cimport (
     PyMem_Malloc,
     PyMem_Realloc,
@@ -31,6 +37,12 @@ from .errors import EndOfInputError
 
 cdef int DEFAULT_CAPACITY = 4096  # 4k
 
+# Released WriteBuffers are kept around for reuse by acquire_write_buffer.
+cdef int POOL_SIZE = 16
+cdef int POOL_MAX_CAPACITY = 1024 * 1024  # 1M
+
+cdef BufferPool _write_buffer_pool = BufferPool(POOL_SIZE, POOL_MAX_CAPACITY)
+
 
 cdef class WriteBuffer(object):
     """A write-only in-memory buffer.
@@ -39,6 +51,11 @@ cdef class WriteBuffer(object):
 
     The ``value`` attribute makes all data written to the buffer so far
     available as a Python ``bytes`` object.
+
+    .. versionchanged:: 1.10
+
+        Supports the buffer protocol, so ``memoryview(buff)`` gives a
+        read-only view of the data written so far without copying it.
     """
 
     def __cinit__(self, int init_capacity=0):
@@ -57,14 +74,29 @@ cdef class WriteBuffer(object):
             PyMem_Free(self.data)
             self.data = NULL
 
-    cpdef void clear(self):
-        """Clears the buffer."""
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        PyBuffer_FillInfo(buffer, self, self.data, self.length, 1, flags)
+        self._exports += 1
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        self._exports -= 1
+
+    cpdef void clear(self) except *:
+        """Clears the buffer.
+
+        :raises BufferError:
+            If views of the buffer's contents are still held.
+        """
+        if self._exports:
+            raise BufferError(
+                'Cannot clear a WriteBuffer while views of it exist.'
+            )
 
         capacity = self.length + self.capacity
         self.length = 0
         self.capacity = capacity
 
-    cpdef void write_bytes(self, bytes data):
+    cpdef void write_bytes(self, bytes data) except *:
         """Writes the given Python bytes object to the buffer.
 
         :param bytes data:
@@ -72,7 +104,7 @@ cdef class WriteBuffer(object):
         """
         self.write(data, len(data))
 
-    cdef void write(self, char* data, int count):
+    cdef int write(self, char* data, int count) except -1:
         """Writes bytes from the given memory block to the buffer.
 
         :param int data:
@@ -85,13 +117,23 @@ cdef class WriteBuffer(object):
         memcpy(self.data + self.length, data, count)
         self.length += count
         self.capacity -= count
+        return 0
 
-    cdef void ensure_capacity(self, int min_bytes):
+    cdef int ensure_capacity(self, int min_bytes) except -1:
         """Ensures that the buffer has enough room for at least ``min_bytes``
         more bytes.
+
+        :raises BufferError:
+            If the buffer needs to grow while views of its contents are held.
+            Growing may move the data, which would leave the views dangling.
         """
         if min_bytes <= self.capacity:
-            return
+            return 0
+
+        if self._exports:
+            raise BufferError(
+                'Cannot grow a WriteBuffer while views of it exist.'
+            )
 
         cdef int new_total_length = self.length * 2
         if new_total_length - self.length < min_bytes:
@@ -99,8 +141,12 @@ cdef class WriteBuffer(object):
             # add just enough room on top.
             new_total_length += min_bytes
 
-        self.data = <char*>PyMem_Realloc(self.data, new_total_length)
+        cdef char* data = <char*>PyMem_Realloc(self.data, new_total_length)
+        if data == NULL:
+            raise MemoryError()
+        self.data = data
         self.capacity = new_total_length - self.length
+        return 0
 
     property value:
         """Data written to the buffer so far."""
@@ -110,20 +156,118 @@ cdef class WriteBuffer(object):
             return out
 
 
+cdef class BufferPool(object):
+    """A pool of reusable :py:class:`WriteBuffer` objects.
+
+    This may be used with ``dumps.message_into`` to serialize messages into
+    pooled buffers and hand them to the network layer without copying.
+
+    .. code-block:: python
+
+        pool = BufferPool()
+
+        buff = pool.get()
+        try:
+            service.dumps.message_into(buff, response, seqid)
+            sock.sendall(memoryview(buff))
+        finally:
+            pool.put(buff)
+
+    A buffer must not be used, and no views of it may be retained, after it
+    has been returned to the pool with :py:meth:`put`.
+
+    .. versionadded:: 1.10
+    """
+
+    def __cinit__(self, int size=16, int max_capacity=1024 * 1024):
+        """
+        :param int size:
+            Maximum number of idle buffers kept in the pool.
+        :param int max_capacity:
+            Buffers that grew beyond this many bytes are discarded instead of
+            being returned to the pool so that a single large payload doesn't
+            hold on to memory forever.
+        """
+        self.size = size
+        self.max_capacity = max_capacity
+        self._buffers = []
+
+    cpdef WriteBuffer get(self, int size_hint=0):
+        """Get an empty WriteBuffer, reusing a pooled one if possible.
+
+        :param int size_hint:
+            Expected number of bytes that will be written to the buffer. The
+            buffer is sized to fit at least this many bytes upfront so that
+            large payloads don't need to be reallocated repeatedly as they
+            grow.
+        """
+        cdef WriteBuffer buff
+        if size_hint < DEFAULT_CAPACITY:
+            size_hint = DEFAULT_CAPACITY
+
+        if self._buffers:
+            buff = <WriteBuffer>self._buffers.pop()
+            buff.ensure_capacity(size_hint)
+            return buff
+        return WriteBuffer(size_hint)
+
+    cpdef void put(self, WriteBuffer buff) except *:
+        """Return a WriteBuffer obtained from :py:meth:`get` to the pool.
+
+        The buffer is cleared and must not be used by the caller afterwards.
+
+        :raises BufferError:
+            If views of the buffer's contents are still held.
+        """
+        buff.clear()
+        if (
+            len(self._buffers) < self.size and
+            buff.capacity <= self.max_capacity
+        ):
+            self._buffers.append(buff)
+
+
+cpdef WriteBuffer acquire_write_buffer(int size_hint=0):
+    """Get an empty WriteBuffer from the internal pool.
+
+    Buffers obtained this way should be returned with
+    :py:func:`release_write_buffer` once their contents have been copied out.
+
+    See :py:meth:`BufferPool.get`.
+    """
+    return _write_buffer_pool.get(size_hint)
+
+
+cpdef void release_write_buffer(WriteBuffer buff) except *:
+    """Return a WriteBuffer obtained from :py:func:`acquire_write_buffer`.
+
+    The buffer is cleared and must not be used by the caller afterwards.
+    """
+    _write_buffer_pool.put(buff)
+
+
 cdef class ReadBuffer(object):
     """A read-only in-memory buffer."""
 
-    def __cinit__(self, bytes data):
+    def __cinit__(self, data):
         """Initialize a ReadBuffer that reads from the given ``bytes``.
 
-        :param bytes data:
+        .. versionchanged:: 1.10
+
+            Accepts any object supporting the buffer protocol, such as
+            ``bytearray`` or ``memoryview``. The data is not copied.
+
+        :param data:
             Block of data that this read buffer will yield.
         """
-        self._data = data
-        self.data = data
+        PyObject_GetBuffer(data, &self._view, PyBUF_SIMPLE)
+        self.data = <char*>self._view.buf
 
         self.offset = 0
-        self.length = len(data)
+        self.length = self._view.len
+
+    def __dealloc__(self):
+        PyBuffer_Release(&self._view)
 
     cpdef void read(self, char* dest, int count) except *:
         """Reads ``count`` bytes into ``dest``.
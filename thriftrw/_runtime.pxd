@@ -22,6 +22,7 @@ from __future__ import absolute_import, unicode_literals, print_function
 
 from libc.stdint cimport int32_t
 
+from thriftrw._buffer cimport WriteBuffer
 from thriftrw.wire.message cimport Message
 from thriftrw.protocol.core cimport Protocol
 
@@ -29,14 +30,25 @@ from thriftrw.protocol.core cimport Protocol
 cdef class Serializer(object):
     cdef readonly Protocol protocol
 
+    # Length of the last payload produced. Used to size the next buffer.
+    cdef int _size_hint
+
     cpdef bytes dumps(self, obj)
 
     cpdef bytes message(self, obj, int32_t seqid=*)
 
+    cpdef Py_ssize_t message_into(self, out, obj, int32_t seqid=*) except -1
+
+    cdef void _write_message(
+        self, WriteBuffer buff, obj, int32_t seqid
+    ) except *
+
 
 cdef class Deserializer(object):
     cdef readonly Protocol protocol
 
-    cpdef object loads(self, obj_cls, bytes s)
+    cpdef object loads(self, obj_cls, s)
+
+    cpdef object lazy(self, obj_cls, s)
 
-    cpdef Message message(self, service, bytes s)
+    cpdef Message message(self, service, s)
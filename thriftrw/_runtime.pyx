@@ -24,8 +24,18 @@ Provides functionality that is used exclusively at runtime.
 from __future__ import absolute_import, unicode_literals, print_function
 
 from libc.stdint cimport int32_t
+from libc.string cimport memcpy
+from cpython.bytearray cimport (
+    PyByteArray_AS_STRING,
+    PyByteArray_GET_SIZE,
+)
 
-from thriftrw._buffer cimport WriteBuffer, ReadBuffer
+from thriftrw._buffer cimport (
+    WriteBuffer,
+    ReadBuffer,
+    acquire_write_buffer,
+    release_write_buffer,
+)
 from thriftrw.protocol.core cimport (
     Protocol,
     ProtocolWriter,
@@ -35,6 +45,7 @@ from thriftrw.protocol.core cimport (
 from thriftrw.wire cimport mtype
 from thriftrw.wire cimport ttype
 from thriftrw.wire.value cimport Value, StructValue
+from thriftrw.spec.struct cimport LazyStruct
 from thriftrw.spec.service import (
     FunctionArgsSpec,
     FunctionResultSpec,
@@ -44,6 +55,12 @@ from thriftrw.errors import (
     UnknownExceptionError,
 )
 
+
+cdef extern from "Python.h":
+    # Cython's declaration doesn't propagate errors. Resizing fails if views
+    # of the bytearray are held.
+    int PyByteArray_Resize(object bytearray, Py_ssize_t len) except -1
+
 cdef class Serializer(object):
     def __cinit__(self, Protocol protocol):
         self.protocol = protocol
@@ -60,11 +77,15 @@ cdef class Serializer(object):
         return self.dumps(obj)
 
     cpdef bytes dumps(self, obj):
-        cdef WriteBuffer buff = WriteBuffer()
+        cdef WriteBuffer buff = acquire_write_buffer(self._size_hint)
         cdef ProtocolWriter writer = self.protocol.writer(buff)
 
-        obj.__class__.type_spec.write_to(writer, obj)
-        return buff.value
+        try:
+            obj.__class__.type_spec.write_to(writer, obj)
+            self._size_hint = buff.length
+            return buff.value
+        finally:
+            release_write_buffer(buff)
 
     cpdef bytes message(self, obj, int32_t seqid=0):
         """Serializes the given request or response into a Thrift Message.
@@ -77,6 +98,72 @@ cdef class Serializer(object):
             If given, this specifies the seqid to use for the message.
             Defaults to 0.
         """
+        cdef WriteBuffer buff = acquire_write_buffer(self._size_hint)
+        try:
+            self._write_message(buff, obj, seqid)
+            return buff.value
+        finally:
+            release_write_buffer(buff)
+
+    cpdef Py_ssize_t message_into(self, out, obj, int32_t seqid=0) except -1:
+        """Serializes the given request or response into a Thrift Message
+        and appends it to ``out``.
+
+        This behaves like :py:meth:`message` but skips building an
+        intermediate ``bytes`` object when ``out`` is a ``bytearray`` or a
+        :py:class:`thriftrw.BufferPool` buffer.
+
+        .. versionadded:: 1.10
+
+        :param out:
+            A ``bytearray`` or a buffer obtained from a
+            :py:class:`thriftrw.BufferPool` to which the message will be
+            appended, or a file-like object with a ``write`` method.
+        :param obj:
+            Request or response to serialize.
+        :param int seqid:
+            If given, this specifies the seqid to use for the message.
+            Defaults to 0.
+        :returns:
+            Number of bytes written.
+        """
+        cdef WriteBuffer buff
+        cdef Py_ssize_t offset
+
+        if isinstance(out, WriteBuffer):
+            buff = <WriteBuffer>out
+            offset = buff.length
+            try:
+                self._write_message(buff, obj, seqid)
+            except BaseException:
+                # Drop the partially written message so that the buffer
+                # holds only what was written to it before this call.
+                buff.capacity += buff.length - offset
+                buff.length = offset
+                raise
+            return buff.length - offset
+
+        buff = acquire_write_buffer(self._size_hint)
+        try:
+            self._write_message(buff, obj, seqid)
+            if isinstance(out, bytearray):
+                offset = PyByteArray_GET_SIZE(out)
+                PyByteArray_Resize(out, offset + buff.length)
+                memcpy(
+                    PyByteArray_AS_STRING(out) + offset,
+                    buff.data,
+                    buff.length,
+                )
+            else:
+                out.write(buff.value)
+            return buff.length
+        finally:
+            release_write_buffer(buff)
+
+    cdef void _write_message(
+        self, WriteBuffer buff, obj, int32_t seqid
+    ) except *:
+        cdef int start = buff.length
         obj_spec = obj.__class__.type_spec
 
         if isinstance(obj_spec, FunctionArgsSpec):
@@ -95,33 +182,32 @@ cdef class Serializer(object):
             )
 
         cdef bytes name
-        if isinstance(function_spec.name, unicode):
+        if isinstance(function_spec.name, str):
             name = function_spec.name.encode('utf-8')
         else:
             name = function_spec.name
 
-        cdef WriteBuffer buff = WriteBuffer()
         cdef ProtocolWriter writer = self.protocol.writer(buff)
         cdef MessageHeader header = MessageHeader(name, message_type, seqid)
 
         writer.write_message_begin(header)
         obj_spec.write_to(writer, obj)
         writer.write_message_end()
-
-        return buff.value
+        self._size_hint = buff.length - start
 
 cdef class Deserializer(object):
     def __cinit__(self, Protocol protocol):
         self.protocol = protocol
 
-    def __call__(self, obj_cls, bytes s):
+    def __call__(self, obj_cls, s):
         """Deserializes an object from the given blob.
 
         :param obj_cls:
             A class generated by thriftrw representing a struct, union, or
             exception.
-        :param bytes s:
-            Binary blob representing the object.
+        :param s:
+            Binary blob representing the object. This may be ``bytes`` or any
+            other object supporting the buffer protocol.
         :returns:
             Deserialized object.
         :raises thriftrw.errors.ThriftProtocolError:
@@ -129,12 +215,37 @@ cdef class Deserializer(object):
         """
         return self.loads(obj_cls, s)
 
-    cpdef object loads(self, obj_cls, bytes s):
+    cpdef object loads(self, obj_cls, s):
         cdef ReadBuffer buff = ReadBuffer(s)
         cdef ProtocolReader reader = self.protocol.reader(buff)
         return obj_cls.type_spec.read_from(reader)
 
-    cpdef Message message(self, service, bytes s):
+    cpdef object lazy(self, obj_cls, s):
+        """Returns a view of the struct serialized in the given blob that
+        only decodes fields when they are accessed.
+
+        This is useful when only a few fields of a large struct are needed.
+        The blob is referenced by the returned object and must not be
+        modified while it is in use.
+
+        .. versionadded:: 1.10
+
+        :param obj_cls:
+            A class generated by thriftrw representing a struct or exception.
+        :param s:
+            Binary blob representing the object. This may be ``bytes`` or any
+            other object supporting the buffer protocol.
+        :returns:
+            A :py:class:`thriftrw.spec.LazyStruct`.
+        :raises thriftrw.errors.ThriftProtocolError:
+            If the blob is not a valid serialized struct.
+        :raises TypeError:
+            If ``obj_cls`` is a union, or if a required field is missing from
+            the blob.
+        """
+        return LazyStruct(obj_cls.type_spec, self.protocol, s)
+
+    cpdef Message message(self, service, s):
         """Deserializes a message from the given blob.
 
         :param service:
@@ -142,7 +253,8 @@ cdef class Deserializer(object):
             the methods of this service will be read from the blob based on
             the message type.
         :param s:
-            Binary blob representing the message and its payload.
+            Binary blob representing the message and its payload. This may be
+            ``bytes`` or any other object supporting the buffer protocol.
         :returns:
             A Message containing the parsed request or response object in the
             ``body``.
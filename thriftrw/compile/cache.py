@@ -0,0 +1,225 @@
+# Copyright (c) 2016 Uber Technologies, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from __future__ import absolute_import, unicode_literals, print_function
+
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict, deque
+
+import thriftrw
+from thriftrw.idl import ast
+
+__all__ = ['ProgramCache', 'MemoryCache']
+
+# AST node classes by name. Only these may be instantiated when an entry is
+# read back from disk.
+_NODES = dict(
+    (name, getattr(ast, name))
+    for name in ast.__all__
+    if hasattr(getattr(ast, name), '_fields')
+)
+
+# Digest of the shape of the AST. Entries written for a different set of
+# nodes or fields are never read back.
+_AST_FORMAT = hashlib.sha1(json.dumps(
+    sorted((name, cls._fields) for name, cls in _NODES.items())
+).encode('utf-8')).hexdigest()
+
+
+def default_cache_dir():
+    """Returns the directory in which parsed programs are cached by default.
+
+    This is the value of the ``THRIFTRW_CACHE_DIR`` environment variable, or
+    None if it isn't set, in which case programs aren't cached on disk.
+    """
+    return os.getenv('THRIFTRW_CACHE_DIR') or None
+
+
+def _encode(value):
+    # Converts a program into something the json module can serialize.
+    if isinstance(value, tuple) and type(value).__name__ in _NODES:
+        return {'node': [
+            type(value).__name__, [_encode(v) for v in value]
+        ]}
+    elif isinstance(value, tuple):
+        return {'tuple': [_encode(v) for v in value]}
+    elif isinstance(value, list):
+        return [_encode(v) for v in value]
+    elif isinstance(value, deque):
+        return {'deque': [_encode(v) for v in value]}
+    elif isinstance(value, dict):
+        return {'dict': [[_encode(k), _encode(v)] for k, v in value.items()]}
+    elif value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    raise TypeError('Cannot cache value %r' % (value,))
+
+
+def _decode(value):
+    # Inverse of _encode.
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    elif not isinstance(value, dict):
+        return value
+
+    (kind, contents), = value.items()
+    if kind == 'node':
+        name, fields = contents
+        return _NODES[name](*[_decode(v) for v in fields])
+    elif kind == 'tuple':
+        return tuple(_decode(v) for v in contents)
+    elif kind == 'deque':
+        return deque(_decode(v) for v in contents)
+    elif kind == 'dict':
+        return dict((_decode(k), _decode(v)) for k, v in contents)
+    raise ValueError('Unknown cache entry kind %r' % kind)
+
+
+def _digest(contents):
+    return hashlib.sha1(contents.encode('utf-8')).hexdigest()
+
+
+class MemoryCache(object):
+    """In-memory cache of parsed Thrift programs.
+
+    Entries are keyed by a digest of the Thrift document so that large
+    documents aren't kept alive by the cache. At most ``maxsize`` programs
+    are retained; the least recently used entry is evicted first. The cache
+    is safe to share between threads.
+    """
+
+    __slots__ = ('maxsize', '_programs', '_lock')
+
+    def __init__(self, maxsize):
+        """
+        :param int maxsize:
+            Maximum number of programs held by the cache.
+        """
+        self.maxsize = maxsize
+        self._programs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._programs)
+
+    def get(self, contents):
+        """Returns the cached program for the given document or None.
+
+        :param str contents:
+            Thrift document.
+        """
+        key = _digest(contents)
+        with self._lock:
+            program = self._programs.get(key)
+            if program is not None:
+                self._programs.move_to_end(key)
+            return program
+
+    def put(self, contents, program):
+        """Caches the parsed program for the given document.
+
+        :param str contents:
+            Thrift document.
+        :param thriftrw.idl.Program program:
+            Program parsed from ``contents``.
+        """
+        key = _digest(contents)
+        with self._lock:
+            self._programs[key] = program
+            self._programs.move_to_end(key)
+            while len(self._programs) > self.maxsize:
+                self._programs.popitem(last=False)
+
+    def clear(self):
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._programs.clear()
+
+
+class ProgramCache(object):
+    """On-disk cache of parsed Thrift programs.
+
+    Programs are stored as JSON so that reading an entry never executes code.
+    Entries are keyed by the thriftrw version, the shape of the AST, and the
+    contents of the Thrift document so a changed file or a thriftrw upgrade
+    never yields a stale AST. Unreadable or corrupt entries are treated as
+    misses.
+    """
+
+    __slots__ = ('directory',)
+
+    def __init__(self, directory):
+        """
+        :param str directory:
+            Directory in which cache entries are stored. It will be created
+            if it doesn't already exist.
+        """
+        self.directory = directory
+
+    def _path(self, contents):
+        digest = hashlib.sha1()
+        digest.update(thriftrw.__version__.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(_AST_FORMAT.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(contents.encode('utf-8'))
+        return os.path.join(self.directory, digest.hexdigest() + '.json')
+
+    def get(self, contents):
+        """Returns the cached program for the given document or None.
+
+        :param str contents:
+            Thrift document.
+        """
+        try:
+            with open(self._path(contents), 'r') as f:
+                return _decode(json.load(f))
+        except Exception:
+            return None
+
+    def put(self, contents, program):
+        """Caches the parsed program for the given document.
+
+        Failures to write the cache are ignored.
+
+        :param str contents:
+            Thrift document.
+        :param thriftrw.idl.Program program:
+            Program parsed from ``contents``.
+        """
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+
+            # Write to a temporary file first so that concurrent readers
+            # never see a partially written entry.
+            fd, tmp = tempfile.mkstemp(dir=self.directory)
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(_encode(program), f)
+                os.replace(tmp, self._path(contents))
+            except Exception:
+                os.unlink(tmp)
+                raise
+        except Exception:
+            pass
@@ -23,6 +23,9 @@ from __future__ import absolute_import, unicode_literals, print_function
 import os.path
 
 from .scope import Scope
+from .cache import MemoryCache
+from .cache import ProgramCache
+from .cache import default_cache_dir
 from .generate import Generator
 from .link import TypeSpecLinker
 from .link import ConstSpecLinker
@@ -37,6 +40,10 @@ __all__ = ['Compiler']
 
 LINKERS = [ConstSpecLinker, TypeSpecLinker, ServiceSpecLinker]
 
+# Programs parsed from Thrift files by any Compiler in this process, keyed by
+# the contents of the file. ASTs are immutable, so they're safe to share.
+_PROGRAMS = MemoryCache(maxsize=256)
+
 
 class ModuleSpec(object):
     """Specification for a single module."""
@@ -139,26 +146,45 @@ class Compiler(object):
     """Compiles IDLs into Python modules."""
 
     __slots__ = (
-        'protocol', 'strict', 'parser', 'include_as', '_module_specs'
+        'protocol', 'strict', 'parser', 'include_as', 'cache_dir', 'cache',
+        '_module_specs'
     )
 
-    def __init__(self, protocol, strict=None, include_as=None):
+    def __init__(self, protocol, strict=None, include_as=None,
+                 cache_dir=None, cache=None):
         """Initialize the compiler.
 
         :param thriftrw.protocol.Protocol protocol:
            The protocol ot use to serialize and deserialize values.
+        :param str cache_dir:
+           Directory in which programs parsed from Thrift files are cached
+           between runs. Defaults to the ``THRIFTRW_CACHE_DIR`` environment
+           variable. Programs are not cached on disk if neither is set.
+        :param bool cache:
+           Whether programs parsed from Thrift files are cached. If enabled,
+           a file whose contents were already parsed in this process, or are
+           in ``cache_dir``, is not parsed again. Defaults to ``include_as``,
+           or to True if a cache directory was configured.
         """
         if strict is None:
             strict = True
         if include_as is None:
             include_as = False
+        if cache is None:
+            # The cache costs a digest of every file loaded, which is wasted
+            # on programs that load each file once. Enable it where files
+            # are commonly shared: include-as setups, or when asked to cache
+            # on disk.
+            cache = include_as or bool(cache_dir or default_cache_dir())
         self.protocol = protocol
         self.strict = strict
         self.include_as = include_as
+        self.cache_dir = cache_dir
+        self.cache = cache
 
         self.parser = Parser()
 
-        # Mapping from absolute file path to ModuleSpec for all modules.
+        # Mapping from resolved file path to ModuleSpec for all modules.
         self._module_specs = {}
 
     def compile(self, name, contents, path=None):
@@ -247,25 +273,40 @@ class Compiler(object):
             Name of the Thrift document. This will be the name of the
             generated module.
         :param str contents:
-            Thrift document to compile
+            Thrift document to compile. If None, the document is read from
+            ``path``.
         :param str path:
             Path to the Thrift file being compiled. If not specified, imports
             from within the Thrift file will be disallowed.
         :returns:
             ModuleSpec of the generated module.
+
+        .. versionchanged:: 1.10
+
+            ``contents`` may be None. Files that were already compiled, under
+            any path resolving to the same file, are not read again.
         """
         assert name
+        assert contents is not None or path
 
+        key = None
         if path:
-            path = os.path.abspath(path)
-            if path in self._module_specs:
-                return self._module_specs[path]
+            # Every path resolving to the same file shares a single
+            # ModuleSpec, even across include cycles. Includes are still
+            # resolved relative to the path we were given.
+            key = os.path.realpath(path)
+            if key in self._module_specs:
+                return self._module_specs[key]
+
+        if contents is None:
+            with open(path, 'r') as f:
+                contents = f.read()
 
         module_spec = ModuleSpec(name, self.protocol, path, contents)
-        if path:
-            self._module_specs[path] = module_spec
+        if key:
+            self._module_specs[key] = module_spec
 
-        program = self.parser.parse(contents)
+        program = self._parse(contents, path)
 
         header_processor = HeaderProcessor(self, module_spec, self.include_as)
         for header in program.headers:
@@ -277,6 +318,30 @@ class Compiler(object):
 
         return module_spec
 
+    def _parse(self, contents, path):
+        # Only documents loaded from files are cached. Inline documents are
+        # usually small and short-lived.
+        if not (path and self.cache):
+            return self.parser.parse(contents)
+
+        program = _PROGRAMS.get(contents)
+        if program is not None:
+            return program
+
+        cache = None
+        cache_dir = self.cache_dir or default_cache_dir()
+        if cache_dir:
+            cache = ProgramCache(cache_dir)
+            program = cache.get(contents)
+
+        if program is None:
+            program = self.parser.parse(contents)
+            if cache is not None:
+                cache.put(contents, program)
+
+        _PROGRAMS.put(contents, program)
+        return program
+
 
 class HeaderProcessor(object):
     """Processes headers found in the Thrift file."""
@@ -335,10 +400,7 @@ class HeaderProcessor(object):
         if included_name is None:
             included_name = name
 
-        with open(path, 'r') as f:
-            contents = f.read()
-
-        included_module_spec = self.compiler.compile(name, contents, path)
+        included_module_spec = self.compiler.compile(name, None, path)
         self.module_spec.add_include(included_name, included_module_spec)
 
     def visit_namespace(self, namespace):
@@ -77,6 +77,8 @@ class Program(namedtuple('Program', 'headers definitions')):
         - :py:class:`Service`
     """
 
+    __slots__ = ()
+
 
 ##############################################################################
 # Headers
@@ -120,6 +122,8 @@ class Include(namedtuple('Include', 'name path lineno')):
         Added ``name`` attribute.
     """
 
+    __slots__ = ()
+
     def apply(self, visitor):
         return visitor.visit_include(self)
 
@@ -141,6 +145,8 @@ class Namespace(namedtuple('Namespace', 'scope name lineno')):
         Namespace for the specified scope.
     """
 
+    __slots__ = ()
+
     def apply(self, visitor):
         return visitor.visit_namespace(self)
 
@@ -169,6 +175,8 @@ class Const(namedtuple('Const', 'name value_type value lineno')):
         Value specified for the constant.
     """
 
+    __slots__ = ()
+
     def apply(self, visitor):
         return visitor.visit_const(self)
 
@@ -193,6 +201,8 @@ class Typedef(namedtuple('Typedef', 'name target_type annotations lineno')):
         Annotations for this type. See :py:class:`Annotation`.
     """
 
+    __slots__ = ()
+
     def apply(self, visitor):
         return visitor.visit_typedef(self)
 
@@ -220,6 +230,8 @@ class Enum(namedtuple('Enum', 'name items annotations lineno')):
         Annotations for this type. See :py:class:`Annotation`.
     """
 
+    __slots__ = ()
+
     def apply(self, visitor):
         return visitor.visit_enum(self)
 
@@ -240,6 +252,8 @@ class EnumItem(namedtuple('EnumItem', 'name value annotations lineno')):
         Annotations for this item. See :py:class:`Annotation`.
     """
 
+    __slots__ = ()
+
 
 class Struct(namedtuple('Struct', 'name fields annotations lineno')):
     """A struct is a collection of named fields.
@@ -257,6 +271,8 @@ class Struct(namedtuple('Struct', 'name fields annotations lineno')):
         Annotations for this type. See :py:class:`Annotation`.
     """
 
+    __slots__ = ()
+
     def apply(self, visitor):
         return visitor.visit_struct(self)
 
@@ -277,6 +293,8 @@ class Union(namedtuple('Union', 'name fields annotations lineno')):
         Annotations for this type. See :py:class:`Annotation`.
     """
 
+    __slots__ = ()
+
     def apply(self, visitor):
         return visitor.visit_union(self)
 
@@ -297,6 +315,8 @@ class Exc(namedtuple('Exc', 'name fields annotations lineno')):
         Annotations for this type. See :py:class:`Annotation`.
     """
 
+    __slots__ = ()
+
     def apply(self, visitor):
         return visitor.visit_exc(self)
 
@@ -312,6 +332,8 @@ class ServiceReference(namedtuple('ServiceReference', 'name lineno')):
         Name of the referenced service.
     """
 
+    __slots__ = ()
+
 
 class Service(
     namedtuple('Service', 'name functions parent annotations lineno')
@@ -337,6 +359,8 @@ class Service(
         Annotations for this service. See :py:class:`Annotation`.
     """
 
+    __slots__ = ()
+
     def apply(self, visitor):
         return visitor.visit_service(self)
 
@@ -375,6 +399,8 @@ class Function(
         Annotations for this method. See :py:class:`Annotation`.
     """
 
+    __slots__ = ()
+
 
 class Field(
     namedtuple(
@@ -410,6 +436,8 @@ class Field(
         Annotations for this field. See :py:class:`Annotation`.
     """
 
+    __slots__ = ()
+
 ##############################################################################
 # Types
 
@@ -426,6 +454,8 @@ class PrimitiveType(namedtuple('PrimitiveType', 'name annotations')):
         Annotations for this type. See :py:class:`Annotation`.
     """
 
+    __slots__ = ()
+
     def apply(self, visitor):
         return visitor.visit_primitive(self)
 
@@ -446,6 +476,8 @@ class MapType(namedtuple('MapType', 'key_type value_type annotations')):
         Annotations for this type. See :py:class:`Annotation`.
     """
 
+    __slots__ = ()
+
     def apply(self, visitor):
         return visitor.visit_map(self)
 
@@ -462,6 +494,8 @@ class SetType(namedtuple('SetType', 'value_type annotations')):
         Annotations for this type. See :py:class:`Annotation`.
     """
 
+    __slots__ = ()
+
     def apply(self, visitor):
         return visitor.visit_set(self)
 
@@ -478,6 +512,8 @@ class ListType(namedtuple('ListType', 'value_type annotations')):
         Annotations for this type. See :py:class:`Annotation`.
     """
 
+    __slots__ = ()
+
     def apply(self, visitor):
         return visitor.visit_list(self)
 
@@ -490,6 +526,8 @@ class DefinedType(namedtuple('DefinedType', 'name lineno')):
         Name of the referenced type.
     """
 
+    __slots__ = ()
+
     def apply(self, visitor):
         return visitor.visit_defined(self)
 
@@ -503,6 +541,8 @@ class DefinedType(namedtuple('DefinedType', 'name lineno')):
 class ConstValue(object):
     """Base class for constant value types."""
 
+    __slots__ = ()
+
     def apply(self, visitor):
         raise NotImplementedError
 
@@ -517,6 +557,8 @@ class ConstPrimitiveValue(
         Value held in this constant.
     """
 
+    __slots__ = ()
+
     def apply(self, visitor):
         return visitor.visit_primitive(self)
 
@@ -529,6 +571,8 @@ class ConstReference(namedtuple('ConstReference', 'name lineno'), ConstValue):
         Name of the constant or enum item.
     """
 
+    __slots__ = ()
+
     def apply(self, visitor):
         return visitor.visit_reference(self)
 
@@ -541,6 +585,8 @@ class ConstList(namedtuple('ConstList', 'values lineno'), ConstValue):
         Collection of ``ConstValue`` objects.
     """
 
+    __slots__ = ()
+
     def apply(self, visitor):
         return visitor.visit_list(self)
 
@@ -553,6 +599,8 @@ class ConstMap(namedtuple('ConstList', 'pairs lineno'), ConstValue):
         Dictionary mapping ``ConstValue`` keys to ``ConstValue`` values.
     """
 
+    __slots__ = ()
+
     def apply(self, visitor):
         return visitor.visit_map(self)
 
@@ -582,3 +630,5 @@ class Annotation(namedtuple('Annotation', 'name value lineno')):
 
         Value specified for the annotation.
     """
+
+    __slots__ = ()
@@ -32,6 +32,10 @@ from ..errors import ThriftParserError
 __all__ = ['Parser']
 
 
+# yacc parsers shared by Parser instances, keyed by (start, silent).
+_PARSERS = {}
+
+
 class ParserSpec(object):
     """Parser specification for Thrift IDL files.
 
@@ -449,13 +453,36 @@ class Parser(ParserSpec):
     """Parser for Thrift IDL files."""
 
     def __init__(self, **kwargs):
+        # Grammar actions don't depend on the Parser instance and PLY keeps
+        # parsing state in locals, so parsers built with the same options are
+        # shared. Options outside of these (debug output, writing tables,
+        # etc.) always get a fresh parser.
+        key = None
+        if set(kwargs) <= {'start', 'silent'}:
+            key = (kwargs.get('start'), bool(kwargs.get('silent')))
+
+        parser = _PARSERS.get(key) if key is not None else None
+        if parser is None:
+            parser = self._build(**kwargs)
+            if key is not None:
+                _PARSERS[key] = parser
+
+        self._parser = parser
+        self._lexer = Lexer()
+
+    def _build(self, **kwargs):
         if kwargs.pop('silent', False):
             kwargs['errorlog'] = yacc.NullLogger()
 
         kwargs.setdefault('debug', False)
         kwargs.setdefault('write_tables', False)
-        self._parser = yacc.yacc(module=self, **kwargs)
-        self._lexer = Lexer()
+        # Parsing tables for the default start symbol are shipped
+        # pre-generated so that PLY doesn't rebuild them on every import.
+        # PLY verifies the grammar signature before using them and falls
+        # back to generating fresh tables if they're stale. Run
+        # ``make parsetab`` after changing the grammar.
+        kwargs.setdefault('tabmodule', 'thriftrw.idl.parsetab')
+        return yacc.yacc(module=self, **kwargs)
 
     def parse(self, input, **kwargs):
         """Parse the given input.
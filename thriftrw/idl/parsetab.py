@@ -0,0 +1,138 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "BINARY BOOL BYTE CONST DOUBLE DUBCONSTANT ENUM EXCEPTION EXTENDS FALSE I16 I32 I64 I8 IDENTIFIER INCLUDE INTCONSTANT LIST LITERAL MAP NAMESPACE ONEWAY OPTIONAL REQUIRED SERVICE SET STRING STRUCT THROWS TRUE TYPEDEF UNION VOIDstart : header definitionheader : header_unit_ header\n                  |header_unit_ : header_unit ';'\n                        | header_unitheader_unit : include\n                       | namespaceinclude : INCLUDE IDENTIFIER LITERAL\n                   | INCLUDE LITERALnamespace : NAMESPACE namespace_scope IDENTIFIERnamespace_scope : '*'\n                           | IDENTIFIERsep : ','\n               | ';'\n        definition : definition_unit_ definition\n                      |definition_unit_ : definition_unit ';'\n                            | definition_unitdefinition_unit : const\n                           | ttype\n        const_bool : TRUE\n                      | FALSEconst : CONST field_type IDENTIFIER '=' const_value\n                 | CONST field_type IDENTIFIER '=' const_value sepconst_value : const_value_native\n                       | const_refconst_value_native : const_value_primitive\n                              | const_list\n                              | const_mapconst_value_primitive : INTCONSTANT\n                                 | DUBCONSTANT\n                                 | LITERAL\n                                 | const_boolconst_list : '[' const_list_seq ']' const_list_seq : const_value sep const_list_seq\n                          | const_value const_list_seq\n                          |const_map : '{' const_map_seq '}' const_map_seq : const_map_item sep const_map_seq\n                         | const_map_item const_map_seq\n                         |const_map_item : const_value ':' const_value const_ref : IDENTIFIERttype : typedef\n                 | enum\n                 | struct\n                 | union\n                 | exception\n                 | servicetypedef : TYPEDEF field_type IDENTIFIER annotationsenum : ENUM IDENTIFIER '{' enum_seq '}' annotationsenum_seq : enum_item sep enum_seq\n                    | enum_item enum_seq\n                    |enum_item : IDENTIFIER '=' INTCONSTANT annotations\n                     | IDENTIFIER annotationsstruct : STRUCT IDENTIFIER '{' field_seq '}' annotationsunion : UNION IDENTIFIER '{' field_seq '}' annotationsexception : EXCEPTION IDENTIFIER '{' field_seq '}' annotationsservice : SERVICE IDENTIFIER '{' function_seq '}' annotations\n                   | SERVICE IDENTIFIER EXTENDS IDENTIFIER                      '{' function_seq '}' annotations\n        oneway : ONEWAY\n                  |function : oneway function_type IDENTIFIER '(' field_seq ')'                       throws annotations function_seq : function sep function_seq\n                        | function function_seq\n                        |throws : THROWS '(' field_seq ')'\n                  |function_type : field_type\n                         | VOIDfield_seq : field sep field_seq\n                     | field field_seq\n                     |field : field_id field_req field_type IDENTIFIER annotations\n                 | field_id field_req field_type IDENTIFIER '=' const_value                    annotationsfield_id : INTCONSTANT ':'\n                    | field_req : REQUIRED\n                     | OPTIONAL\n                     |field_type : ref_type\n                      | definition_typeref_type : IDENTIFIERbase_type : BOOL annotations\n                     | BYTE annotations\n                     | I8 annotations\n                     | I16 annotations\n                     | I32 annotations\n                     | I64 annotations\n                     | DOUBLE annotations\n                     | STRING annotations\n                     | BINARY annotationscontainer_type : map_type\n                          | list_type\n                          | set_typemap_type : MAP '<' field_type ',' field_type '>' annotationslist_type : LIST '<' field_type '>' annotationsset_type : SET '<' field_type '>' annotationsdefinition_type : base_type\n                           | container_typeannotations : '(' annotation_seq ')'\n                       |annotation_seq : annotation sep annotation_seq\n                          | annotation annotation_seq\n                          |annotation : IDENTIFIER '=' LITERAL\n                      | IDENTIFIER"
+    
+_lr_action_items = {'CONST':([0,2,3,4,5,6,10,11,12,13,15,16,17,18,19,20,27,28,30,35,63,64,79,93,108,109,110,111,112,113,114,115,116,117,118,121,122,123,126,127,134,137,144,145,146,153,165,167,170,171,172,176,179,187,195,],[-3,14,-3,-5,-6,-7,14,-18,-19,-20,-44,-45,-46,-47,-48,-49,-2,-4,-9,-17,-8,-10,-103,-50,-43,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,-103,-103,-103,-103,-103,-24,-51,-57,-58,-59,-60,-34,-38,-103,-61,]),'TYPEDEF':([0,2,3,4,5,6,10,11,12,13,15,16,17,18,19,20,27,28,30,35,63,64,79,93,108,109,110,111,112,113,114,115,116,117,118,121,122,123,126,127,134,137,144,145,146,153,165,167,170,171,172,176,179,187,195,],[-3,21,-3,-5,-6,-7,21,-18,-19,-20,-44,-45,-46,-47,-48,-49,-2,-4,-9,-17,-8,-10,-103,-50,-43,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,-103,-103,-103,-103,-103,-24,-51,-57,-58,-59,-60,-34,-38,-103,-61,]),'ENUM':([0,2,3,4,5,6,10,11,12,13,15,16,17,18,19,20,27,28,30,35,63,64,79,93,108,109,110,111,112,113,114,115,116,117,118,121,122,123,126,127,134,137,144,145,146,153,165,167,170,171,172,176,179,187,195,],[-3,22,-3,-5,-6,-7,22,-18,-19,-20,-44,-45,-46,-47,-48,-49,-2,-4,-9,-17,-8,-10,-103,-50,-43,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,-103,-103,-103,-103,-103,-24,-51,-57,-58,-59,-60,-34,-38,-103,-61,]),'STRUCT':([0,2,3,4,5,6,10,11,12,13,15,16,17,18,19,20,27,28,30,35,63,64,79,93,108,109,110,111,112,113,114,115,116,117,118,121,122,123,126,127,134,137,144,145,146,153,165,167,170,171,172,176,179,187,195,],[-3,23,-3,-5,-6,-7,23,-18,-19,-20,-44,-45,-46,-47,-48,-49,-2,-4,-9,-17,-8,-10,-103,-50,-43,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,-103,-103,-103,-103,-103,-24,-51,-57,-58,-59,-60,-34,-38,-103,-61,]),'UNION':([0,2,3,4,5,6,10,11,12,13,15,16,17,18,19,20,27,28,30,35,63,64,79,93,108,109,110,111,112,113,114,115,116,117,118,121,122,123,126,127,134,137,144,145,146,153,165,167,170,171,172,176,179,187,195,],[-3,24,-3,-5,-6,-7,24,-18,-19,-20,-44,-45,-46,-47,-48,-49,-2,-4,-9,-17,-8,-10,-103,-50,-43,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,-103,-103,-103,-103,-103,-24,-51,-57,-58,-59,-60,-34,-38,-103,-61,]),'EXCEPTION':([0,2,3,4,5,6,10,11,12,13,15,16,17,18,19,20,27,28,30,35,63,64,79,93,108,109,110,111,112,113,114,115,116,117,118,121,122,123,126,127,134,137,144,145,146,153,165,167,170,171,172,176,179,187,195,],[-3,25,-3,-5,-6,-7,25,-18,-19,-20,-44,-45,-46,-47,-48,-49,-2,-4,-9,-17,-8,-10,-103,-50,-43,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,-103,-103,-103,-103,-103,-24,-51,-57,-58,-59,-60,-34,-38,-103,-61,]),'SERVICE':([0,2,3,4,5,6,10,11,12,13,15,16,17,18,19,20,27,28,30,35,63,64,79,93,108,109,110,111,112,113,114,115,116,117,118,121,122,123,126,127,134,137,144,145,146,153,165,167,170,171,172,176,179,187,195,],[-3,26,-3,-5,-6,-7,26,-18,-19,-20,-44,-45,-46,-47,-48,-49,-2,-4,-9,-17,-8,-10,-103,-50,-43,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,-103,-103,-103,-103,-103,-24,-51,-57,-58,-59,-60,-34,-38,-103,-61,]),'$end':([0,1,2,3,4,5,6,9,10,11,12,13,15,16,17,18,19,20,27,28,30,34,35,63,64,79,93,108,109,110,111,112,113,114,115,116,117,118,121,122,123,126,127,134,137,144,145,146,153,165,167,170,171,172,176,179,187,195,],[-3,0,-16,-3,-5,-6,-7,-1,-16,-18,-19,-20,-44,-45,-46,-47,-48,-49,-2,-4,-9,-15,-17,-8,-10,-103,-50,-43,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,-103,-103,-103,-103,-103,-24,-51,-57,-58,-59,-60,-34,-38,-103,-61,]),'INCLUDE':([0,3,4,5,6,28,30,63,64,],[7,7,-5,-6,-7,-4,-9,-8,-10,]),'NAMESPACE':([0,3,4,5,6,28,30,63,64,],[8,8,-5,-6,-7,-4,-9,-8,-10,]),';':([4,5,6,11,12,13,15,16,17,18,19,20,30,63,64,79,88,89,93,94,96,98,104,108,109,110,111,112,113,114,115,116,117,118,121,122,123,126,127,133,134,137,144,145,146,153,155,157,160,164,165,167,170,171,172,176,179,184,185,187,190,192,195,196,197,198,199,201,204,],[28,-6,-7,35,-19,-20,-44,-45,-46,-47,-48,-49,-9,-8,-10,-103,127,-108,-50,-103,127,127,127,-43,127,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,-56,-103,-103,-103,-103,-103,-24,127,127,-107,-103,-51,-57,-58,-59,-60,-34,-38,-55,-103,-103,-42,-75,-61,-103,-69,-76,-103,-64,-68,]),'IDENTIFIER':([7,8,14,21,22,23,24,25,26,31,32,33,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,57,66,67,68,69,70,71,72,73,74,75,76,77,78,80,81,82,83,84,85,86,88,89,94,96,98,99,104,105,106,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,126,127,129,130,131,133,135,138,140,141,142,143,147,149,150,151,152,155,157,160,162,163,164,169,176,177,179,180,182,183,184,185,186,190,191,192,193,196,197,198,199,201,202,204,],[29,32,37,37,58,59,60,61,62,64,-12,-11,65,-84,-82,-83,-100,-101,-103,-103,-103,-103,-103,-103,-103,-103,-103,-94,-95,-96,79,-85,89,-86,-87,-88,-89,-90,-91,-92,-93,37,37,37,94,-78,-78,-78,-63,107,108,89,-108,-103,94,-78,-81,-63,37,-62,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,108,108,-21,-22,-102,89,-13,-14,37,-103,-103,-56,94,-78,37,-79,-80,-77,-63,174,-70,-71,-63,108,108,-107,-98,-99,-103,185,-34,108,-38,108,108,-103,-55,-103,-78,-42,-97,-75,108,-103,-69,-76,-103,-64,-78,-68,]),'LITERAL':([7,29,86,108,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,128,155,157,176,177,179,180,182,190,193,],[30,63,117,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,117,117,-21,-22,-13,-14,160,117,117,-34,117,-38,117,117,-42,117,]),'*':([8,],[33,]),'BOOL':([14,21,76,77,78,81,82,83,84,98,99,104,105,106,108,110,111,112,113,114,115,116,117,118,121,122,123,126,127,129,138,140,141,142,143,147,152,176,179,185,186,192,196,197,198,199,201,202,204,],[42,42,42,42,42,-78,-78,-78,-63,-78,-81,-63,42,-62,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,42,-78,42,-79,-80,-77,-63,-63,-34,-38,-103,-78,-75,-103,-69,-76,-103,-64,-78,-68,]),'BYTE':([14,21,76,77,78,81,82,83,84,98,99,104,105,106,108,110,111,112,113,114,115,116,117,118,121,122,123,126,127,129,138,140,141,142,143,147,152,176,179,185,186,192,196,197,198,199,201,202,204,],[43,43,43,43,43,-78,-78,-78,-63,-78,-81,-63,43,-62,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,43,-78,43,-79,-80,-77,-63,-63,-34,-38,-103,-78,-75,-103,-69,-76,-103,-64,-78,-68,]),'I8':([14,21,76,77,78,81,82,83,84,98,99,104,105,106,108,110,111,112,113,114,115,116,117,118,121,122,123,126,127,129,138,140,141,142,143,147,152,176,179,185,186,192,196,197,198,199,201,202,204,],[44,44,44,44,44,-78,-78,-78,-63,-78,-81,-63,44,-62,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,44,-78,44,-79,-80,-77,-63,-63,-34,-38,-103,-78,-75,-103,-69,-76,-103,-64,-78,-68,]),'I16':([14,21,76,77,78,81,82,83,84,98,99,104,105,106,108,110,111,112,113,114,115,116,117,118,121,122,123,126,127,129,138,140,141,142,143,147,152,176,179,185,186,192,196,197,198,199,201,202,204,],[45,45,45,45,45,-78,-78,-78,-63,-78,-81,-63,45,-62,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,45,-78,45,-79,-80,-77,-63,-63,-34,-38,-103,-78,-75,-103,-69,-76,-103,-64,-78,-68,]),'I32':([14,21,76,77,78,81,82,83,84,98,99,104,105,106,108,110,111,112,113,114,115,116,117,118,121,122,123,126,127,129,138,140,141,142,143,147,152,176,179,185,186,192,196,197,198,199,201,202,204,],[46,46,46,46,46,-78,-78,-78,-63,-78,-81,-63,46,-62,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,46,-78,46,-79,-80,-77,-63,-63,-34,-38,-103,-78,-75,-103,-69,-76,-103,-64,-78,-68,]),'I64':([14,21,76,77,78,81,82,83,84,98,99,104,105,106,108,110,111,112,113,114,115,116,117,118,121,122,123,126,127,129,138,140,141,142,143,147,152,176,179,185,186,192,196,197,198,199,201,202,204,],[47,47,47,47,47,-78,-78,-78,-63,-78,-81,-63,47,-62,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,47,-78,47,-79,-80,-77,-63,-63,-34,-38,-103,-78,-75,-103,-69,-76,-103,-64,-78,-68,]),'DOUBLE':([14,21,76,77,78,81,82,83,84,98,99,104,105,106,108,110,111,112,113,114,115,116,117,118,121,122,123,126,127,129,138,140,141,142,143,147,152,176,179,185,186,192,196,197,198,199,201,202,204,],[48,48,48,48,48,-78,-78,-78,-63,-78,-81,-63,48,-62,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,48,-78,48,-79,-80,-77,-63,-63,-34,-38,-103,-78,-75,-103,-69,-76,-103,-64,-78,-68,]),'STRING':([14,21,76,77,78,81,82,83,84,98,99,104,105,106,108,110,111,112,113,114,115,116,117,118,121,122,123,126,127,129,138,140,141,142,143,147,152,176,179,185,186,192,196,197,198,199,201,202,204,],[49,49,49,49,49,-78,-78,-78,-63,-78,-81,-63,49,-62,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,49,-78,49,-79,-80,-77,-63,-63,-34,-38,-103,-78,-75,-103,-69,-76,-103,-64,-78,-68,]),'BINARY':([14,21,76,77,78,81,82,83,84,98,99,104,105,106,108,110,111,112,113,114,115,116,117,118,121,122,123,126,127,129,138,140,141,142,143,147,152,176,179,185,186,192,196,197,198,199,201,202,204,],[50,50,50,50,50,-78,-78,-78,-63,-78,-81,-63,50,-62,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,50,-78,50,-79,-80,-77,-63,-63,-34,-38,-103,-78,-75,-103,-69,-76,-103,-64,-78,-68,]),'MAP':([14,21,76,77,78,81,82,83,84,98,99,104,105,106,108,110,111,112,113,114,115,116,117,118,121,122,123,126,127,129,138,140,141,142,143,147,152,176,179,185,186,192,196,197,198,199,201,202,204,],[54,54,54,54,54,-78,-78,-78,-63,-78,-81,-63,54,-62,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,54,-78,54,-79,-80,-77,-63,-63,-34,-38,-103,-78,-75,-103,-69,-76,-103,-64,-78,-68,]),'LIST':([14,21,76,77,78,81,82,83,84,98,99,104,105,106,108,110,111,112,113,114,115,116,117,118,121,122,123,126,127,129,138,140,141,142,143,147,152,176,179,185,186,192,196,197,198,199,201,202,204,],[55,55,55,55,55,-78,-78,-78,-63,-78,-81,-63,55,-62,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,55,-78,55,-79,-80,-77,-63,-63,-34,-38,-103,-78,-75,-103,-69,-76,-103,-64,-78,-68,]),'SET':([14,21,76,77,78,81,82,83,84,98,99,104,105,106,108,110,111,112,113,114,115,116,117,118,121,122,123,126,127,129,138,140,141,142,143,147,152,176,179,185,186,192,196,197,198,199,201,202,204,],[56,56,56,56,56,-78,-78,-78,-63,-78,-81,-63,56,-62,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,56,-78,56,-79,-80,-77,-63,-63,-34,-38,-103,-78,-75,-103,-69,-76,-103,-64,-78,-68,]),',':([37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,66,68,69,70,71,72,73,74,75,88,89,90,94,96,98,104,108,109,110,111,112,113,114,115,116,117,118,121,122,123,130,131,133,155,157,160,162,163,164,176,179,183,184,185,190,191,192,196,197,198,199,201,204,],[-84,-82,-83,-100,-101,-103,-103,-103,-103,-103,-103,-103,-103,-103,-94,-95,-96,-85,-86,-87,-88,-89,-90,-91,-92,-93,126,-108,129,-103,126,126,126,-43,126,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-103,-103,-56,126,126,-107,-98,-99,-103,-34,-38,-103,-55,-103,-42,-97,-75,-103,-69,-76,-103,-64,-68,]),'>':([37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,66,68,69,70,71,72,73,74,75,91,92,123,130,131,161,162,163,183,191,],[-84,-82,-83,-100,-101,-103,-103,-103,-103,-103,-103,-103,-103,-103,-94,-95,-96,-85,-86,-87,-88,-89,-90,-91,-92,-93,130,131,-102,-103,-103,183,-98,-99,-103,-97,]),'(':([42,43,44,45,46,47,48,49,50,79,94,108,110,111,112,113,114,115,116,117,118,121,122,130,131,134,137,144,145,146,164,174,176,179,183,185,187,196,197,199,200,204,],[67,67,67,67,67,67,67,67,67,67,67,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,67,67,67,67,67,67,67,67,186,-34,-38,67,67,67,67,-69,67,202,-68,]),'<':([54,55,56,],[76,77,78,]),'{':([58,59,60,61,62,86,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,155,157,176,177,179,180,182,190,193,],[80,81,82,83,84,120,152,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,120,120,-21,-22,-13,-14,120,120,-34,120,-38,120,120,-42,120,]),'EXTENDS':([62,],[85,]),'=':([65,89,94,185,],[86,128,132,193,]),')':([67,87,88,89,98,108,110,111,112,113,114,115,116,117,118,121,122,123,124,125,126,127,138,139,159,160,168,176,179,185,186,192,194,196,198,202,203,],[-106,123,-106,-108,-74,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-106,-105,-13,-14,-74,-73,-104,-107,-72,-34,-38,-103,-74,-75,197,-103,-76,-74,204,]),'}':([80,81,82,83,84,94,95,96,97,98,101,102,103,104,108,110,111,112,113,114,115,116,117,118,120,121,122,123,126,127,133,135,136,138,139,147,148,152,156,157,164,166,168,173,175,176,179,180,181,184,185,189,190,192,196,197,198,199,201,204,],[-54,-74,-74,-74,-67,-103,134,-54,137,-74,144,145,146,-67,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,-41,-21,-22,-102,-13,-14,-56,-54,-53,-74,-73,-67,-66,-67,179,-41,-103,-52,-72,-65,187,-34,-38,-41,-40,-55,-103,-39,-42,-75,-103,-69,-76,-103,-64,-68,]),'INTCONSTANT':([81,82,83,86,98,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,126,127,132,138,155,157,176,177,179,180,182,185,186,190,192,193,196,198,202,],[100,100,100,115,100,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,115,115,-21,-22,-102,-13,-14,164,100,115,115,-34,115,-38,115,115,-103,100,-42,-75,115,-103,-76,100,]),'REQUIRED':([81,82,83,98,99,108,110,111,112,113,114,115,116,117,118,121,122,123,126,127,138,143,176,179,185,186,192,196,198,202,],[-78,-78,-78,-78,141,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,-78,-77,-34,-38,-103,-78,-75,-103,-76,-78,]),'OPTIONAL':([81,82,83,98,99,108,110,111,112,113,114,115,116,117,118,121,122,123,126,127,138,143,176,179,185,186,192,196,198,202,],[-78,-78,-78,-78,142,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,-102,-13,-14,-78,-77,-34,-38,-103,-78,-75,-103,-76,-78,]),'ONEWAY':([84,104,123,126,127,147,152,197,199,201,204,],[106,106,-102,-13,-14,106,106,-69,-103,-64,-68,]),'VOID':([84,104,105,106,123,126,127,147,152,197,199,201,204,],[-63,-63,151,-62,-102,-13,-14,-63,-63,-69,-103,-64,-68,]),'DUBCONSTANT':([86,108,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,155,157,176,177,179,180,182,190,193,],[116,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,116,116,-21,-22,-13,-14,116,116,-34,116,-38,116,116,-42,116,]),'[':([86,108,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,155,157,176,177,179,180,182,190,193,],[119,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,119,119,-21,-22,-13,-14,119,119,-34,119,-38,119,119,-42,119,]),'TRUE':([86,108,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,155,157,176,177,179,180,182,190,193,],[121,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,121,121,-21,-22,-13,-14,121,121,-34,121,-38,121,121,-42,121,]),'FALSE':([86,108,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,155,157,176,177,179,180,182,190,193,],[122,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,122,122,-21,-22,-13,-14,122,122,-34,122,-38,122,122,-42,122,]),':':([100,108,110,111,112,113,114,115,116,117,118,121,122,158,176,179,],[143,-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,-21,-22,182,-34,-38,]),']':([108,110,111,112,113,114,115,116,117,118,119,121,122,126,127,154,155,176,177,178,179,188,],[-43,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,-21,-22,-13,-14,176,-37,-34,-37,-36,-38,-35,]),'THROWS':([197,],[200,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'start':([0,],[1,]),'header':([0,3,],[2,27,]),'header_unit_':([0,3,],[3,3,]),'header_unit':([0,3,],[4,4,]),'include':([0,3,],[5,5,]),'namespace':([0,3,],[6,6,]),'definition':([2,10,],[9,34,]),'definition_unit_':([2,10,],[10,10,]),'definition_unit':([2,10,],[11,11,]),'const':([2,10,],[12,12,]),'ttype':([2,10,],[13,13,]),'typedef':([2,10,],[15,15,]),'enum':([2,10,],[16,16,]),'struct':([2,10,],[17,17,]),'union':([2,10,],[18,18,]),'exception':([2,10,],[19,19,]),'service':([2,10,],[20,20,]),'namespace_scope':([8,],[31,]),'field_type':([14,21,76,77,78,105,129,140,],[36,57,90,91,92,150,161,169,]),'ref_type':([14,21,76,77,78,105,129,140,],[38,38,38,38,38,38,38,38,]),'definition_type':([14,21,76,77,78,105,129,140,],[39,39,39,39,39,39,39,39,]),'base_type':([14,21,76,77,78,105,129,140,],[40,40,40,40,40,40,40,40,]),'container_type':([14,21,76,77,78,105,129,140,],[41,41,41,41,41,41,41,41,]),'map_type':([14,21,76,77,78,105,129,140,],[51,51,51,51,51,51,51,51,]),'list_type':([14,21,76,77,78,105,129,140,],[52,52,52,52,52,52,52,52,]),'set_type':([14,21,76,77,78,105,129,140,],[53,53,53,53,53,53,53,53,]),'annotations':([42,43,44,45,46,47,48,49,50,79,94,130,131,134,137,144,145,146,164,183,185,187,196,199,],[66,68,69,70,71,72,73,74,75,93,133,162,163,165,167,170,171,172,184,191,192,195,198,201,]),'annotation_seq':([67,88,124,],[87,125,159,]),'annotation':([67,88,124,],[88,88,88,]),'enum_seq':([80,96,135,],[95,136,166,]),'enum_item':([80,96,135,],[96,96,96,]),'field_seq':([81,82,83,98,138,186,202,],[97,101,102,139,168,194,203,]),'field':([81,82,83,98,138,186,202,],[98,98,98,98,98,98,98,]),'field_id':([81,82,83,98,138,186,202,],[99,99,99,99,99,99,99,]),'function_seq':([84,104,147,152,],[103,148,173,175,]),'function':([84,104,147,152,],[104,104,104,104,]),'oneway':([84,104,147,152,],[105,105,105,105,]),'const_value':([86,119,120,155,157,177,180,182,193,],[109,155,158,155,158,155,158,190,196,]),'const_value_native':([86,119,120,155,157,177,180,182,193,],[110,110,110,110,110,110,110,110,110,]),'const_ref':([86,119,120,155,157,177,180,182,193,],[111,111,111,111,111,111,111,111,111,]),'const_value_primitive':([86,119,120,155,157,177,180,182,193,],[112,112,112,112,112,112,112,112,112,]),'const_list':([86,119,120,155,157,177,180,182,193,],[113,113,113,113,113,113,113,113,113,]),'const_map':([86,119,120,155,157,177,180,182,193,],[114,114,114,114,114,114,114,114,114,]),'const_bool':([86,119,120,155,157,177,180,182,193,],[118,118,118,118,118,118,118,118,118,]),'sep':([88,96,98,104,109,155,157,],[124,135,138,147,153,177,180,]),'field_req':([99,],[140,]),'function_type':([105,],[149,]),'const_list_seq':([119,155,177,],[154,178,188,]),'const_map_seq':([120,157,180,],[156,181,189,]),'const_map_item':([120,157,180,],[157,157,157,]),'throws':([197,],[199,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> start","S'",1,None,None,None),
+  ('start -> header definition','start',2,'p_start','parser.py',50),
+  ('header -> header_unit_ header','header',2,'p_header','parser.py',54),
+  ('header -> <empty>','header',0,'p_header','parser.py',55),
+  ('header_unit_ -> header_unit ;','header_unit_',2,'p_header_unit_','parser.py',59),
+  ('header_unit_ -> header_unit','header_unit_',1,'p_header_unit_','parser.py',60),
+  ('header_unit -> include','header_unit',1,'p_header_unit','parser.py',64),
+  ('header_unit -> namespace','header_unit',1,'p_header_unit','parser.py',65),
+  ('include -> INCLUDE IDENTIFIER LITERAL','include',3,'p_include','parser.py',69),
+  ('include -> INCLUDE LITERAL','include',2,'p_include','parser.py',70),
+  ('namespace -> NAMESPACE namespace_scope IDENTIFIER','namespace',3,'p_namespace','parser.py',77),
+  ('namespace_scope -> *','namespace_scope',1,'p_namespace_scope','parser.py',81),
+  ('namespace_scope -> IDENTIFIER','namespace_scope',1,'p_namespace_scope','parser.py',82),
+  ('sep -> ,','sep',1,'p_sep','parser.py',86),
+  ('sep -> ;','sep',1,'p_sep','parser.py',87),
+  ('definition -> definition_unit_ definition','definition',2,'p_definition','parser.py',91),
+  ('definition -> <empty>','definition',0,'p_definition','parser.py',92),
+  ('definition_unit_ -> definition_unit ;','definition_unit_',2,'p_definition_unit_','parser.py',96),
+  ('definition_unit_ -> definition_unit','definition_unit_',1,'p_definition_unit_','parser.py',97),
+  ('definition_unit -> const','definition_unit',1,'p_definition_unit','parser.py',101),
+  ('definition_unit -> ttype','definition_unit',1,'p_definition_unit','parser.py',102),
+  ('const_bool -> TRUE','const_bool',1,'p_const_bool','parser.py',107),
+  ('const_bool -> FALSE','const_bool',1,'p_const_bool','parser.py',108),
+  ('const -> CONST field_type IDENTIFIER = const_value','const',5,'p_const','parser.py',112),
+  ('const -> CONST field_type IDENTIFIER = const_value sep','const',6,'p_const','parser.py',113),
+  ('const_value -> const_value_native','const_value',1,'p_const_value','parser.py',122),
+  ('const_value -> const_ref','const_value',1,'p_const_value','parser.py',123),
+  ('const_value_native -> const_value_primitive','const_value_native',1,'p_const_value_native','parser.py',127),
+  ('const_value_native -> const_list','const_value_native',1,'p_const_value_native','parser.py',128),
+  ('const_value_native -> const_map','const_value_native',1,'p_const_value_native','parser.py',129),
+  ('const_value_primitive -> INTCONSTANT','const_value_primitive',1,'p_const_value_primitive','parser.py',133),
+  ('const_value_primitive -> DUBCONSTANT','const_value_primitive',1,'p_const_value_primitive','parser.py',134),
+  ('const_value_primitive -> LITERAL','const_value_primitive',1,'p_const_value_primitive','parser.py',135),
+  ('const_value_primitive -> const_bool','const_value_primitive',1,'p_const_value_primitive','parser.py',136),
+  ('const_list -> [ const_list_seq ]','const_list',3,'p_const_list','parser.py',140),
+  ('const_list_seq -> const_value sep const_list_seq','const_list_seq',3,'p_const_list_seq','parser.py',144),
+  ('const_list_seq -> const_value const_list_seq','const_list_seq',2,'p_const_list_seq','parser.py',145),
+  ('const_list_seq -> <empty>','const_list_seq',0,'p_const_list_seq','parser.py',146),
+  ('const_map -> { const_map_seq }','const_map',3,'p_const_map','parser.py',150),
+  ('const_map_seq -> const_map_item sep const_map_seq','const_map_seq',3,'p_const_map_seq','parser.py',154),
+  ('const_map_seq -> const_map_item const_map_seq','const_map_seq',2,'p_const_map_seq','parser.py',155),
+  ('const_map_seq -> <empty>','const_map_seq',0,'p_const_map_seq','parser.py',156),
+  ('const_map_item -> const_value : const_value','const_map_item',3,'p_const_map_item','parser.py',160),
+  ('const_ref -> IDENTIFIER','const_ref',1,'p_const_ref','parser.py',164),
+  ('ttype -> typedef','ttype',1,'p_ttype','parser.py',168),
+  ('ttype -> enum','ttype',1,'p_ttype','parser.py',169),
+  ('ttype -> struct','ttype',1,'p_ttype','parser.py',170),
+  ('ttype -> union','ttype',1,'p_ttype','parser.py',171),
+  ('ttype -> exception','ttype',1,'p_ttype','parser.py',172),
+  ('ttype -> service','ttype',1,'p_ttype','parser.py',173),
+  ('typedef -> TYPEDEF field_type IDENTIFIER annotations','typedef',4,'p_typedef','parser.py',177),
+  ('enum -> ENUM IDENTIFIER { enum_seq } annotations','enum',6,'p_enum','parser.py',183),
+  ('enum_seq -> enum_item sep enum_seq','enum_seq',3,'p_enum_seq','parser.py',189),
+  ('enum_seq -> enum_item enum_seq','enum_seq',2,'p_enum_seq','parser.py',190),
+  ('enum_seq -> <empty>','enum_seq',0,'p_enum_seq','parser.py',191),
+  ('enum_item -> IDENTIFIER = INTCONSTANT annotations','enum_item',4,'p_enum_item','parser.py',195),
+  ('enum_item -> IDENTIFIER annotations','enum_item',2,'p_enum_item','parser.py',196),
+  ('struct -> STRUCT IDENTIFIER { field_seq } annotations','struct',6,'p_struct','parser.py',207),
+  ('union -> UNION IDENTIFIER { field_seq } annotations','union',6,'p_union','parser.py',213),
+  ('exception -> EXCEPTION IDENTIFIER { field_seq } annotations','exception',6,'p_exception','parser.py',219),
+  ('service -> SERVICE IDENTIFIER { function_seq } annotations','service',6,'p_service','parser.py',225),
+  ('service -> SERVICE IDENTIFIER EXTENDS IDENTIFIER { function_seq } annotations','service',8,'p_service','parser.py',226),
+  ('oneway -> ONEWAY','oneway',1,'p_oneway','parser.py',248),
+  ('oneway -> <empty>','oneway',0,'p_oneway','parser.py',249),
+  ('function -> oneway function_type IDENTIFIER ( field_seq ) throws annotations','function',8,'p_function','parser.py',253),
+  ('function_seq -> function sep function_seq','function_seq',3,'p_function_seq','parser.py',266),
+  ('function_seq -> function function_seq','function_seq',2,'p_function_seq','parser.py',267),
+  ('function_seq -> <empty>','function_seq',0,'p_function_seq','parser.py',268),
+  ('throws -> THROWS ( field_seq )','throws',4,'p_throws','parser.py',272),
+  ('throws -> <empty>','throws',0,'p_throws','parser.py',273),
+  ('function_type -> field_type','function_type',1,'p_function_type','parser.py',280),
+  ('function_type -> VOID','function_type',1,'p_function_type','parser.py',281),
+  ('field_seq -> field sep field_seq','field_seq',3,'p_field_seq','parser.py',288),
+  ('field_seq -> field field_seq','field_seq',2,'p_field_seq','parser.py',289),
+  ('field_seq -> <empty>','field_seq',0,'p_field_seq','parser.py',290),
+  ('field -> field_id field_req field_type IDENTIFIER annotations','field',5,'p_field','parser.py',294),
+  ('field -> field_id field_req field_type IDENTIFIER = const_value annotations','field',7,'p_field','parser.py',295),
+  ('field_id -> INTCONSTANT :','field_id',2,'p_field_id','parser.py',316),
+  ('field_id -> <empty>','field_id',0,'p_field_id','parser.py',317),
+  ('field_req -> REQUIRED','field_req',1,'p_field_req','parser.py',333),
+  ('field_req -> OPTIONAL','field_req',1,'p_field_req','parser.py',334),
+  ('field_req -> <empty>','field_req',0,'p_field_req','parser.py',335),
+  ('field_type -> ref_type','field_type',1,'p_field_type','parser.py',342),
+  ('field_type -> definition_type','field_type',1,'p_field_type','parser.py',343),
+  ('ref_type -> IDENTIFIER','ref_type',1,'p_ref_type','parser.py',347),
+  ('base_type -> BOOL annotations','base_type',2,'p_base_type','parser.py',351),
+  ('base_type -> BYTE annotations','base_type',2,'p_base_type','parser.py',352),
+  ('base_type -> I8 annotations','base_type',2,'p_base_type','parser.py',353),
+  ('base_type -> I16 annotations','base_type',2,'p_base_type','parser.py',354),
+  ('base_type -> I32 annotations','base_type',2,'p_base_type','parser.py',355),
+  ('base_type -> I64 annotations','base_type',2,'p_base_type','parser.py',356),
+  ('base_type -> DOUBLE annotations','base_type',2,'p_base_type','parser.py',357),
+  ('base_type -> STRING annotations','base_type',2,'p_base_type','parser.py',358),
+  ('base_type -> BINARY annotations','base_type',2,'p_base_type','parser.py',359),
+  ('container_type -> map_type','container_type',1,'p_container_type','parser.py',368),
+  ('container_type -> list_type','container_type',1,'p_container_type','parser.py',369),
+  ('container_type -> set_type','container_type',1,'p_container_type','parser.py',370),
+  ('map_type -> MAP < field_type , field_type > annotations','map_type',7,'p_map_type','parser.py',374),
+  ('list_type -> LIST < field_type > annotations','list_type',5,'p_list_type','parser.py',378),
+  ('set_type -> SET < field_type > annotations','set_type',5,'p_set_type','parser.py',382),
+  ('definition_type -> base_type','definition_type',1,'p_definition_type','parser.py',386),
+  ('definition_type -> container_type','definition_type',1,'p_definition_type','parser.py',387),
+  ('annotations -> ( annotation_seq )','annotations',3,'p_annotations','parser.py',391),
+  ('annotations -> <empty>','annotations',0,'p_annotations','parser.py',392),
+  ('annotation_seq -> annotation sep annotation_seq','annotation_seq',3,'p_annotation_seq','parser.py',399),
+  ('annotation_seq -> annotation annotation_seq','annotation_seq',2,'p_annotation_seq','parser.py',400),
+  ('annotation_seq -> <empty>','annotation_seq',0,'p_annotation_seq','parser.py',401),
+  ('annotation -> IDENTIFIER = LITERAL','annotation',3,'p_annotation','parser.py',405),
+  ('annotation -> IDENTIFIER','annotation',1,'p_annotation','parser.py',406),
+]
@@ -33,7 +33,8 @@ class Loader(object):
 
     __slots__ = ('compiler',)
 
-    def __init__(self, protocol=None, strict=None, include_as=None):
+    def __init__(self, protocol=None, strict=None, include_as=None,
+                 cache=None, cache_dir=None):
         """Initialize a loader.
 
         :param thriftrw.protocol.Protocol protocol:
@@ -52,10 +53,30 @@ class Loader(object):
             Whether thriftrw's custom include-as syntax is supported. Defaults
             to False. Note that this makes your Thrift files incomptabile with
             Apache Thrift. Use at your own risk.
+
+        :param bool cache:
+            Whether programs parsed from Thrift files are cached so that
+            loading a file with the same contents again skips parsing.
+            Defaults to the value of ``include_as``, or to True if
+            ``cache_dir`` or ``THRIFTRW_CACHE_DIR`` is set.
+
+            .. versionadded:: 1.10
+
+        :param str cache_dir:
+            Directory in which parsed programs are also cached on disk so that
+            later processes can reuse them. Defaults to the
+            ``THRIFTRW_CACHE_DIR`` environment variable. Programs are only
+            cached in memory if neither is set.
+
+            .. versionadded:: 1.10
         """
         protocol = protocol or BinaryProtocol()
         self.compiler = Compiler(
-            protocol, strict=strict, include_as=include_as
+            protocol,
+            strict=strict,
+            include_as=include_as,
+            cache_dir=cache_dir,
+            cache=cache,
         )
 
     def loads(self, name, document):
@@ -83,10 +104,7 @@ class Loader(object):
             name = os.path.splitext(os.path.basename(path))[0]
             # TODO do we care if the file extension is .thrift?
 
-        with open(path, 'r') as f:
-            document = f.read()
-
-        return self.compiler.compile(name, document, path).link().surface
+        return self.compiler.compile(name, None, path).link().surface
 
 
 _DEFAULT_LOADER = Loader(protocol=BinaryProtocol())
@@ -27,7 +27,7 @@ from libc.stdint cimport (
     int64_t,
 )
 
-cdef extern from "_endian.h":
+cdef extern from "_endian.h" nogil:
     int16_t htobe16(int16_t n)
     int32_t htobe32(int32_t n)
     int64_t htobe64(int64_t n)
@@ -71,18 +71,23 @@ cdef class BinaryProtocolReader(ProtocolReader):
     cdef int64_t _i64(self) except *
     cdef double _double(self) except *
 
+    cdef void _skip_values(self, int typ, int32_t size) except *
+
+    cdef list read_values(self, int8_t typ, int32_t size)
+
 
 cdef class BinaryProtocolWriter(ProtocolWriter):
     cdef WriteBuffer writer
 
-    cdef void _write(BinaryProtocolWriter self, char* data, int length)
+    cdef int _write(BinaryProtocolWriter self, char* data, int length) except -1
+
+    cdef bint write_values(BinaryProtocolWriter self, int8_t typ,
+                           object values) except -1
 
 
 cdef class _OldBinaryProtocolReader(object):
     cdef ReadBuffer reader
 
-    cdef object _reader(self, int8_t typ)
-
     cpdef object read(self, int8_t typ)
 
     cdef void _read(self, char* data, int count) except *
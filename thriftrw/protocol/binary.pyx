@@ -20,11 +20,13 @@
 
 from __future__ import absolute_import, unicode_literals, print_function
 
+from libc.string cimport memcpy
 from libc.stdint cimport (
     int8_t,
     int16_t,
     int32_t,
     int64_t,
+    INT32_MAX,
 )
 
 from thriftrw.wire cimport ttype
@@ -63,17 +65,160 @@ from .core cimport (
 from ..errors import EndOfInputError
 from ..errors import ThriftProtocolError
 from ._endian cimport (
-    htobe16,
-    htobe32,
-    htobe64,
     be16toh,
     be32toh,
     be64toh,
 )
 
 
+ctypedef fused int_t:
+    int16_t
+    int32_t
+    int64_t
+
+
+cdef inline int_t _swap(int_t value) nogil:
+    # Converts between big-endian and host byte order in either direction.
+    # Specialized per integer width at compile time.
+    if int_t is int16_t:
+        return be16toh(value)
+    elif int_t is int32_t:
+        return be32toh(value)
+    else:
+        return be64toh(value)
+
+
+cdef inline int_t _read_int(ReadBuffer buff, int_t* value) except *:
+    buff.read(<char*>value, sizeof(int_t))
+    value[0] = _swap(value[0])
+    return value[0]
+
+
+cdef inline int _write_int(WriteBuffer buff, int_t value) except -1:
+    value = _swap(value)
+    return buff.write(<char*>(&value), sizeof(int_t))
+
+
+cdef inline int _fixed_width(int typ) nogil:
+    # Encoded size of values of the given type, or 0 if it varies.
+    if typ == ttype.BOOL or typ == ttype.BYTE:
+        return 1
+    elif typ == ttype.I16:
+        return 2
+    elif typ == ttype.I32:
+        return 4
+    elif typ == ttype.I64 or typ == ttype.DOUBLE:
+        return 8
+    else:
+        return 0
+
+
+cdef inline void _check_ttype(int8_t typ) except *:
+    if not (
+        typ == ttype.BOOL or typ == ttype.BYTE or typ == ttype.DOUBLE or
+        typ == ttype.I16 or typ == ttype.I32 or typ == ttype.I64 or
+        typ == ttype.BINARY or typ == ttype.STRUCT or typ == ttype.MAP or
+        typ == ttype.SET or typ == ttype.LIST
+    ):
+        raise ThriftProtocolError('Unknown TType "%r"' % typ)
+
+
+cdef inline object _decode_fixed(char* data, int8_t typ, bint as_value):
+    # Decodes a single fixed-width value of the given type from data, as a
+    # wire Value if as_value is set and as a Python object otherwise.
+    cdef int16_t i16
+    cdef int32_t i32
+    cdef int64_t i64
+
+    if typ == ttype.BOOL:
+        if as_value:
+            return TRUE_VALUE if data[0] == 1 else FALSE_VALUE
+        return data[0] == 1
+    elif typ == ttype.BYTE:
+        if as_value:
+            return BYTE_VALUES[<int8_t>data[0] + 128]
+        return <int8_t>data[0]
+    elif typ == ttype.I16:
+        memcpy(&i16, data, 2)
+        i16 = _swap(i16)
+        return _i16_value(i16) if as_value else i16
+    elif typ == ttype.I32:
+        memcpy(&i32, data, 4)
+        i32 = _swap(i32)
+        return _i32_value(i32) if as_value else i32
+    elif typ == ttype.I64:
+        memcpy(&i64, data, 8)
+        i64 = _swap(i64)
+        return _i64_value(i64) if as_value else i64
+    else:  # DOUBLE
+        memcpy(&i64, data, 8)
+        i64 = _swap(i64)
+        if as_value:
+            return DoubleValue((<double*>(&i64))[0])
+        return (<double*>(&i64))[0]
+
+
+cdef list _read_values(ReadBuffer reader, int8_t typ, int32_t size,
+                       bint as_value=False):
+    # Decodes a run of fixed-width values into Python objects, or wire Values
+    # if as_value is set. Returns None if values of this type vary in width.
+    cdef int width = _fixed_width(typ)
+    if not width or size < 0 or size > INT32_MAX // width:
+        return None
+
+    # Bounds-check the whole run once and decode straight from the
+    # underlying memory.
+    cdef char* data = reader.data + reader.offset
+    reader.skip(size * width)
+
+    cdef list output = [None] * size
+    cdef Py_ssize_t i
+    for i in range(size):
+        output[i] = _decode_fixed(data + i * width, typ, as_value)
+    return output
+
+
 cdef STRUCT_END_HEADER = FieldHeader(-1, -1)
 
+# Values are immutable, so the legacy reader hands out shared instances for
+# booleans and bytes instead of allocating one per decoded value.
+cdef BoolValue TRUE_VALUE = BoolValue(True)
+cdef BoolValue FALSE_VALUE = BoolValue(False)
+cdef tuple BYTE_VALUES = tuple(ByteValue(i) for i in range(-128, 128))
+
+# Small integers dominate most payloads, so the same goes for integer values
+# in [SMALL_INT_MIN, SMALL_INT_MAX].
+cdef int SMALL_INT_MIN = -128
+cdef int SMALL_INT_MAX = 256
+
+cdef tuple I16_VALUES = tuple(
+    I16Value(i) for i in range(SMALL_INT_MIN, SMALL_INT_MAX + 1)
+)
+cdef tuple I32_VALUES = tuple(
+    I32Value(i) for i in range(SMALL_INT_MIN, SMALL_INT_MAX + 1)
+)
+cdef tuple I64_VALUES = tuple(
+    I64Value(i) for i in range(SMALL_INT_MIN, SMALL_INT_MAX + 1)
+)
+
+
+cdef inline I16Value _i16_value(int16_t value):
+    if SMALL_INT_MIN <= value <= SMALL_INT_MAX:
+        return <I16Value>I16_VALUES[value - SMALL_INT_MIN]
+    return I16Value(value)
+
+
+cdef inline I32Value _i32_value(int32_t value):
+    if SMALL_INT_MIN <= value <= SMALL_INT_MAX:
+        return <I32Value>I32_VALUES[value - SMALL_INT_MIN]
+    return I32Value(value)
+
+
+cdef inline I64Value _i64_value(int64_t value):
+    if SMALL_INT_MIN <= value <= SMALL_INT_MAX:
+        return <I64Value>I64_VALUES[value - SMALL_INT_MIN]
+    return I64Value(value)
+
 cdef int8_t STRUCT_END = 0
 
 cdef int32_t VERSION = 1
@@ -126,32 +271,39 @@ cdef class BinaryProtocolReader(ProtocolReader):
             self.skip_list()
 
     cdef void skip_struct(self) except *:
-        header = self.read_field_begin()
+        cdef FieldHeader header = self.read_field_begin()
         while header.type != -1:
             self.skip(header.type)
             header = self.read_field_begin()
 
     cdef void skip_map(self) except *:
-        # TODO: This could be optimized to precompute the expected
-        # size for fixed width types
         cdef MapHeader header = self.read_map_begin()
+        cdef int kwidth = _fixed_width(header.ktype)
+        cdef int vwidth = _fixed_width(header.vtype)
+        if kwidth and vwidth and header.size <= INT32_MAX // 16:
+            if header.size > 0:
+                self.reader.skip(header.size * (kwidth + vwidth))
+            return
         for _ in range(header.size):
             self.skip(header.ktype)
             self.skip(header.vtype)
 
     cdef void skip_list(self) except *:
-        # TODO: This could be optimized to precompute the expected
-        # size for fixed width types
         cdef ListHeader header = self.read_list_begin()
-        for _ in range(header.size):
-            self.skip(header.type)
+        self._skip_values(header.type, header.size)
 
     cdef void skip_set(self) except *:
-        # TODO: This could be optimized to precompute the expected
-        # size for fixed width types
         cdef SetHeader header = self.read_set_begin()
-        for _ in range(header.size):
-            self.skip(header.type)
+        self._skip_values(header.type, header.size)
+
+    cdef void _skip_values(self, int typ, int32_t size) except *:
+        cdef int width = _fixed_width(typ)
+        if width and size <= INT32_MAX // 8:
+            if size > 0:
+                self.reader.skip(size * width)
+            return
+        for _ in range(size):
+            self.skip(typ)
 
     cdef void _read(self, char* data, int count) except *:
         self.reader.read(data, count)
@@ -162,19 +314,16 @@ cdef class BinaryProtocolReader(ProtocolReader):
         return <int8_t>c
 
     cdef int16_t _i16(self) except *:
-        cdef char data[2]
-        self._read(data, 2)
-        return be16toh((<int16_t*>data)[0])
+        cdef int16_t value
+        return _read_int(self.reader, &value)
 
     cdef int32_t _i32(self) except *:
-        cdef char data[4]
-        self._read(data, 4)
-        return be32toh((<int32_t*>data)[0])
+        cdef int32_t value
+        return _read_int(self.reader, &value)
 
     cdef int64_t _i64(self) except *:
-        cdef char data[8]
-        self._read(data, 8)
-        return be64toh((<int64_t*>data)[0])
+        cdef int64_t value
+        return _read_int(self.reader, &value)
 
     cdef double _double(self) except *:
         cdef int64_t value = self._i64()
@@ -214,13 +363,28 @@ cdef class BinaryProtocolReader(ProtocolReader):
         self.reader.skip(length)
 
     cdef FieldHeader read_field_begin(self) except *:
-        cdef int8_t field_type = self._byte()
+        cdef ReadBuffer reader = self.reader
+        cdef char* header
+        cdef int8_t field_type
+        cdef int16_t field_id
+
+        if reader.length - reader.offset < 3:
+            # Too short for a full header; this is either STOP or an error.
+            field_type = self._byte()
+            if field_type == STRUCT_END:
+                return STRUCT_END_HEADER
+            return FieldHeader(field_type, self._i16())
+
+        # type:1 id:2 decoded in place with a single bounds check.
+        header = reader.data + reader.offset
+        field_type = <int8_t>header[0]
         if field_type == STRUCT_END:
+            reader.offset += 1
             return STRUCT_END_HEADER
 
-        cdef int16_t field_id = self._i16()
-
-        return FieldHeader(field_type, field_id)
+        memcpy(&field_id, header + 1, 2)
+        reader.offset += 3
+        return FieldHeader(field_type, _swap(field_id))
 
     cdef MapHeader read_map_begin(self) except *:
         cdef int8_t key_ttype = self._byte()
@@ -241,6 +405,9 @@ cdef class BinaryProtocolReader(ProtocolReader):
 
         return ListHeader(value_ttype, length)
 
+    cdef list read_values(self, int8_t typ, int32_t size):
+        return _read_values(self.reader, typ, size)
+
     cdef MessageHeader read_message_begin(self):
         cdef int8_t typ
         cdef int16_t version
@@ -285,8 +452,8 @@ cdef class BinaryProtocolWriter(ProtocolWriter):
         """
         self.writer = writer
 
-    cdef void _write(BinaryProtocolWriter self, char* data, int length):
-        self.writer.write(data, length)
+    cdef int _write(BinaryProtocolWriter self, char* data, int length) except -1:
+        return self.writer.write(data, length)
 
     cdef void write_bool(self, bint value) except *:  # bool:1
         self.write_byte(value)
@@ -306,18 +473,15 @@ cdef class BinaryProtocolWriter(ProtocolWriter):
 
     cdef void write_i16(BinaryProtocolWriter self, int16_t value) except *:
         # i16:2
-        value = htobe16(value)
-        self._write(<char*>(&value), 2)
+        _write_int(self.writer, value)
 
     cdef void write_i32(BinaryProtocolWriter self, int32_t value) except *:
         # i32:4
-        value = htobe32(value)
-        self._write(<char*>(&value), 4)
+        _write_int(self.writer, value)
 
     cdef void write_i64(BinaryProtocolWriter self, int64_t value) except *:
         # i64:8
-        value = htobe64(value)
-        self._write(<char*>(&value), 8)
+        _write_int(self.writer, value)
 
     cdef void write_binary(BinaryProtocolWriter self, char* value, int32_t length) except *:
         # len:4 str:len
@@ -327,8 +491,11 @@ cdef class BinaryProtocolWriter(ProtocolWriter):
     cdef void write_field_begin(BinaryProtocolWriter self,
                                 FieldHeader header) except *:
         # type:1 id:2
-        self.write_byte(header.type)
-        self.write_i16(header.id)
+        cdef char data[3]
+        cdef int16_t id = _swap(<int16_t>header.id)
+        data[0] = <char>header.type
+        memcpy(data + 1, &id, 2)
+        self._write(data, 3)
 
     cdef void write_struct_end(BinaryProtocolWriter self) except *:
         self.write_byte(STRUCT_END)
@@ -336,21 +503,78 @@ cdef class BinaryProtocolWriter(ProtocolWriter):
     cdef void write_map_begin(BinaryProtocolWriter self,
                               MapHeader header) except *:
         # key_type:1 value_type:1 count:4
-        self.write_byte(header.ktype)
-        self.write_byte(header.vtype)
-        self.write_i32(header.size)
+        cdef char data[6]
+        cdef int32_t size = _swap(<int32_t>header.size)
+        data[0] = <char>header.ktype
+        data[1] = <char>header.vtype
+        memcpy(data + 2, &size, 4)
+        self._write(data, 6)
 
     cdef void write_set_begin(BinaryProtocolWriter self,
                               SetHeader header) except *:
         # value_type:1 count:4
-        self.write_byte(header.type)
-        self.write_i32(header.size)
+        cdef char data[5]
+        cdef int32_t size = _swap(<int32_t>header.size)
+        data[0] = <char>header.type
+        memcpy(data + 1, &size, 4)
+        self._write(data, 5)
 
     cdef void write_list_begin(BinaryProtocolWriter self,
                                ListHeader header) except *:
         # value_type:1 count:4
-        self.write_byte(header.type)
-        self.write_i32(header.size)
+        cdef char data[5]
+        cdef int32_t size = _swap(<int32_t>header.size)
+        data[0] = <char>header.type
+        memcpy(data + 1, &size, 4)
+        self._write(data, 5)
+
+    cdef bint write_values(BinaryProtocolWriter self, int8_t typ,
+                           object values) except -1:
+        cdef int width = _fixed_width(typ)
+        cdef Py_ssize_t size = len(values)
+        if not width or size > INT32_MAX // width:
+            return False
+
+        # Reserve room for the whole run and encode straight into the
+        # buffer. The length is only committed once every value converted.
+        cdef WriteBuffer buff = self.writer
+        buff.ensure_capacity(<int>size * width)
+        cdef char* start = buff.data + buff.length
+        cdef char* end = start + size * width
+        cdef char* out = start
+        cdef int16_t i16
+        cdef int32_t i32
+        cdef int64_t i64
+        cdef double d
+
+        for value in values:
+            if out == end:
+                raise RuntimeError('container changed size during iteration')
+            if typ == ttype.BOOL:
+                out[0] = 1 if value else 0
+            elif typ == ttype.BYTE:
+                out[0] = <char><int8_t>value
+            elif typ == ttype.I16:
+                i16 = _swap(<int16_t>value)
+                memcpy(out, &i16, 2)
+            elif typ == ttype.I32:
+                i32 = _swap(<int32_t>value)
+                memcpy(out, &i32, 4)
+            elif typ == ttype.I64:
+                i64 = _swap(<int64_t>value)
+                memcpy(out, &i64, 8)
+            else:  # DOUBLE
+                d = value
+                i64 = _swap((<int64_t*>(&d))[0])
+                memcpy(out, &i64, 8)
+            out += width
+
+        if out != end:
+            raise RuntimeError('container changed size during iteration')
+
+        buff.length += <int>(end - start)
+        buff.capacity -= <int>(end - start)
+        return True
 
     cdef void write_message_begin(BinaryProtocolWriter self,
                                   MessageHeader message) except *:
@@ -368,11 +592,11 @@ cdef class BinaryProtocol(Protocol):
     cpdef ProtocolWriter writer(self, WriteBuffer buff):
         return BinaryProtocolWriter(buff)
 
-    cpdef Message deserialize_message(self, bytes s):
+    cpdef Message deserialize_message(self, s):
         cdef ReadBuffer buff = ReadBuffer(s)
         return _OldBinaryProtocolReader(buff).read_message()
 
-    cpdef Value deserialize_value(self, int typ, bytes s):
+    cpdef Value deserialize_value(self, int typ, s):
         cdef ReadBuffer buff = ReadBuffer(s)
         return _OldBinaryProtocolReader(buff).read(typ)
 
@@ -399,32 +623,6 @@ cdef class _OldBinaryProtocolReader(object):
         """
         self.reader = reader
 
-    cdef object _reader(self, int8_t typ):
-        if typ == ttype.BOOL:
-            return self.read_bool
-        elif typ == ttype.BYTE:
-            return self.read_byte
-        elif typ == ttype.DOUBLE:
-            return self.read_double
-        elif typ == ttype.I16:
-            return self.read_i16
-        elif typ == ttype.I32:
-            return self.read_i32
-        elif typ == ttype.I64:
-            return self.read_i64
-        elif typ == ttype.BINARY:
-            return self.read_binary
-        elif typ == ttype.STRUCT:
-            return self.read_struct
-        elif typ == ttype.MAP:
-            return self.read_map
-        elif typ == ttype.SET:
-            return self.read_set
-        elif typ == ttype.LIST:
-            return self.read_list
-        else:
-            raise ThriftProtocolError('Unknown TType "%r"' % typ)
-
     cpdef object read(self, int8_t typ):
         if typ == ttype.BOOL:
             return self.read_bool()
@@ -460,19 +658,16 @@ cdef class _OldBinaryProtocolReader(object):
         return <int8_t>c
 
     cdef int16_t _i16(self) except *:
-        cdef char data[2]
-        self._read(data, 2)
-        return be16toh((<int16_t*>data)[0])
+        cdef int16_t value
+        return _read_int(self.reader, &value)
 
     cdef int32_t _i32(self) except *:
-        cdef char data[4]
-        self._read(data, 4)
-        return be32toh((<int32_t*>data)[0])
+        cdef int32_t value
+        return _read_int(self.reader, &value)
 
     cdef int64_t _i64(self) except *:
-        cdef char data[8]
-        self._read(data, 8)
-        return be64toh((<int64_t*>data)[0])
+        cdef int64_t value
+        return _read_int(self.reader, &value)
 
     cdef double _double(self) except *:
         cdef int64_t value = self._i64()
@@ -513,11 +708,11 @@ cdef class _OldBinaryProtocolReader(object):
 
     cdef BoolValue read_bool(self):
         """Reads a boolean."""
-        return BoolValue(self._byte() == 1)
+        return TRUE_VALUE if self._byte() == 1 else FALSE_VALUE
 
     cdef ByteValue read_byte(self):
         """Reads a byte."""
-        return ByteValue(self._byte())
+        return BYTE_VALUES[self._byte() + 128]
 
     cdef DoubleValue read_double(self):
         """Reads a double."""
@@ -525,15 +720,15 @@ cdef class _OldBinaryProtocolReader(object):
 
     cdef I16Value read_i16(self):
         """Reads a 16-bit integer."""
-        return I16Value(self._i16())
+        return _i16_value(self._i16())
 
     cdef I32Value read_i32(self):
         """Reads a 32-bit integer."""
-        return I32Value(self._i32())
+        return _i32_value(self._i32())
 
     cdef I64Value read_i64(self):
         """Reads a 64-bit integer."""
-        return I64Value(self._i64())
+        return _i64_value(self._i64())
 
     cdef BinaryValue read_binary(self):
         """Reads a binary blob."""
@@ -567,13 +762,13 @@ cdef class _OldBinaryProtocolReader(object):
         cdef int8_t value_ttype = self._byte()
         cdef int32_t length = self._i32()
 
-        kreader = self._reader(key_ttype)
-        vreader = self._reader(value_ttype)
+        _check_ttype(key_ttype)
+        _check_ttype(value_ttype)
 
         pairs = []
         for i in range(length):
-            k = kreader(self)
-            v = vreader(self)
+            k = self.read(key_ttype)
+            v = self.read(value_ttype)
             pairs.append(MapItem(k, v))
 
         return MapValue(
@@ -587,12 +782,13 @@ cdef class _OldBinaryProtocolReader(object):
         cdef int8_t value_ttype = self._byte()
         cdef int32_t length = self._i32()
 
-        vreader = self._reader(value_ttype)
-
-        values = []
+        _check_ttype(value_ttype)
 
-        for i in range(length):
-            values.append(vreader(self))
+        values = _read_values(self.reader, value_ttype, length, True)
+        if values is None:
+            values = []
+            for i in range(length):
+                values.append(self.read(value_ttype))
 
         return SetValue(
             value_ttype=value_ttype,
@@ -604,12 +800,13 @@ cdef class _OldBinaryProtocolReader(object):
         cdef int8_t value_ttype = self._byte()
         cdef int32_t length = self._i32()
 
-        vreader = self._reader(value_ttype)
+        _check_ttype(value_ttype)
 
-        values = []
-
-        for i in range(length):
-            values.append(vreader(self))
+        values = _read_values(self.reader, value_ttype, length, True)
+        if values is None:
+            values = []
+            for i in range(length):
+                values.append(self.read(value_ttype))
 
         return ListValue(
             value_ttype=value_ttype,
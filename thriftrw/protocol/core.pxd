@@ -92,6 +92,8 @@ cdef class ProtocolWriter(object):
     cdef void write_list_begin(self, ListHeader header) except *
     cdef void write_list_end(self) except *
 
+    cdef bint write_values(self, int8_t typ, object values) except -1
+
     # Messages
 
     cdef void write_message_begin(self, MessageHeader header) except *
@@ -137,6 +139,8 @@ cdef class ProtocolReader:
     cdef ListHeader read_list_begin(self) except *
     cdef void read_list_end(self) except *
 
+    cdef list read_values(self, int8_t typ, int32_t size)
+
     # Messages
 
     cdef MessageHeader read_message_begin(self)
@@ -150,11 +154,11 @@ cdef class Protocol(object):
 
     cpdef bytes serialize_value(self, Value value)
 
-    cpdef Value deserialize_value(self, int typ, bytes s)
+    cpdef Value deserialize_value(self, int typ, s)
 
     cpdef bytes serialize_message(self, Message message)
 
-    cpdef Message deserialize_message(self, bytes s)
+    cpdef Message deserialize_message(self, s)
 
 
 cdef class _ValueWriter(ValueVisitor):
@@ -30,6 +30,7 @@ from libc.stdint cimport (
 from thriftrw.wire cimport ttype
 from thriftrw.wire.value cimport Value, ValueVisitor
 from thriftrw.wire.message cimport Message
+from thriftrw._buffer cimport acquire_write_buffer, release_write_buffer
 
 
 __all__ = ['Protocol']
@@ -73,6 +74,17 @@ cdef class ProtocolWriter(object):
     cdef void write_set_end(self) except *: pass
     cdef void write_list_begin(self, ListHeader header) except *: pass
     cdef void write_list_end(self) except *: pass
+
+    cdef bint write_values(self, int8_t typ, object values) except -1:
+        """Write the elements of a list or set of type ``typ``.
+
+        Protocols may implement this to encode runs of fixed-width primitives
+        in bulk.
+
+        :return: False if nothing was written and the caller should write the
+            elements one at a time instead.
+        """
+        return False
     cdef void write_message_begin(self, MessageHeader header) except *: pass
     cdef void write_message_end(self) except *: pass
 
@@ -121,6 +133,17 @@ cdef class ProtocolReader:
     cdef ListHeader read_list_begin(self) except *: pass
     cdef void read_list_end(self) except *: pass
 
+    cdef list read_values(self, int8_t typ, int32_t size):
+        """Read ``size`` consecutive list or set elements of type ``typ``.
+
+        Protocols may implement this to decode runs of fixed-width primitives
+        in bulk.
+
+        :return: List of values, or None if the caller should read the
+            elements one at a time instead.
+        """
+        return None
+
     # Messages
 
     cdef MessageHeader read_message_begin(self): pass
@@ -150,18 +173,26 @@ cdef class Protocol(object):
         :returns:
             Serialized value.
         """
-        cdef WriteBuffer buff = WriteBuffer()
+        cdef WriteBuffer buff = acquire_write_buffer()
         cdef ProtocolWriter writer = self.writer(buff)
-        writer.write_value(value)
-        return buff.value
+        try:
+            writer.write_value(value)
+            return buff.value
+        finally:
+            release_write_buffer(buff)
 
-    cpdef Value deserialize_value(self, int typ, bytes s):
+    cpdef Value deserialize_value(self, int typ, s):
         """Parse a ``Value`` of the given type.
 
+        .. versionchanged:: 1.10
+
+            Accepts any object supporting the buffer protocol.
+
         :param typ:
             Type code of the value to parse.
         :param s:
-            Bytes to decode.
+            Bytes to decode. This may be ``bytes`` or any other object
+            supporting the buffer protocol.
         :returns:
             Parsed :py:class:`~thriftrw.wire.Value`.
         :raises thriftrw.errors.ThriftProtocolError:
@@ -178,7 +209,7 @@ cdef class Protocol(object):
         :returns:
             Serialized message.
         """
-        cdef WriteBuffer buff = WriteBuffer()
+        cdef WriteBuffer buff = acquire_write_buffer()
         cdef ProtocolWriter writer = self.writer(buff)
         cdef MessageHeader header = MessageHeader(
             message.name,
@@ -186,17 +217,25 @@ cdef class Protocol(object):
             message.seqid,
         )
 
-        writer.write_message_begin(header)
-        writer.write_value(message.body)
-        writer.write_message_end()
+        try:
+            writer.write_message_begin(header)
+            writer.write_value(message.body)
+            writer.write_message_end()
 
-        return buff.value
+            return buff.value
+        finally:
+            release_write_buffer(buff)
 
-    cpdef Message deserialize_message(self, bytes s):
+    cpdef Message deserialize_message(self, s):
         """Deserialize a ``Message``.
 
+        .. versionchanged:: 1.10
+
+            Accepts any object supporting the buffer protocol.
+
         :param s:
-            Bytes to decode
+            Bytes to decode. This may be ``bytes`` or any other object
+            supporting the buffer protocol.
         :returns:
             Parsed :py:class:`~thriftrw.wire.Message` containing a
             :py:class:`~thriftrw.wire.Value` in its body.
@@ -103,6 +103,9 @@ Custom Types
 .. autoclass:: thriftrw.spec.FieldSpec
     :members:
 
+.. autoclass:: thriftrw.spec.LazyStruct
+    :members: to_struct
+
 .. autoclass:: thriftrw.spec.TypedefTypeSpec
     :members:
 
@@ -139,7 +142,7 @@ from .field import FieldSpec
 from .list import ListTypeSpec
 from .map import MapTypeSpec
 from .set import SetTypeSpec
-from .struct import StructTypeSpec
+from .struct import StructTypeSpec, LazyStruct
 from .exc import ExceptionTypeSpec
 from .union import UnionTypeSpec
 from .typedef import TypedefTypeSpec
@@ -188,6 +191,7 @@ __all__ = [
     'StructTypeSpec',
     'UnionTypeSpec',
     'FieldSpec',
+    'LazyStruct',
 
     'TypedefTypeSpec',
 
@@ -28,7 +28,11 @@ def fields_eq(fields):
         List of fields of the object to be compared.
     """
     def __eq__(self, other):
-        return isinstance(other, self.__class__) and all(
+        # Let the other operand decide for unrelated types. This keeps
+        # comparisons with LazyStruct symmetric.
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return all(
             getattr(self, name) == getattr(other, name) for name in fields
         )
     return __eq__
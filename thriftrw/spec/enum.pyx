@@ -39,7 +39,7 @@ __all__ = ['EnumTypeSpec']
 _MAX_MAGNITUDE = 1 << (32 - 1)
 _MIN_VALUE = -1 * _MAX_MAGNITUDE
 _MAX_VALUE = _MAX_MAGNITUDE - 1
-_TYPES = (int, long, numbers.Integral)
+_TYPES = (int, numbers.Integral)
 
 cdef class EnumTypeSpec(TypeSpec):
     """TypeSpec for enum types.
@@ -22,6 +22,7 @@ from __future__ import absolute_import, unicode_literals, print_function
 
 from . cimport check
 from .base cimport TypeSpec
+from .primitive cimport is_fixed_width
 from thriftrw.wire cimport ttype
 from thriftrw._cython cimport richcompare
 from thriftrw.wire.value cimport ListValue
@@ -63,9 +64,14 @@ cdef class ListTypeSpec(TypeSpec):
 
     cpdef object read_from(ListTypeSpec self, ProtocolReader reader):
         cdef ListHeader header = reader.read_list_begin()
-        cdef list output = []
-        for i in range(header.size):
-            output.append(self.vspec.read_from(reader))
+        cdef list output = None
+        if is_fixed_width(self.vspec):
+            output = reader.read_values(self.vspec.ttype_code, header.size)
+
+        if output is None:
+            output = []
+            for i in range(header.size):
+                output.append(self.vspec.read_from(reader))
 
         reader.read_list_end()
         return output
@@ -83,8 +89,12 @@ cdef class ListTypeSpec(TypeSpec):
                         object value) except *:
         cdef ListHeader header = ListHeader(self.vspec.ttype_code, len(value))
         writer.write_list_begin(header)
-        for v in value:
-            self.vspec.write_to(writer, v)
+        if not (
+            is_fixed_width(self.vspec) and
+            writer.write_values(self.vspec.ttype_code, value)
+        ):
+            for v in value:
+                self.vspec.write_to(writer, v)
         writer.write_list_end()
 
     cpdef object from_wire(ListTypeSpec self, Value wire_value):
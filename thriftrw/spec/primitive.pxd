@@ -25,6 +25,9 @@ from libc.stdint cimport int8_t
 from .base cimport TypeSpec
 
 
+cdef bint is_fixed_width(TypeSpec spec)
+
+
 cdef class PrimitiveTypeSpec(TypeSpec):
     cdef readonly str name
     cdef readonly int8_t code
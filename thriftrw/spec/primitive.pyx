@@ -116,18 +116,18 @@ cdef class _TextualTypeSpec(TypeSpec):
         return self
 
     cpdef Value to_wire(_TextualTypeSpec self, object value):
-        if type(value) is unicode:
+        if type(value) is str:
             value = value.encode('utf-8')
         return BinaryValue(value)
 
     cpdef void write_to(_TextualTypeSpec self, ProtocolWriter writer,
                         object value) except *:
-        if type(value) is unicode:
+        if type(value) is str:
             value = value.encode('utf-8')
         writer.write_binary(value, len(value))
 
     cpdef void validate(_TextualTypeSpec self, object instance) except *:
-        if not isinstance(instance, (bytes, unicode)):
+        if not isinstance(instance, (bytes, str)):
             raise TypeError(
                 'Cannot convert %r into a "%s".' % (instance, self.name)
             )
@@ -137,7 +137,7 @@ cdef class _TextTypeSpec(_TextualTypeSpec):
     """TypeSpec for the text type."""
 
     name = str('string')
-    surface = unicode
+    surface = str
 
     cpdef object read_from(_TextTypeSpec self, ProtocolReader reader):
         # TODO: Is this right?
@@ -173,7 +173,7 @@ cdef class _BinaryTypeSpec(_TextualTypeSpec):
         return reader.read_binary()
 
     cpdef object to_primitive(_BinaryTypeSpec self, object value):
-        if isinstance(value, unicode):
+        if isinstance(value, str):
             value = value.encode('utf-8')
         return value
 
@@ -182,7 +182,7 @@ cdef class _BinaryTypeSpec(_TextualTypeSpec):
         return wire_value.value
 
     cpdef object from_primitive(_BinaryTypeSpec self, object prim_value):
-        if isinstance(prim_value, unicode):
+        if isinstance(prim_value, str):
             prim_value = prim_value.encode('utf-8')
         return prim_value
 
@@ -244,13 +244,12 @@ def validate_signed_int(bits):
     return _validate_signed_int
 
 
-# Although the Integral and Number classes already cover int, long, (and
-# everything else in case Number), we list those out here explicitly because
-# old versions of PyPy or PyPy3 don't play well with isinstance checks
-# generated by Cython.
-_INTEGRAL = (int, long, numbers.Integral)
-_FLOATING = (int, long, float, decimal.Decimal, fractions.Fraction,
-             numbers.Number)
+# Although the Integral and Number classes already cover int (and everything
+# else in case Number), we list those out here explicitly because old
+# versions of PyPy3 don't play well with isinstance checks generated by
+# Cython.
+_INTEGRAL = (int, numbers.Integral)
+_FLOATING = (int, float, decimal.Decimal, fractions.Fraction, numbers.Number)
 
 BoolTypeSpec = _BoolTypeSpec()
 
@@ -336,7 +335,7 @@ cdef class _I64TypeSpec(PrimitiveTypeSpec):
         self.ttype_code = ttype.I64
         self.value_cls = I64Value
         self.surface = _INTEGRAL
-        self.cast = long
+        self.cast = int
         self.validate_extra = validate_signed_int(64)
 
     cpdef void write_to(_I64TypeSpec self, ProtocolWriter writer,
@@ -351,3 +350,19 @@ I64TypeSpec = _I64TypeSpec()
 BinaryTypeSpec = _BinaryTypeSpec()
 
 TextTypeSpec = _TextTypeSpec()
+
+
+cdef bint is_fixed_width(TypeSpec spec):
+    """Whether ``spec`` is one of the fixed-width primitive TypeSpecs.
+
+    Values of these types may be read in bulk with
+    ``ProtocolReader.read_values``.
+    """
+    return (
+        spec is BoolTypeSpec or
+        spec is ByteTypeSpec or
+        spec is DoubleTypeSpec or
+        spec is I16TypeSpec or
+        spec is I32TypeSpec or
+        spec is I64TypeSpec
+    )
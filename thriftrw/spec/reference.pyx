@@ -20,6 +20,7 @@
 
 from __future__ import absolute_import, unicode_literals, print_function
 
+from cpython.object cimport Py_EQ, Py_NE
 from thriftrw._cython cimport richcompare
 from thriftrw.wire.value cimport Value
 
@@ -53,6 +54,8 @@ cdef class TypeReference(TypeSpec):
         return str(self)
 
     def __richcmp__(TypeReference self, TypeReference other not None, int op):
+        if self is other and (op == Py_EQ or op == Py_NE):
+            return op == Py_EQ
         return richcompare(op, [
             (self.name, other.name),
             (self.lineno, other.lineno),
@@ -453,7 +453,7 @@ cdef class ServiceSpec(object):
             self._functions = {}
             for f in self.functions:
                 name = f.name
-                if isinstance(name, unicode):
+                if isinstance(name, str):
                     name = name.encode('utf-8')
                 self._functions[name] = f
 
@@ -466,7 +466,7 @@ cdef class ServiceSpec(object):
 
         .. versionadded:: 1.0
         """
-        if isinstance(name, unicode):
+        if isinstance(name, str):
             name = name.encode('utf-8')
         return self._functions.get(name, None)
 
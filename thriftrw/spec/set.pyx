@@ -21,6 +21,7 @@
 from __future__ import absolute_import, unicode_literals, print_function
 
 from .base cimport TypeSpec
+from .primitive cimport is_fixed_width
 from thriftrw.wire cimport ttype
 from thriftrw._cython cimport richcompare
 from thriftrw.wire.value cimport SetValue
@@ -55,9 +56,17 @@ cdef class SetTypeSpec(TypeSpec):
 
     cpdef object read_from(SetTypeSpec self, ProtocolReader reader):
         cdef SetHeader header = reader.read_set_begin()
-        cdef set output = set()
-        for _ in range(header.size):
-            output.add(self.vspec.read_from(reader))
+        cdef list values = None
+        if is_fixed_width(self.vspec):
+            values = reader.read_values(self.vspec.ttype_code, header.size)
+
+        cdef set output
+        if values is not None:
+            output = set(values)
+        else:
+            output = set()
+            for _ in range(header.size):
+                output.add(self.vspec.read_from(reader))
 
         reader.read_set_end()
 
@@ -82,8 +91,12 @@ cdef class SetTypeSpec(TypeSpec):
                         object value) except *:
         cdef SetHeader header = SetHeader(self.vspec.ttype_code, len(value))
         writer.write_set_begin(header)
-        for v in value:
-            self.vspec.write_to(writer, v)
+        if not (
+            is_fixed_width(self.vspec) and
+            writer.write_values(self.vspec.ttype_code, value)
+        ):
+            for v in value:
+                self.vspec.write_to(writer, v)
         writer.write_set_end()
 
     cpdef object from_wire(self, Value wire_value):
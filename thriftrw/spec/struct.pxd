@@ -20,6 +20,7 @@
 
 from __future__ import absolute_import, unicode_literals, print_function
 
+from thriftrw.protocol.core cimport Protocol
 from .base cimport TypeSpec
 
 
@@ -32,3 +33,14 @@ cdef class StructTypeSpec(TypeSpec):
     cdef public object surface
 
     cdef dict _index
+    cdef dict _positions
+
+    cdef object _build(self, list values)
+
+
+cdef class LazyStruct(object):
+    cdef StructTypeSpec spec
+    cdef Protocol protocol
+    cdef object data
+    cdef dict offsets
+    cdef dict values
@@ -22,11 +22,14 @@ from __future__ import absolute_import, unicode_literals, print_function
 
 import copy
 
+from cpython.object cimport Py_EQ, Py_NE
 from thriftrw.wire cimport ttype
 from thriftrw.wire.value cimport Value
 from thriftrw._cython cimport richcompare
 from thriftrw.wire.value cimport StructValue
+from thriftrw._buffer cimport ReadBuffer
 from thriftrw.protocol.core cimport (
+    Protocol,
     ProtocolWriter,
     FieldHeader,
     ProtocolReader,
@@ -39,7 +42,7 @@ from . cimport check
 from . import common
 from ..errors import ThriftCompilerError
 
-__all__ = ['StructTypeSpec', 'FieldSpec']
+__all__ = ['StructTypeSpec', 'FieldSpec', 'LazyStruct']
 
 
 cdef class StructTypeSpec(TypeSpec):
@@ -74,8 +77,7 @@ cdef class StructTypeSpec(TypeSpec):
         representation of field values.
 
         Only the following types are used in primitive representations:
-        ``bool``, ``bytes``, ``float``, ``str`` (``unicode`` in Python < 3),
-        ``int``, ``long``, ``dict``, ``list``.
+        ``bool``, ``bytes``, ``float``, ``str``, ``int``, ``dict``, ``list``.
 
         .. versionadded:: 0.4
 
@@ -130,6 +132,7 @@ cdef class StructTypeSpec(TypeSpec):
         self.surface = None
         self.base_cls = base_cls or object
         self._index = {}
+        self._positions = {}
 
     cpdef TypeSpec link(self, scope):
         if not self.linked:
@@ -137,8 +140,9 @@ cdef class StructTypeSpec(TypeSpec):
             self.fields = [field.link(scope) for field in self.fields]
             self.hashable = all([f.hashable for f in self.fields])
             self.surface = struct_cls(self, scope)
-            for field in self.fields:
+            for i, field in enumerate(self.fields):
                 self._index[field.id] = field
+                self._positions[field.id] = i
 
         return self
 
@@ -173,27 +177,75 @@ cdef class StructTypeSpec(TypeSpec):
     cpdef object read_from(StructTypeSpec self, ProtocolReader reader):
         reader.read_struct_begin()
 
-        cdef dict kwargs = {}
-        cdef object val
+        cdef Py_ssize_t num_fields = len(self.fields)
+        cdef list values = [None] * num_fields
+        cdef object pos
+        cdef Py_ssize_t i = 0
         cdef FieldSpec field
         cdef FieldHeader header = reader.read_field_begin()
 
         while header.type != -1:
-            # You'd be surprised how much faster the CallOneArg path is compared to
-            # the unoptimized version. Make sure this never reades .get(val, None).
-            field = self._index.get(header.id)
+            # Encoders (including ours) write fields in declaration order, so
+            # guess that this is the field after the previous one before
+            # falling back to looking it up by ID.
+            field = None
+            if i < num_fields:
+                field = <FieldSpec> self.fields[i]
+                if field.id != header.id:
+                    field = None
+
+            if field is None:
+                # You'd be surprised how much faster the CallOneArg path is
+                # compared to the unoptimized version. Make sure this never
+                # reades .get(val, None).
+                pos = self._positions.get(header.id)
+                if pos is not None:
+                    i = <Py_ssize_t> pos
+                    field = <FieldSpec> self.fields[i]
 
             # Unrecognized field--possibly different version of struct definition.
-            if field is None or field.spec.ttype_code != header.type:
+            if field is None:
                 reader.skip(header.type)
             else:
-                kwargs[field.name] = field.spec.read_from(reader)
+                if field.spec.ttype_code != header.type:
+                    reader.skip(header.type)
+                else:
+                    values[i] = field.spec.read_from(reader)
+                i += 1
 
             reader.read_field_end()
             header = reader.read_field_begin()
 
         reader.read_struct_end()
-        return self.surface(**kwargs)
+        return self._build(values)
+
+    cdef object _build(self, list values):
+        # Builds an instance of the surface from field values decoded off the
+        # wire, in the same order as self.fields.
+        #
+        # This bypasses the generated __init__. The decoding TypeSpecs
+        # only produce values of the right type, so re-validating them
+        # (recursively, for containers) in __init__ is wasted work. Defaults
+        # and required fields are handled the same way as in __init__.
+        cdef object struct = self.surface.__new__(self.surface)
+        cdef FieldSpec field
+        cdef object value
+        cdef Py_ssize_t i
+
+        for i in range(len(self.fields)):
+            field = <FieldSpec> self.fields[i]
+            value = values[i]
+            if value is None:
+                if field.default_value is not None:
+                    value = copy.deepcopy(field.default_value)
+                elif field.required:
+                    raise TypeError(
+                        'Field "%s" of "%s" is required. It cannot be None.'
+                        % (field.name, self.name)
+                    )
+            setattr(struct, field.name, value)
+
+        return struct
 
     cpdef Value to_wire(self, object struct):
         fields = []
@@ -307,6 +359,132 @@ cdef class StructTypeSpec(TypeSpec):
         ])
 
 
+cdef class LazyStruct(object):
+    """A read-only view of a serialized struct that decodes fields on access.
+
+    Constructing a ``LazyStruct`` only walks the field headers of the
+    serialized struct and records where each field starts. A field's value is
+    decoded the first time the attribute is accessed and cached afterwards.
+    Fields that are never accessed are never decoded.
+
+    The serialized data is referenced, not copied, so it must not be mutated
+    while the view is in use.
+
+    Use :py:meth:`to_struct` to get an instance of the generated class.
+    Equality comparisons do this implicitly.
+
+    Unions are not supported.
+
+    .. versionadded:: 1.10
+    """
+
+    def __cinit__(self, spec, Protocol protocol, data):
+        """
+        :param StructTypeSpec spec:
+            Type specification of the serialized struct.
+        :param Protocol protocol:
+            Protocol used to serialize the struct.
+        :param data:
+            ``bytes`` or any other object supporting the buffer protocol
+            containing the serialized struct.
+        :raises TypeError:
+            If ``spec`` is not a struct or exception, or if a required field
+            without a default value is missing from ``data``.
+        """
+        if not isinstance(spec, StructTypeSpec):
+            raise TypeError(
+                '"%s" is not a struct or exception. Only structs and '
+                'exceptions can be deserialized lazily.' % spec.name
+            )
+
+        self.spec = spec
+        self.protocol = protocol
+        self.data = data
+        self.offsets = {}
+        self.values = {}
+
+        cdef ReadBuffer buff = ReadBuffer(data)
+        cdef ProtocolReader reader = protocol.reader(buff)
+        cdef FieldSpec field
+        cdef FieldHeader header
+
+        reader.read_struct_begin()
+        header = reader.read_field_begin()
+        while header.type != -1:
+            field = self.spec._index.get(header.id)
+            if field is not None and field.spec.ttype_code == header.type:
+                self.offsets[field.name] = buff.offset
+            reader.skip(header.type)
+            reader.read_field_end()
+            header = reader.read_field_begin()
+        reader.read_struct_end()
+
+        for field in self.spec.fields:
+            if (
+                field.required and
+                field.default_value is None and
+                field.name not in self.offsets
+            ):
+                raise TypeError(
+                    'Field "%s" of "%s" is required. It cannot be None.'
+                    % (field.name, self.spec.name)
+                )
+
+    def __getattr__(self, name):
+        try:
+            return self.values[name]
+        except KeyError:
+            pass
+
+        cdef FieldSpec field = None
+        for f in self.spec.fields:
+            if (<FieldSpec> f).name == name:
+                field = <FieldSpec> f
+                break
+        if field is None:
+            raise AttributeError(
+                '%r object has no attribute %r' % (self.spec.name, name)
+            )
+
+        cdef ReadBuffer buff
+        cdef object value
+        offset = self.offsets.get(name)
+        if offset is not None:
+            buff = ReadBuffer(self.data)
+            buff.offset = offset
+            value = field.spec.read_from(self.protocol.reader(buff))
+        elif field.default_value is not None:
+            value = copy.deepcopy(field.default_value)
+        else:
+            # Missing required fields were rejected upfront.
+            value = None
+
+        self.values[name] = value
+        return value
+
+    def to_struct(self):
+        """Decode the full struct.
+
+        :returns:
+            An instance of the class generated for the struct.
+        """
+        cdef ReadBuffer buff = ReadBuffer(self.data)
+        return self.spec.read_from(self.protocol.reader(buff))
+
+    def __richcmp__(LazyStruct self, other, int op):
+        if isinstance(other, LazyStruct):
+            other = (<LazyStruct> other).to_struct()
+        struct = self.to_struct()
+        if op == Py_EQ:
+            return struct == other
+        elif op == Py_NE:
+            return struct != other
+        return NotImplemented
+
+    def __repr__(self):
+        return 'LazyStruct(%r)' % self.to_struct()
+
+
 def struct_init(cls_name, field_names, field_defaults, base_cls, fields):
     """Generate the ``__init__`` method for structs.
 
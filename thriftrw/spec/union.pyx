@@ -60,8 +60,7 @@ cdef class UnionTypeSpec(TypeSpec):
         representation of field values.
 
         Only the following types are used in primitive representations:
-        ``bool``, ``bytes``, ``float``, ``str`` (``unicode`` in Python < 3),
-        ``int``, ``long``, ``dict``, ``list``.
+        ``bool``, ``bytes``, ``float``, ``str``, ``int``, ``dict``, ``list``.
 
         .. versionadded:: 0.4
 
@@ -160,7 +160,7 @@ cdef class I32Value(Value):
 
     ttype_code = ttype.I32
 
-    def __cinit__(I32Value self, int value):
+    def __cinit__(I32Value self, int32_t value):
         self.value = value
 
     def __richcmp__(I32Value self, I32Value other not None, int op):
@@ -181,7 +181,7 @@ cdef class I64Value(Value):
 
     ttype_code = ttype.I64
 
-    def __cinit__(I64Value self, long value):
+    def __cinit__(I64Value self, int64_t value):
         self.value = value
 
     def __richcmp__(I64Value self, I64Value other not None, int op):
@@ -257,6 +257,11 @@ cdef class FieldValue(object):
         ])
 
 
+# Structs with at most this many fields are searched linearly by
+# StructValue.get instead of being indexed.
+cdef int _LINEAR_SCAN_MAX = 16
+
+
 cdef class StructValue(Value):
     """A struct value is a collection of fields of different types.
 
@@ -270,11 +275,6 @@ cdef class StructValue(Value):
     def __cinit__(StructValue self, list fields):
         self.fields = fields
 
-    def __init__(self, list fields):
-        self._index = {}
-        for field in fields:
-            self._index[(field.id, field.ttype)] = field
-
     cpdef object apply(StructValue self, ValueVisitor visitor):
         return visitor.visit_struct(self.fields)
 
@@ -288,11 +288,39 @@ cdef class StructValue(Value):
         :returns:
             Corresponding ``FieldValue`` or None.
         """
-        field_value = self._index.get((field_id, field_ttype))
-        if field_value is None:
+        cdef FieldValue field
+        cdef Py_ssize_t i
+        cdef long c_id, c_ttype
+
+        if (
+            len(self.fields) <= _LINEAR_SCAN_MAX and
+            isinstance(field_id, int) and
+            isinstance(field_ttype, int)
+        ):
+            try:
+                c_id = field_id
+                c_ttype = field_ttype
+            except OverflowError:
+                return None  # no field has an ID or type this large
+
+            # Small structs are scanned directly rather than indexed; this
+            # avoids allocating a dict and a tuple per field for every
+            # struct. The scan goes backwards so that the last occurrence of
+            # a field wins, as with the index.
+            for i in range(len(self.fields) - 1, -1, -1):
+                field = self.fields[i]
+                if field.id == c_id and field.ttype == c_ttype:
+                    return field
             return None
-        else:
-            return field_value
+
+        # Larger structs, and keys that aren't integers, are looked up in
+        # the index.
+
+        if self._index is None:
+            self._index = {}
+            for field in self.fields:
+                self._index[(field.id, field.ttype)] = field
+        return self._index.get((field_id, field_ttype))
 
     def __richcmp__(StructValue self, StructValue other not None, int op):
         return richcompare(op, [(self.fields, other.fields)])